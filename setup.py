@@ -10,6 +10,7 @@ setup(
     python_requires=">=3.12",
     packages=find_packages(where="src", include=["obsidian*"]) + ["memory"],
     package_dir={"": "src", "memory": "memory"},
+    package_data={"obsidian.dashboard": ["static/*.css"]},
     install_requires=[
         "httpx>=0.27.0",
         "pandas>=2.2.0",
@@ -32,6 +33,9 @@ setup(
             "respx>=0.21.0",
             "python-dotenv>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "docs": [
             "mkdocs>=1.5.0",
             "mkdocs-material>=9.5.0",
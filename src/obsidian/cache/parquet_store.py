@@ -16,6 +16,7 @@ execution.
 
 import asyncio
 import logging
+from collections.abc import Iterator
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -27,6 +28,15 @@ import pyarrow.parquet as pq
 logger = logging.getLogger(__name__)
 
 
+def _parse_file_date(date_str: str) -> date:
+    """Parse the date part of a cache filename, strictly YYYY-MM-DD.
+
+    Raises:
+        ValueError: If date_str is not a zero-padded YYYY-MM-DD date
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
 class ParquetStore:
     """Async Parquet cache for raw market data.
 
@@ -62,16 +72,17 @@ class ParquetStore:
         ticker: str,
         source: str,
         dt: date,
-        data: pd.DataFrame,
+        data: pd.DataFrame | pa.Table,
         overwrite: bool = False,
     ) -> Path:
-        """Write DataFrame to Parquet cache.
+        """Write DataFrame (or Arrow table) to Parquet cache.
 
         Args:
             ticker: Stock ticker symbol
             source: Data source identifier
             dt: Trading date
-            data: DataFrame to store
+            data: DataFrame or pyarrow Table to store. Tables are written
+                as-is, skipping the pandas conversion.
             overwrite: If False (default), raises error if file exists.
                       If True, overwrites existing file (use with caution).
 
@@ -82,7 +93,8 @@ class ParquetStore:
             FileExistsError: If file exists and overwrite=False
             ValueError: If data is empty
         """
-        if data.empty:
+        is_empty = data.num_rows == 0 if isinstance(data, pa.Table) else data.empty
+        if is_empty:
             raise ValueError("Cannot write empty DataFrame to cache")
 
         file_path = self._get_file_path(ticker, source, dt)
@@ -99,7 +111,10 @@ class ParquetStore:
 
         # Write to Parquet (async via to_thread)
         def _write() -> None:
-            table = pa.Table.from_pandas(data)
+            if isinstance(data, pa.Table):
+                table = data
+            else:
+                table = pa.Table.from_pandas(data)
             pq.write_table(
                 table,
                 file_path,
@@ -199,9 +214,12 @@ class ParquetStore:
         file_path = self._get_file_path(ticker, source, dt)
         return await asyncio.to_thread(file_path.exists)
 
-    async def list_dates(self, ticker: str, source: str) -> list[date]:
+    def list_dates_sync(self, ticker: str, source: str) -> list[date]:
         """List all available dates for a ticker/source combination.
 
+        Blocking variant of list_dates() for synchronous callers (e.g. the
+        dashboard); it only reads directory metadata.
+
         Args:
             ticker: Stock ticker symbol
             source: Data source identifier
@@ -215,22 +233,118 @@ class ParquetStore:
         if not raw_dir.exists():
             return []
 
-        def _list() -> list[date]:
-            dates = []
-            pattern = f"{source}_*.parquet"
-            for file_path in raw_dir.glob(pattern):
-                # Extract date from filename: source_YYYY-MM-DD.parquet
-                # Use rsplit to handle source names with underscores
-                try:
-                    date_str = file_path.stem.rsplit("_", 1)[1]  # Last part after _
-                    dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    dates.append(dt)
-                except (ValueError, IndexError):
-                    # Skip malformed filenames
-                    continue
-            return sorted(dates)
+        dates = []
+        pattern = f"{source}_*.parquet"
+        for file_path in raw_dir.glob(pattern):
+            # Extract date from filename: source_YYYY-MM-DD.parquet
+            # Use rsplit to handle source names with underscores
+            try:
+                date_str = file_path.stem.rsplit("_", 1)[1]  # Last part after _
+                dt = _parse_file_date(date_str)
+                dates.append(dt)
+            except (ValueError, IndexError):
+                # Skip malformed filenames
+                continue
+        return sorted(dates)
 
-        return await asyncio.to_thread(_list)
+    async def list_dates(self, ticker: str, source: str) -> list[date]:
+        """List all available dates for a ticker/source combination.
+
+        Args:
+            ticker: Stock ticker symbol
+            source: Data source identifier
+
+        Returns:
+            Sorted list of dates (ascending)
+        """
+        return await asyncio.to_thread(self.list_dates_sync, ticker, source)
+
+    def _iter_dates(self, ticker: str, source: str) -> Iterator[str]:
+        """Yield ISO date strings of well-formed {source}_{date} files.
+
+        Lazily scans the ticker's raw directory; malformed names are
+        skipped, matching list_dates().
+        """
+        raw_dir = self.base_path / ticker.upper() / "raw"
+        if not raw_dir.exists():
+            return
+        prefix = f"{source}_"
+        for file_path in raw_dir.glob(f"{source}_*.parquet"):
+            date_str = file_path.stem[len(prefix):]
+            # Another source sharing the prefix (e.g. "dark" vs "dark_pool")
+            if "_" in date_str:
+                continue
+            try:
+                _parse_file_date(date_str)
+            except ValueError:
+                continue
+            yield date_str
+
+    def count_dates_sync(self, ticker: str, source: str) -> int:
+        """Count available dates for a ticker/source without listing them.
+
+        Blocking variant of count_dates().
+
+        Args:
+            ticker: Stock ticker symbol
+            source: Data source identifier
+
+        Returns:
+            Number of cached dates
+        """
+        return sum(1 for _ in self._iter_dates(ticker, source))
+
+    async def count_dates(self, ticker: str, source: str) -> int:
+        """Count available dates for a ticker/source without listing them.
+
+        Args:
+            ticker: Stock ticker symbol
+            source: Data source identifier
+
+        Returns:
+            Number of cached dates
+        """
+        return await asyncio.to_thread(self.count_dates_sync, ticker, source)
+
+    def date_range_sync(
+        self, ticker: str, source: str
+    ) -> tuple[date | None, date | None]:
+        """Return the earliest and latest cached date in one pass.
+
+        ISO YYYY-MM-DD strings sort chronologically, so min/max run on the
+        filename strings and only the two extremes are parsed. Blocking
+        variant of date_range().
+
+        Args:
+            ticker: Stock ticker symbol
+            source: Data source identifier
+
+        Returns:
+            (earliest, latest), or (None, None) if nothing is cached
+        """
+        earliest = latest = None
+        for date_str in self._iter_dates(ticker, source):
+            if earliest is None or date_str < earliest:
+                earliest = date_str
+            if latest is None or date_str > latest:
+                latest = date_str
+        if earliest is None:
+            return (None, None)
+        return (date.fromisoformat(earliest), date.fromisoformat(latest))
+
+    async def date_range(
+        self, ticker: str, source: str
+    ) -> tuple[date | None, date | None]:
+        """Return the earliest and latest cached date in one pass.
+
+        Args:
+            ticker: Stock ticker symbol
+            source: Data source identifier
+
+        Returns:
+            (earliest, latest), or (None, None) if nothing is cached
+        """
+        return await asyncio.to_thread(self.date_range_sync, ticker, source)
 
     async def list_sources(self, ticker: str) -> list[str]:
         """List all data sources available for a ticker.
@@ -297,7 +411,7 @@ class ParquetStore:
                     parts = file_path.stem.rsplit("_", 1)
                     source = parts[0]
                     date_str = parts[1]
-                    dt = datetime.strptime(date_str, "%Y-%m-%d").date()
+                    dt = _parse_file_date(date_str)
                     sources.add(source)
                     dates.append(dt)
                 except (ValueError, IndexError):
@@ -21,20 +21,79 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import httpx
 
+try:  # Optional: orjson parses straight from bytes, several times faster
+    import orjson
+
+    def _json_loads(content: bytes) -> Any:
+        """Parse JSON with orjson, falling back to the stdlib parser.
+
+        orjson is strict RFC 8259 and rejects the NaN/Infinity tokens
+        that json.loads (the previous parser) accepts, so such bodies
+        are re-parsed with json.loads instead of failing.
+        """
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return json.loads(content)
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Retry configuration
 _RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
 _MAX_RETRIES = 3
 _BASE_BACKOFF = 1.0  # seconds
 
 
+@lru_cache(maxsize=1024)
+def upper_ticker(ticker: str) -> str:
+    """Return the uppercase form of a ticker symbol.
+
+    Bounded cache: the working universe is small, so each symbol is
+    normally upper-cased once, while arbitrary user input cannot grow
+    the cache without limit.
+    """
+    return ticker.upper()
+
+
+@lru_cache(maxsize=256)
+def iso_date(d: date) -> str:
+    """Return a date as YYYY-MM-DD.
+
+    Cached so every request for the same date (e.g. one lookback start
+    shared by all tickers in a run) reuses one identical string.
+    """
+    return d.isoformat()
+
+
+@lru_cache(maxsize=1)
+def _today_iso(minute: int) -> str:
+    """Today's date as YYYY-MM-DD, cached per wall-clock minute bucket."""
+    return datetime.now().date().isoformat()
+
+
+def today_iso() -> str:
+    """Return today's date as a YYYY-MM-DD string.
+
+    Recomputed at most once per minute, so tight loops over many tickers
+    share one string instead of formatting the date on every call.
+    """
+    return _today_iso(int(time.time() // 60))
+
+
 class RateLimiter:
     """Token bucket rate limiter for async operations.
 
@@ -75,6 +134,52 @@ class RateLimiter:
             self.updated_at = loop.time()
 
 
+class SingleFlight:
+    """Coalesces concurrent identical async calls into one in-flight task.
+
+    While a call for a key is running, later callers with the same key
+    await the existing task instead of starting a new one. The entry is
+    dropped as soon as the task finishes, so this only deduplicates
+    overlapping calls — it is not a cache.
+
+    Usage:
+        flight = SingleFlight()
+        status = await flight.do(("status",), lambda: client.get("/status"))
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[tuple[Any, Hashable], asyncio.Task[Any]] = {}
+
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """Run coro_factory() for key, or join the call already in flight.
+
+        Args:
+            key: Hashable identity of the call
+            coro_factory: Zero-arg callable returning the awaitable to run
+
+        Returns:
+            Result of the shared call (the same object for every joiner)
+        """
+        # Tasks are bound to their event loop; scope keys per loop so
+        # callers on separate loops (e.g. dashboard threads) never share.
+        flight_key = (asyncio.get_running_loop(), key)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        # Shield so one caller's cancellation doesn't cancel the others
+        return await asyncio.shield(task)
+
+
+def _params_key(params: dict[str, Any] | None) -> tuple[tuple[str, Hashable], ...]:
+    """Hashable, order-independent form of query params (lists → tuples)."""
+    return tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v)
+        for k, v in (params or {}).items()
+    ))
+
+
 class APIProviderError(Exception):
     """Base exception for API provider errors."""
 
@@ -114,6 +219,9 @@ class BaseAsyncClient:
         self.timeout = timeout
         self._rate_limiter = RateLimiter(rate=rate_limit)
         self._client: httpx.AsyncClient | None = None
+        # Per client: shared calls run on this client's own connection
+        # pool and auth headers, which live as long as every joiner.
+        self._single_flight = SingleFlight()
 
     async def __aenter__(self) -> "BaseAsyncClient":
         """Async context manager entry."""
@@ -213,9 +321,9 @@ class BaseAsyncClient:
                         response_body=error_body,
                     )
 
-                # Parse JSON response
+                # Parse JSON from the raw body (no str decode / charset sniffing)
                 try:
-                    return response.json()
+                    return _json_loads(response.content)
                 except Exception as e:
                     logger.error("Failed to parse JSON response: %s", e)
                     raise APIProviderError(
@@ -268,6 +376,21 @@ class BaseAsyncClient:
         """Convenience method for GET requests."""
         return await self._request("GET", endpoint, params=params)
 
+    async def get_coalesced(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """GET request shared with identical concurrent calls.
+
+        Meant for market-wide endpoints that many ticker workflows hit at
+        once through one client. Only calls on this client instance are
+        coalesced. Callers receive the same response object and must not
+        mutate it.
+        """
+        key = (endpoint, _params_key(params))
+        return await self._single_flight.do(key, lambda: self.get(endpoint, params=params))
+
     async def post(
         self,
         endpoint: str,
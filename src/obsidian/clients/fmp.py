@@ -21,7 +21,7 @@ Usage:
 from datetime import date
 from typing import Any
 
-from obsidian.clients.base import BaseAsyncClient
+from obsidian.clients.base import BaseAsyncClient, iso_date, upper_ticker
 
 
 class FMPClient(BaseAsyncClient):
@@ -69,7 +69,7 @@ class FMPClient(BaseAsyncClient):
         API Docs: https://site.financialmodelingprep.com/developer/docs#company-profile
         """
         endpoint = "/profile"
-        params = {"symbol": ticker.upper()}
+        params = {"symbol": upper_ticker(ticker)}
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else [result]
 
@@ -90,7 +90,7 @@ class FMPClient(BaseAsyncClient):
         API Docs: https://site.financialmodelingprep.com/developer/docs#stock-real-time-price
         """
         endpoint = "/quote"
-        params = {"symbol": ticker.upper()}
+        params = {"symbol": upper_ticker(ticker)}
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else [result]
 
@@ -117,7 +117,7 @@ class FMPClient(BaseAsyncClient):
         endpoint = "/news/stock-latest"
         params: dict[str, Any] = {"limit": limit, "page": 0}
         if ticker:
-            params["symbol"] = ticker.upper()
+            params["symbol"] = upper_ticker(ticker)
 
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
@@ -144,7 +144,7 @@ class FMPClient(BaseAsyncClient):
         API Docs: https://site.financialmodelingprep.com/developer/docs#insider-trading
         """
         endpoint = "/insider-trading"
-        params: dict[str, Any] = {"symbol": ticker.upper(), "limit": limit}
+        params: dict[str, Any] = {"symbol": upper_ticker(ticker), "limit": limit}
 
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
@@ -171,7 +171,7 @@ class FMPClient(BaseAsyncClient):
         API Docs: https://site.financialmodelingprep.com/developer/docs#analyst-estimates
         """
         endpoint = "/analyst-estimates"
-        params: dict[str, Any] = {"symbol": ticker.upper(), "limit": limit}
+        params: dict[str, Any] = {"symbol": upper_ticker(ticker), "limit": limit}
 
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
@@ -195,7 +195,7 @@ class FMPClient(BaseAsyncClient):
         API Docs: https://site.financialmodelingprep.com/developer/docs#price-target-consensus
         """
         endpoint = "/price-target-consensus"
-        params: dict[str, Any] = {"symbol": ticker.upper()}
+        params: dict[str, Any] = {"symbol": upper_ticker(ticker)}
 
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
@@ -218,7 +218,7 @@ class FMPClient(BaseAsyncClient):
             marketValue, updatedAt.
         """
         endpoint = "/etf/holdings"
-        params: dict[str, Any] = {"symbol": symbol.upper()}
+        params: dict[str, Any] = {"symbol": upper_ticker(symbol)}
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
 
@@ -244,9 +244,9 @@ class FMPClient(BaseAsyncClient):
         endpoint = "/earnings-calendar"
         params: dict[str, Any] = {}
         if date_from:
-            params["from"] = date_from.isoformat()
+            params["from"] = iso_date(date_from)
         if date_to:
-            params["to"] = date_to.isoformat()
+            params["to"] = iso_date(date_to)
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
 
@@ -289,7 +289,7 @@ class FMPClient(BaseAsyncClient):
         API Docs: https://site.financialmodelingprep.com/developer/docs#income-statement
         """
         endpoint = "/income-statement"
-        params: dict[str, Any] = {"symbol": ticker.upper(), "period": period, "limit": limit}
+        params: dict[str, Any] = {"symbol": upper_ticker(ticker), "period": period, "limit": limit}
 
         result = await self.get(endpoint, params=params)
         return result if isinstance(result, list) else []
@@ -17,10 +17,46 @@ Usage:
         snapshot = await client.get_snapshot("AAPL")
 """
 
-from datetime import date, datetime
+from datetime import date
 from typing import Any
 
-from obsidian.clients.base import BaseAsyncClient
+import pyarrow as pa
+
+from obsidian.clients.base import BaseAsyncClient, iso_date, today_iso, upper_ticker
+
+# Column layout for daily aggregates: t (ms epoch), OHLC, volume, VWAP, trades.
+BAR_SCHEMA = pa.schema([
+    ("t", pa.int64()),
+    ("o", pa.float64()),
+    ("h", pa.float64()),
+    ("l", pa.float64()),
+    ("c", pa.float64()),
+    ("v", pa.float64()),
+    ("vw", pa.float64()),
+    ("n", pa.int64()),
+])
+
+
+def bars_to_table(bars: list[dict[str, Any]]) -> pa.Table:
+    """Convert Polygon aggregate bars into a columnar Arrow table.
+
+    Each field is gathered into one typed array (missing fields become
+    nulls), so downstream code works on contiguous columns rather than
+    a list of per-bar dicts.
+
+    Args:
+        bars: The 'results' list from an aggregates response
+
+    Returns:
+        Table with BAR_SCHEMA columns, one row per bar
+    """
+    return pa.Table.from_arrays(
+        [
+            pa.array([bar.get(field.name) for bar in bars], type=field.type)
+            for field in BAR_SCHEMA
+        ],
+        schema=BAR_SCHEMA,
+    )
 
 
 class PolygonClient(BaseAsyncClient):
@@ -85,17 +121,49 @@ class PolygonClient(BaseAsyncClient):
         API Docs: https://polygon.io/docs/stocks/get_v2_aggs_ticker__stocksticker__range__multiplier___timespan___from___to
         """
         if isinstance(date_from, date):
-            date_from = date_from.isoformat()
+            date_from = iso_date(date_from)
         if date_to is None:
-            date_to = datetime.now().date().isoformat()
+            date_to = today_iso()
         elif isinstance(date_to, date):
-            date_to = date_to.isoformat()
+            date_to = iso_date(date_to)
 
-        endpoint = f"/v2/aggs/ticker/{ticker.upper()}/range/{multiplier}/day/{date_from}/{date_to}"
+        endpoint = f"/v2/aggs/ticker/{upper_ticker(ticker)}/range/{multiplier}/day/{date_from}/{date_to}"
         params = {"sort": sort, "limit": limit, "adjusted": "true"}
 
         return await self.get(endpoint, params=params)
 
+    async def get_daily_bars_arrow(
+        self,
+        ticker: str,
+        date_from: str | date,
+        date_to: str | date | None = None,
+        multiplier: int = 1,
+        sort: str = "asc",
+        limit: int = 5000,
+    ) -> pa.Table:
+        """Get daily OHLCV bars as a columnar Arrow table.
+
+        Same request as get_daily_bars(), landed straight into BAR_SCHEMA
+        columns so it can be written to the Parquet cache without a
+        row-wise DataFrame in between.
+
+        Args:
+            ticker: Stock symbol
+            date_from: Start date (YYYY-MM-DD or date object)
+            date_to: End date (defaults to today)
+            multiplier: Multiplier for timespan (1 = 1 day)
+            sort: Sort order ('asc' or 'desc')
+            limit: Max results (default: 5000)
+
+        Returns:
+            Table with t/o/h/l/c/v/vw/n columns (empty if no bars)
+        """
+        resp = await self.get_daily_bars(
+            ticker, date_from, date_to,
+            multiplier=multiplier, sort=sort, limit=limit,
+        )
+        return bars_to_table(resp.get("results") or [])
+
     async def get_snapshot(self, ticker: str) -> dict[str, Any]:
         """Get current snapshot for a ticker.
 
@@ -111,7 +179,7 @@ class PolygonClient(BaseAsyncClient):
 
         API Docs: https://polygon.io/docs/stocks/get_v2_snapshot_locale_us_markets_stocks_tickers__stocksticker
         """
-        endpoint = f"/v2/snapshot/locale/us/markets/stocks/tickers/{ticker.upper()}"
+        endpoint = f"/v2/snapshot/locale/us/markets/stocks/tickers/{upper_ticker(ticker)}"
         return await self.get(endpoint)
 
     async def get_indices_snapshot(
@@ -142,7 +210,7 @@ class PolygonClient(BaseAsyncClient):
         endpoint = "/v3/snapshot/indices"
         params = {"ticker.any_of": ticker_list}
 
-        return await self.get(endpoint, params=params)
+        return await self.get_coalesced(endpoint, params=params)
 
     async def get_open_close(
         self,
@@ -164,9 +232,9 @@ class PolygonClient(BaseAsyncClient):
         API Docs: https://polygon.io/docs/stocks/get_v1_open-close__stocksticker___date
         """
         if isinstance(target_date, date):
-            target_date = target_date.isoformat()
+            target_date = iso_date(target_date)
 
-        endpoint = f"/v1/open-close/{ticker.upper()}/{target_date}"
+        endpoint = f"/v1/open-close/{upper_ticker(ticker)}/{target_date}"
         return await self.get(endpoint)
 
     async def get_last_trade(self, ticker: str) -> dict[str, Any]:
@@ -184,7 +252,7 @@ class PolygonClient(BaseAsyncClient):
 
         API Docs: https://polygon.io/docs/stocks/get_v2_last_trade__stocksticker
         """
-        endpoint = f"/v2/last/trade/{ticker.upper()}"
+        endpoint = f"/v2/last/trade/{upper_ticker(ticker)}"
         return await self.get(endpoint)
 
     async def get_market_status(self) -> dict[str, Any]:
@@ -199,4 +267,4 @@ class PolygonClient(BaseAsyncClient):
         API Docs: https://polygon.io/docs/stocks/get_v1_marketstatus_now
         """
         endpoint = "/v1/marketstatus/now"
-        return await self.get(endpoint)
+        return await self.get_coalesced(endpoint)
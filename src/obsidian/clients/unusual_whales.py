@@ -17,10 +17,15 @@ Usage:
         dark_pool = await client.get_dark_pool_recent("AAPL", limit=100)
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import date, datetime
 from typing import Any
 
-from obsidian.clients.base import BaseAsyncClient
+from obsidian.clients.base import BaseAsyncClient, iso_date, upper_ticker
+
+# Per-ticker completion hook for the *_many batch methods
+TickerCallback = Callable[[str, dict[str, Any] | Exception], None]
 
 
 class UnusualWhalesClient(BaseAsyncClient):
@@ -38,6 +43,55 @@ class UnusualWhalesClient(BaseAsyncClient):
             rate_limit=rate_limit,
         )
 
+    @staticmethod
+    def _date_params(date_from: date | None, date_to: date | None) -> dict[str, Any]:
+        """Build the date_from/date_to query params, omitting unset bounds."""
+        params: dict[str, Any] = {}
+        if date_from:
+            params["date_from"] = iso_date(date_from)
+        if date_to:
+            params["date_to"] = iso_date(date_to)
+        return params
+
+    async def _gather_per_ticker(
+        self,
+        method: Callable[..., Awaitable[dict[str, Any]]],
+        tickers: list[str],
+        date_from: date | None,
+        date_to: date | None,
+        semaphore: asyncio.Semaphore | None,
+        on_result: TickerCallback | None,
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """Run a per-ticker endpoint method concurrently for many tickers.
+
+        Cancelled requests (CancelledError and other non-Exception
+        results of gather) are left out of the result and never passed
+        to on_result, so callers can tell them apart from responses.
+        """
+        symbols = list(dict.fromkeys(upper_ticker(t) for t in tickers))
+
+        async def _one(ticker: str) -> dict[str, Any] | Exception:
+            try:
+                if semaphore is None:
+                    resp = await method(ticker, date_from=date_from, date_to=date_to)
+                else:
+                    async with semaphore:
+                        resp = await method(ticker, date_from=date_from, date_to=date_to)
+            except Exception as e:
+                resp = e
+            if on_result is not None:
+                on_result(ticker, resp)
+            return resp
+
+        responses = await asyncio.gather(
+            *(_one(t) for t in symbols), return_exceptions=True,
+        )
+        return {
+            ticker: resp
+            for ticker, resp in zip(symbols, responses)
+            if not isinstance(resp, BaseException) or isinstance(resp, Exception)
+        }
+
     async def get_dark_pool_recent(
         self,
         ticker: str | None = None,
@@ -64,11 +118,11 @@ class UnusualWhalesClient(BaseAsyncClient):
         """
         params: dict[str, Any] = {"limit": limit}
         if ticker:
-            params["ticker"] = ticker.upper()
+            params["ticker"] = upper_ticker(ticker)
         if date_from:
-            params["date_from"] = date_from.isoformat()
+            params["date_from"] = iso_date(date_from)
         if date_to:
-            params["date_to"] = date_to.isoformat()
+            params["date_to"] = iso_date(date_to)
 
         return await self.get("/darkpool/recent", params=params)
 
@@ -101,13 +155,41 @@ class UnusualWhalesClient(BaseAsyncClient):
 
         API Docs: https://docs.unusualwhales.com/api/stock/greek-exposure
         """
-        params: dict[str, Any] = {}
-        if date_from:
-            params["date_from"] = date_from.isoformat()
-        if date_to:
-            params["date_to"] = date_to.isoformat()
+        params = self._date_params(date_from, date_to)
 
-        return await self.get(f"/stock/{ticker.upper()}/greek-exposure", params=params)
+        return await self.get(f"/stock/{upper_ticker(ticker)}/greek-exposure", params=params)
+
+    async def get_greek_exposure_many(
+        self,
+        tickers: list[str],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        on_result: TickerCallback | None = None,
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """Get Greek exposure for several tickers in one batch.
+
+        UW exposes greek-exposure per ticker only, so the requests are
+        issued concurrently over this client's pooled connection and
+        shared rate limiter instead of one client per ticker.
+
+        Args:
+            tickers: Stock symbols
+            date_from: Start date
+            date_to: End date
+            semaphore: Optional semaphore bounding concurrent requests
+            on_result: Optional callback called with (ticker, response or
+                exception) as soon as each ticker finishes
+
+        Returns:
+            Dict mapping uppercase ticker → response (as returned by
+            get_greek_exposure), or the exception raised for that ticker.
+            One failing ticker never aborts the batch; tickers whose
+            request was cancelled are omitted.
+        """
+        return await self._gather_per_ticker(
+            self.get_greek_exposure, tickers, date_from, date_to, semaphore, on_result,
+        )
 
     async def get_iv_rank(
         self,
@@ -131,13 +213,38 @@ class UnusualWhalesClient(BaseAsyncClient):
 
         API Docs: https://docs.unusualwhales.com/api/stock/iv-rank
         """
-        params: dict[str, Any] = {}
-        if date_from:
-            params["date_from"] = date_from.isoformat()
-        if date_to:
-            params["date_to"] = date_to.isoformat()
+        params = self._date_params(date_from, date_to)
+
+        return await self.get(f"/stock/{upper_ticker(ticker)}/iv-rank", params=params)
+
+    async def get_iv_rank_many(
+        self,
+        tickers: list[str],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        on_result: TickerCallback | None = None,
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """Get IV Rank for several tickers in one batch.
 
-        return await self.get(f"/stock/{ticker.upper()}/iv-rank", params=params)
+        Same batching semantics as get_greek_exposure_many().
+
+        Args:
+            tickers: Stock symbols
+            date_from: Start date
+            date_to: End date
+            semaphore: Optional semaphore bounding concurrent requests
+            on_result: Optional callback called with (ticker, response or
+                exception) as soon as each ticker finishes
+
+        Returns:
+            Dict mapping uppercase ticker → response (as returned by
+            get_iv_rank), or the exception raised for that ticker.
+            Tickers whose request was cancelled are omitted.
+        """
+        return await self._gather_per_ticker(
+            self.get_iv_rank, tickers, date_from, date_to, semaphore, on_result,
+        )
 
     async def get_option_contracts(
         self,
@@ -161,13 +268,9 @@ class UnusualWhalesClient(BaseAsyncClient):
 
         API Docs: https://docs.unusualwhales.com/api/stock/option-contracts
         """
-        params: dict[str, Any] = {}
-        if date_from:
-            params["date_from"] = date_from.isoformat()
-        if date_to:
-            params["date_to"] = date_to.isoformat()
+        params = self._date_params(date_from, date_to)
 
-        return await self.get(f"/stock/{ticker.upper()}/option-contracts", params=params)
+        return await self.get(f"/stock/{upper_ticker(ticker)}/option-contracts", params=params)
 
     async def get_market_tide(
         self,
@@ -189,10 +292,6 @@ class UnusualWhalesClient(BaseAsyncClient):
 
         API Docs: https://docs.unusualwhales.com/api/market/market-tide
         """
-        params: dict[str, Any] = {}
-        if date_from:
-            params["date_from"] = date_from.isoformat()
-        if date_to:
-            params["date_to"] = date_to.isoformat()
+        params = self._date_params(date_from, date_to)
 
-        return await self.get("/market/market-tide", params=params)
+        return await self.get_coalesced("/market/market-tide", params=params)
@@ -4,8 +4,10 @@ Run with:
     streamlit run src/obsidian/dashboard/app.py
 """
 
-import streamlit as st
 from datetime import date, timedelta
+from pathlib import Path
+
+import streamlit as st
 
 from obsidian.dashboard.data import (
     get_available_tickers,
@@ -16,6 +18,19 @@ from obsidian.dashboard.data import (
     get_cached_date_range,
 )
 
+_STYLE_PATH = Path(__file__).parent / "static" / "style.css"
+
+
+@st.cache_resource
+def _style_block() -> str:
+    """Return the dashboard stylesheet as a ready-to-emit <style> element.
+
+    Built once for the server lifetime; each run only re-sends the same
+    string, so the element is unchanged between reruns.
+    """
+    return f"<style>{_STYLE_PATH.read_text(encoding='utf-8')}</style>"
+
+
 # Page configuration
 st.set_page_config(
     page_title="OBSIDIAN MM",
@@ -24,61 +39,10 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .brand-bar {
-        display: flex;
-        align-items: baseline;
-        gap: 0.6rem;
-        margin-bottom: 0.15rem;
-    }
-    .brand-name {
-        font-size: 1.6rem;
-        font-weight: 800;
-        letter-spacing: 0.18em;
-        color: inherit;
-    }
-    .brand-tag {
-        font-size: 0.85rem;
-        font-weight: 500;
-        color: #8b949e;
-        letter-spacing: 0.06em;
-    }
-    .brand-rule {
-        height: 2px;
-        background: linear-gradient(90deg, #1f6feb 0%, transparent 60%);
-        border: none;
-        margin: 0 0 1.4rem 0;
-    }
-    .metric-card {
-        background-color: rgba(128, 128, 128, 0.1);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    .regime-badge {
-        display: inline-block;
-        padding: 0.5rem 1.5rem;
-        border-radius: 1rem;
-        font-weight: 700;
-        font-size: 1.2rem;
-        letter-spacing: 0.05em;
-    }
-    .regime-gamma-pos { background-color: #4CAF50; color: white; }
-    .regime-gamma-neg { background-color: #f44336; color: white; }
-    .regime-dark-dom { background-color: #9C27B0; color: white; }
-    .regime-absorption { background-color: #2196F3; color: white; }
-    .regime-distribution { background-color: #FF9800; color: white; }
-    .regime-neutral { background-color: #9E9E9E; color: white; }
-    .regime-undetermined { background-color: #607D8B; color: white; }
-    @media (max-width: 768px) {
-        .brand-bar { flex-direction: column; gap: 0.2rem; }
-        .brand-name { font-size: 1.2rem; }
-        .brand-tag { font-size: 0.75rem; }
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS (incl. regime badge classes) — built once per server process.
+# The element itself must be emitted on every run: Streamlit drops elements
+# a rerun does not re-send, which would unstyle the page.
+st.markdown(_style_block(), unsafe_allow_html=True)
 
 # Header
 st.markdown(
@@ -206,7 +170,8 @@ st.session_state['ticker'] = ticker
 st.session_state['start_date'] = start_date
 st.session_state['end_date'] = end_date
 
-# Route to selected page
+# Route to selected page. Page modules are imported on demand, so a
+# session only loads the views it actually opens.
 if page == "Overview":
     from obsidian.dashboard.views import overview
     overview.render(end_date)
@@ -5,46 +5,142 @@ Uses a thread-based async bridge to avoid event loop conflicts with Streamlit.
 """
 
 import asyncio
+import atexit
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from datetime import date, timedelta
-
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import date
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+import numpy as np
 import streamlit as st
 
 logger = logging.getLogger(__name__)
 
+from obsidian.pipeline.fetcher import Fetcher
 from obsidian.pipeline.orchestrator import Orchestrator
-from obsidian.pipeline.processor import DiagnosticResult
+from obsidian.pipeline.processor import DiagnosticResult, Processor
 from obsidian.engine.scoring import FEATURE_WEIGHTS
-from obsidian.universe.manager import CORE_TICKERS
+from obsidian.universe.manager import CORE_TICKERS, FocusEntry
+
+T = TypeVar("T")
+
+# One long-lived event loop on a daemon thread serves every dashboard call,
+# so loop setup/teardown is paid once per process and loop-bound state
+# (semaphores, in-flight coalesced requests) stays valid across reruns.
+_loop = asyncio.new_event_loop()
+_loop_thread = threading.Thread(
+    target=_loop.run_forever, name="obsidian-dashboard-loop", daemon=True
+)
+_loop_thread.start()
+
 
+def _shutdown_loop() -> None:
+    """Stop the background loop at interpreter exit."""
+    _loop.call_soon_threadsafe(_loop.stop)
+    _loop_thread.join(timeout=5)
+    if not _loop.is_running():
+        _loop.close()
 
-_executor = ThreadPoolExecutor(max_workers=1)
+
+atexit.register(_shutdown_loop)
 
 
 def _run_async(coro):
     """Run an async coroutine from synchronous Streamlit context.
 
     Streamlit already runs an event loop, so ``asyncio.run()`` would raise
-    "cannot be called from a running event loop".  Instead we spin up a
-    *new* event loop in a dedicated thread.
+    "cannot be called from a running event loop".  Instead the coroutine
+    is submitted to the persistent background loop and we block on its
+    result.
     """
-    def _target():
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
 
-    future = _executor.submit(_target)
-    return future.result()
+@st.cache_resource
+def _shared_pipeline() -> tuple[Fetcher, Processor]:
+    """Build the stateless Fetcher and Processor once per server process."""
+    return Fetcher(cache_dir="data/"), Processor(cache_dir="data/")
 
 
 def _get_orchestrator() -> Orchestrator:
-    """Get or create a shared Orchestrator instance via session state."""
-    if "orchestrator" not in st.session_state:
-        st.session_state["orchestrator"] = Orchestrator()
-    return st.session_state["orchestrator"]
+    """Get or create this session's Orchestrator.
+
+    Each session owns its Orchestrator and therefore its UniverseManager,
+    so one user's Full Pipeline run never rewrites another user's FOCUS
+    list. Only the stateless Fetcher and Processor are shared, which
+    spares new sessions their construction cost.
+    """
+    orch = st.session_state.get("orchestrator")
+    if orch is None:
+        fetcher, processor = _shared_pipeline()
+        orch = st.session_state["orchestrator"] = Orchestrator(
+            fetcher=fetcher, processor=processor,
+        )
+    return orch
+
+
+# Diagnostics kept per session; least recently used entries are evicted
+_MAX_DIAGS = 512
+
+
+def _diag_store() -> OrderedDict[tuple[str, date], DiagnosticResult]:
+    """Return this session's diagnostics, keyed by (ticker, date), in LRU order."""
+    store = st.session_state.get("diags")
+    if store is None:
+        store = st.session_state["diags"] = OrderedDict()
+    return store
+
+
+def _store_diagnostic(ticker: str, target_date: date, result: DiagnosticResult) -> None:
+    """Store a diagnostic in session state for subsequent page renders.
+
+    The store is capped at _MAX_DIAGS entries so long sessions browsing
+    many tickers and dates do not grow without bound.
+    """
+    store = _diag_store()
+    key = (ticker, target_date)
+    store[key] = result
+    store.move_to_end(key)
+    while len(store) > _MAX_DIAGS:
+        store.popitem(last=False)
+    st.session_state["_diag_revision"] = st.session_state.get("_diag_revision", 0) + 1
+
+
+def _session_memo(slot: str, revision: tuple, key: tuple, build: Callable[[], T]) -> T:
+    """Memoize derived views in st.session_state[slot] until revision changes."""
+    memo: dict[str, Any] | None = st.session_state.get(slot)
+    if memo is None or memo["revision"] != revision:
+        memo = {"revision": revision, "views": {}}
+        st.session_state[slot] = memo
+    views = memo["views"]
+    if key not in views:
+        views[key] = build()
+    return views[key]
+
+
+def _focus_memo(key: tuple, build: Callable[[], T]) -> T:
+    """Memoize a derived FOCUS view for this session.
+
+    Entries stay valid until the FOCUS universe or the stored
+    diagnostics change, so widget reruns reuse the previous result
+    instead of rescanning and re-sorting.
+    """
+    orch = _get_orchestrator()
+    revision = (
+        id(orch.universe),
+        orch.universe.focus_revision,
+        st.session_state.get("_diag_revision", 0),
+    )
+    return _session_memo("_focus_memo", revision, key, build)
+
+
+def _history_memo(key: tuple, build: Callable[[], T]) -> T:
+    """Memoize a view of stored diagnostics until a new one is stored."""
+    revision = (st.session_state.get("_diag_revision", 0),)
+    return _session_memo("_history_memo", revision, key, build)
 
 
 def get_available_tickers() -> list[str]:
@@ -71,9 +167,7 @@ def fetch_and_diagnose(ticker: str, target_date: date) -> DiagnosticResult | Non
         result = _run_async(
             orch.run_single_ticker(ticker, target_date, fetch_data=True)
         )
-        # Store in session state for subsequent page renders
-        _cache_key = f"diag_{ticker}_{target_date.isoformat()}"
-        st.session_state[_cache_key] = result
+        _store_diagnostic(ticker, target_date, result)
         return result
     except Exception as e:
         st.error(f"Pipeline error: {e}")
@@ -91,8 +185,7 @@ def diagnose_from_cache(ticker: str, target_date: date) -> DiagnosticResult | No
         result = _run_async(
             orch.run_single_ticker(ticker, target_date, fetch_data=False)
         )
-        _cache_key = f"diag_{ticker}_{target_date.isoformat()}"
-        st.session_state[_cache_key] = result
+        _store_diagnostic(ticker, target_date, result)
         return result
     except Exception as e:
         st.error(f"Processing error: {e}")
@@ -119,8 +212,7 @@ def run_full_pipeline(target_date: date, fetch_data: bool = True) -> dict[str, D
         )
         # Cache each individual result for page navigation
         for ticker, diag in results.items():
-            _cache_key = f"diag_{ticker}_{target_date.isoformat()}"
-            st.session_state[_cache_key] = diag
+            _store_diagnostic(ticker, target_date, diag)
         return results
     except Exception as e:
         st.error(f"Full pipeline error: {e}")
@@ -130,8 +222,47 @@ def run_full_pipeline(target_date: date, fetch_data: bool = True) -> dict[str, D
 
 def get_cached_diagnostic(ticker: str, target_date: date) -> DiagnosticResult | None:
     """Retrieve a previously-computed diagnostic from session state."""
-    _cache_key = f"diag_{ticker}_{target_date.isoformat()}"
-    return st.session_state.get(_cache_key)
+    store = _diag_store()
+    key = (ticker, target_date)
+    result = store.get(key)
+    if result is not None:
+        store.move_to_end(key)
+    return result
+
+
+def get_cached_diagnostics(
+    tickers: Iterable[str],
+    target_date: date,
+) -> dict[str, DiagnosticResult | None]:
+    """Retrieve previously-computed diagnostics for several tickers at once.
+
+    Equivalent to calling get_cached_diagnostic() per ticker, with the
+    store lookups bound once.
+
+    Returns:
+        Dictionary mapping ticker → DiagnosticResult (None if not stored),
+        in input order
+    """
+    store = _diag_store()
+    _get, _touch = store.get, store.move_to_end
+    results: dict[str, DiagnosticResult | None] = {}
+    for ticker in tickers:
+        key = (ticker, target_date)
+        result = results[ticker] = _get(key)
+        if result is not None:
+            _touch(key)
+    return results
+
+
+def get_dates_with_diagnostics() -> frozenset[date]:
+    """Return every date with at least one stored diagnostic.
+
+    Memoized until a new diagnostic is stored.
+    """
+    return _history_memo(
+        ("dates",),
+        lambda: frozenset(day for _, day in _diag_store()),
+    )
 
 
 def get_historical_diagnostics(
@@ -142,25 +273,164 @@ def get_historical_diagnostics(
     """Return all cached diagnostics for a ticker in a date range.
 
     Only returns results that have already been computed and stored in
-    session state. Does NOT fetch or process new data.
+    session state. Does NOT fetch or process new data. The result is
+    shared across reruns until a new diagnostic is stored; do not mutate it.
+
+    Returns:
+        Dictionary mapping date → DiagnosticResult, dates ascending
     """
+    return _history_memo(
+        ("history", ticker, start_date, end_date),
+        lambda: _build_history(ticker, start_date, end_date),
+    )
+
+
+def _build_history(ticker: str, start_date: date, end_date: date) -> dict[date, DiagnosticResult]:
+    """Build the get_historical_diagnostics() mapping (uncached)."""
+    _get = _diag_store().get
     results = {}
-    current = start_date
-    while current <= end_date:
-        diag = get_cached_diagnostic(ticker, current)
+    # Calendar days, not business days: a diagnostic can be stored for any
+    # date the user picks in the sidebar.
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        day = date.fromordinal(ordinal)
+        diag = _get((ticker, day))
         if diag is not None:
-            results[current] = diag
-        current += timedelta(days=1)
+            results[day] = diag
     return results
 
 
-def get_feature_weights() -> dict[str, float]:
-    """Return the fixed scoring weights from the spec."""
-    return FEATURE_WEIGHTS.copy()
+def get_z_score_history(
+    ticker: str,
+    start_date: date,
+    end_date: date,
+    features: Sequence[str],
+) -> tuple[tuple[date, ...], np.ndarray]:
+    """Return a ticker's cached z-scores in a date range as one matrix.
+
+    Built in a single pass over the stored diagnostics and shared across
+    reruns until a new diagnostic is stored; the matrix is read-only.
+
+    Args:
+        ticker: Ticker symbol
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        features: Feature names, one matrix row each
+
+    Returns:
+        (dates ascending, features × dates float64 matrix with NaN where
+        a diagnostic lacks the feature)
+    """
+    return _history_memo(
+        ("z_history", ticker, start_date, end_date, tuple(features)),
+        lambda: _build_z_history(ticker, start_date, end_date, features),
+    )
+
+
+def _build_z_history(
+    ticker: str,
+    start_date: date,
+    end_date: date,
+    features: Sequence[str],
+) -> tuple[tuple[date, ...], np.ndarray]:
+    """Build the get_z_score_history() matrix (uncached)."""
+    hist = get_historical_diagnostics(ticker, start_date, end_date)
+    nan = float("nan")
+    # One row per date, transposed to features × dates
+    z_matrix = np.array(
+        [[z.get(feat, nan) for feat in features] for z in (d.z_scores for d in hist.values())],
+        dtype=np.float64,
+    ).reshape(len(hist), len(features)).T
+    z_matrix.setflags(write=False)
+    return tuple(hist), z_matrix
+
+
+def get_historical_diagnostics_many(
+    tickers: Sequence[str],
+    start_date: date,
+    end_date: date,
+) -> dict[str, dict[date, DiagnosticResult]]:
+    """Return cached diagnostics in a date range for several tickers at once.
+
+    Scans the session store once instead of probing every (ticker, day)
+    pair. Tickers without diagnostics in range are omitted.
+
+    Args:
+        tickers: Ticker symbols to collect
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+
+    Returns:
+        Dictionary mapping ticker → date → DiagnosticResult, dates ascending
+    """
+    return _history_memo(
+        ("history_many", tuple(tickers), start_date, end_date),
+        lambda: _build_history_many(tickers, start_date, end_date),
+    )
+
+
+def _build_history_many(
+    tickers: Sequence[str],
+    start_date: date,
+    end_date: date,
+) -> dict[str, dict[date, DiagnosticResult]]:
+    """Build the get_historical_diagnostics_many() mapping (uncached)."""
+    wanted = set(tickers)
+    results: dict[str, dict[date, DiagnosticResult]] = {}
+    for (ticker, day), diag in _diag_store().items():
+        if ticker in wanted and start_date <= day <= end_date:
+            results.setdefault(ticker, {})[day] = diag
+    return {t: dict(sorted(results[t].items())) for t in tickers if t in results}
+
+
+def get_top_driver(ticker: str, target_date: date) -> str:
+    """Return the label of the stored diagnostic's highest-|Z| feature.
+
+    Memoized per (ticker, date) until a new diagnostic is stored, so
+    widget reruns do not rescan the z-scores.
+
+    Returns:
+        Feature label, or "—" when there is no diagnostic or no valid z-score
+    """
+    return _history_memo(
+        ("top_driver", ticker, target_date),
+        lambda: _build_top_driver(ticker, target_date),
+    )
+
+
+def _build_top_driver(ticker: str, target_date: date) -> str:
+    """Build the get_top_driver() label (uncached)."""
+    diag = _diag_store().get((ticker, target_date))
+    if diag is None or not diag.z_scores:
+        return "—"
+    abs_z = np.abs(np.fromiter(
+        diag.z_scores.values(), dtype=np.float64, count=len(diag.z_scores),
+    ))
+    if np.isnan(abs_z).all():
+        return "—"
+    # nanargmax returns the first maximum, so ties keep insertion order
+    names = list(diag.z_scores)
+    return feature_label(names[int(np.nanargmax(abs_z))])
+
+
+# Read-only view: the weights are fixed, so callers share it instead of a copy
+_FEATURE_WEIGHTS_VIEW: Mapping[str, float] = MappingProxyType(FEATURE_WEIGHTS)
+
+
+def get_feature_weights() -> Mapping[str, float]:
+    """Return the fixed scoring weights from the spec (read-only)."""
+    return _FEATURE_WEIGHTS_VIEW
+
+
+_SCORED_FEATURES: tuple[str, ...] = tuple(sorted(FEATURE_WEIGHTS))
+
+
+def get_scored_features() -> tuple[str, ...]:
+    """Return the weighted (scoring) feature names in sorted order."""
+    return _SCORED_FEATURES
 
 
 # Human-readable labels for feature names
-FEATURE_LABELS = {
+FEATURE_LABELS: Mapping[str, str] = MappingProxyType({
     "dark_share": "Dark Pool Share",
     "gex": "Gamma Exposure",
     "venue_mix": "Venue Mix",
@@ -169,7 +439,7 @@ FEATURE_LABELS = {
     "dex": "Delta Exposure",
     "efficiency": "Efficiency",
     "impact": "Impact",
-}
+})
 
 
 def feature_label(name: str) -> str:
@@ -189,6 +459,19 @@ REGIME_COLORS = {
 }
 
 
+# Badge markup, formatted once per known regime code at import time
+_BADGE_TEMPLATE = (
+    '<span style="background-color:{color}; color:white; '
+    'padding:2px 8px; border-radius:10px; font-weight:600; '
+    'font-size:0.85rem;">{short}</span>'
+)
+_BADGE_HTML = {
+    short: _BADGE_TEMPLATE.format(color=color, short=short)
+    for short, color in REGIME_COLORS.items()
+}
+_BADGE_EMPTY = '<span style="color:#999">—</span>'
+
+
 def regime_badge_html(label: str | None) -> str:
     """Return an inline HTML pill badge for a regime label.
 
@@ -199,31 +482,31 @@ def regime_badge_html(label: str | None) -> str:
         HTML string for a coloured pill badge.
     """
     if not label:
-        return '<span style="color:#999">—</span>'
+        return _BADGE_EMPTY
     # Extract the short code (first token before " — ")
-    short = label.split(" — ")[0].split(" ")[0].strip()
-    color = REGIME_COLORS.get(short, "#666")
-    return (
-        f'<span style="background-color:{color}; color:white; '
-        f'padding:2px 8px; border-radius:10px; font-weight:600; '
-        f'font-size:0.85rem;">{short}</span>'
-    )
+    short = label.partition(" — ")[0].partition(" ")[0]
+    badge = _BADGE_HTML.get(short)
+    if badge is None:
+        badge = _BADGE_TEMPLATE.format(color="#666", short=short)
+    return badge
 
 
 def get_cached_date_count(ticker: str) -> int:
     """Return number of cached data dates for a ticker (from ParquetStore)."""
     orch = _get_orchestrator()
-    dates = _run_async(orch.processor.cache.list_dates(ticker, "bars"))
-    return len(dates)
+    # Directory metadata only — no need to hop onto the event loop thread
+    return orch.processor.cache.count_dates_sync(ticker, "bars")
 
 
 def get_cached_date_range(ticker: str) -> tuple[date | None, date | None]:
     """Return (earliest, latest) cached date for a ticker."""
     orch = _get_orchestrator()
-    dates = _run_async(orch.processor.cache.list_dates(ticker, "bars"))
-    if not dates:
-        return (None, None)
-    return (dates[0], dates[-1])
+    return orch.processor.cache.date_range_sync(ticker, "bars")
+
+
+def _focus_view() -> Mapping[str, FocusEntry]:
+    """Return the session's FOCUS entries as a read-only live view."""
+    return _get_orchestrator().universe.focus_view
 
 
 def get_focus_diagnostics(target_date: date, etf: str | None = None) -> list[dict]:
@@ -238,19 +521,29 @@ def get_focus_diagnostics(target_date: date, etf: str | None = None) -> list[dic
         List of dicts with: ticker, reason, details, regime_label,
         score_percentile, z_scores. Sorted by reason then ticker.
     """
-    orch = _get_orchestrator()
-    focus = orch.universe.get_focus_tickers()
+    return _focus_memo(
+        ("diagnostics", target_date, etf),
+        lambda: _build_focus_diagnostics(target_date, etf),
+    )
+
+
+def _build_focus_diagnostics(target_date: date, etf: str | None) -> list[dict]:
+    """Build the get_focus_diagnostics() rows (uncached)."""
+    focus = _focus_view()
 
     reason_order = {"structural": 0, "stress": 1, "event": 2}
     results = []
+    _get = _diag_store().get
 
-    for entry in focus.values():
-        # Filter structural by ETF if requested
-        if etf and entry.reason == "structural":
-            if f"in {etf}" not in entry.details:
-                continue
+    entries: Iterable[FocusEntry] = focus.values()
+    if etf:
+        # Filter structural by ETF up front; non-structural always pass
+        entries = [e for e in entries if e.reason != "structural" or e.etf == etf]
+        if not entries:
+            return results
 
-        diag = get_cached_diagnostic(entry.ticker, target_date)
+    for entry in entries:
+        diag = _get((entry.ticker, target_date))
         results.append({
             "ticker": entry.ticker,
             "reason": entry.reason,
@@ -272,18 +565,20 @@ def get_focus_summary() -> dict:
         Dictionary with: total, structural_count, stress_count, event_count,
         stress_zone_count (tickers in stress zone U >= 60).
     """
-    orch = _get_orchestrator()
-    focus = orch.universe.get_focus_tickers()
+    return _focus_memo(("summary",), _build_focus_summary)
+
+
+def _build_focus_summary() -> dict:
+    """Build the get_focus_summary() counts (uncached)."""
+    focus = _focus_view()
 
-    structural = sum(1 for e in focus.values() if e.reason == "structural")
-    stress = sum(1 for e in focus.values() if e.reason == "stress")
-    event = sum(1 for e in focus.values() if e.reason == "event")
+    counts = Counter(e.reason for e in focus.values())
 
     return {
         "total": len(focus),
-        "structural_count": structural,
-        "stress_count": stress,
-        "event_count": event,
+        "structural_count": counts["structural"],
+        "stress_count": counts["stress"],
+        "event_count": counts["event"],
     }
 
 
@@ -291,11 +586,16 @@ def get_focus_entries() -> list[dict]:
     """Return FOCUS entries with metadata for dashboard display.
 
     Returns:
-        List of dicts with: ticker, reason, details, days_inactive, entry_date.
+        List of dicts with: ticker, reason, details, etf (owning index for
+        structural entries, else None), days_inactive, entry_date.
         Sorted by reason (structural first), then ticker.
     """
-    orch = _get_orchestrator()
-    focus = orch.universe.get_focus_tickers()
+    return _focus_memo(("entries",), _build_focus_entries)
+
+
+def _build_focus_entries() -> list[dict]:
+    """Build the get_focus_entries() rows (uncached)."""
+    focus = _focus_view()
 
     reason_order = {"structural": 0, "stress": 1, "event": 2}
 
@@ -304,6 +604,7 @@ def get_focus_entries() -> list[dict]:
             "ticker": entry.ticker,
             "reason": entry.reason,
             "details": entry.details,
+            "etf": entry.etf,
             "days_inactive": entry.days_inactive,
             "entry_date": entry.entry_date.isoformat(),
         }
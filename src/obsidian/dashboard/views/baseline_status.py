@@ -1,6 +1,7 @@
 """Baseline Status page - Data sufficiency and quality indicators."""
 
 import math
+from typing import NamedTuple
 
 import streamlit as st
 from datetime import date
@@ -12,6 +13,7 @@ from obsidian.dashboard.data import (
     get_cached_date_count,
     get_feature_weights,
     feature_label,
+    FEATURE_LABELS,
 )
 
 
@@ -19,6 +21,20 @@ from obsidian.dashboard.data import (
 _MIN_OBS = 21
 _WINDOW = 63
 
+# Text colour per feature state in the status table
+_STATE_COLORS = {"COMPLETE": "#4CAF50", "EMPTY": "#f44336"}
+
+
+class _FeatureStatus(NamedTuple):
+    """Per-feature row for the status table."""
+
+    name: str
+    label: str
+    state: str
+    z_score: float | None
+    weight: float
+    is_weighted: bool
+
 
 def _feature_state(z_val: float | None) -> str:
     """Classify a feature's baseline state from its z-score value.
@@ -26,9 +42,7 @@ def _feature_state(z_val: float | None) -> str:
     If z-score is a valid number the baseline had enough data.
     If NaN the feature was excluded (PARTIAL or EMPTY).
     """
-    if z_val is None:
-        return "EMPTY"
-    if isinstance(z_val, float) and math.isnan(z_val):
+    if z_val is None or math.isnan(z_val):
         return "EMPTY"
     return "COMPLETE"
 
@@ -138,48 +152,54 @@ During the first {_WINDOW} trading days, the system uses an **expanding window**
 
     # Gather all features (weighted + unweighted)
     all_feature_names = set((diag.z_scores or {}).keys()) | set(weights.keys())
-    features = []
+    _label = FEATURE_LABELS.get
+    _weight = weights.get
+    z_scores = diag.z_scores or {}
+    features: list[_FeatureStatus] = []
     for name in sorted(all_feature_names):
-        z_val = diag.z_scores.get(name)
-        state = _feature_state(z_val)
-        weight = weights.get(name, 0.0)
-        features.append({
-            "name": name,
-            "label": feature_label(name),
-            "state": state,
-            "z_score": z_val,
-            "weight": weight,
-            "is_weighted": weight > 0,
-        })
+        z_val = z_scores.get(name)
+        weight = _weight(name, 0.0)
+        features.append(_FeatureStatus(
+            name=name,
+            label=_label(name, name),
+            state=_feature_state(z_val),
+            z_score=z_val,
+            weight=weight,
+            is_weighted=weight > 0,
+        ))
 
+    rows = []
     for f in features:
-        state_emoji = {"COMPLETE": "G", "EMPTY": "R"}.get(f["state"], "?")
-        state_color = {"COMPLETE": "green", "EMPTY": "red"}.get(f["state"], "gray")
-
-        col1, col2, col3 = st.columns([3, 2, 5])
-        with col1:
-            st.markdown(f"**{f['label']}**")
-        with col2:
-            st.text(f"State: {f['state']}")
-        with col3:
-            if f["state"] == "COMPLETE":
-                z_val = f["z_score"]
-                z_str = f"{z_val:+.2f}" if z_val is not None and not (isinstance(z_val, float) and math.isnan(z_val)) else "N/A"
-                st.success(f"Baseline usable -- Z = {z_str}, w = {f['weight']:.2f}")
-            else:
-                if f["is_weighted"]:
-                    st.error(f"Excluded from scoring (weight = {f['weight']:.2f})")
-                else:
-                    st.warning("Informational feature -- no data")
+        if f.state == "COMPLETE":
+            z_val = f.z_score
+            z_str = f"{z_val:+.2f}" if z_val is not None and not math.isnan(z_val) else "N/A"
+            status = "Baseline usable"
+        else:
+            z_str = "N/A"
+            status = "Excluded from scoring" if f.is_weighted else "Informational feature -- no data"
+        rows.append({
+            "Feature": f.label,
+            "State": f.state,
+            "Z": z_str,
+            "Weight": f"{f.weight:.2f}",
+            "Status": status,
+        })
+
+    # One styled table element instead of a row of columns per feature
+    styled = pd.DataFrame(rows).style.map(
+        lambda state: f"color: {_STATE_COLORS.get(state, '#9E9E9E')}; font-weight: 600",
+        subset=["State"],
+    )
+    st.dataframe(styled, width="stretch", hide_index=True)
 
     st.markdown("---")
 
     # --- Summary ---
     st.markdown("### Window Summary")
 
-    complete_count = sum(1 for f in features if f["state"] == "COMPLETE" and f["is_weighted"])
-    total_weighted = sum(1 for f in features if f["is_weighted"])
-    empty_count = sum(1 for f in features if f["state"] == "EMPTY" and f["is_weighted"])
+    complete_count = sum(1 for f in features if f.state == "COMPLETE" and f.is_weighted)
+    total_weighted = sum(1 for f in features if f.is_weighted)
+    empty_count = sum(1 for f in features if f.state == "EMPTY" and f.is_weighted)
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -193,8 +213,8 @@ During the first {_WINDOW} trading days, the system uses an **expanding window**
     st.markdown("---")
     st.markdown("### Data Quality Recommendations")
 
-    empty_weighted = [f for f in features if f["state"] == "EMPTY" and f["is_weighted"]]
-    empty_unweighted = [f for f in features if f["state"] == "EMPTY" and not f["is_weighted"]]
+    empty_weighted = [f for f in features if f.state == "EMPTY" and f.is_weighted]
+    empty_unweighted = [f for f in features if f.state == "EMPTY" and not f.is_weighted]
 
     if not empty_weighted and not empty_unweighted:
         st.success(
@@ -203,14 +223,14 @@ During the first {_WINDOW} trading days, the system uses an **expanding window**
         )
     else:
         if empty_weighted:
-            names = ", ".join(f["label"] for f in empty_weighted)
+            names = ", ".join(f.label for f in empty_weighted)
             st.warning(
                 f"**{len(empty_weighted)} weighted feature(s) excluded**: {names}\n\n"
                 "These features are excluded from unusualness scoring and may affect "
                 "regime classification. Check API connectivity and data availability."
             )
         if empty_unweighted:
-            names = ", ".join(f["label"] for f in empty_unweighted)
+            names = ", ".join(f.label for f in empty_unweighted)
             st.info(
                 f"**{len(empty_unweighted)} informational feature(s) unavailable**: {names}\n\n"
                 "These do not affect scoring but may limit classification accuracy."
@@ -1,14 +1,17 @@
 """Daily State page - Current regime and unusualness score."""
 
-import math
+from html import escape
 
 import streamlit as st
 from datetime import date, timedelta
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 
 from obsidian.dashboard.data import (
     get_cached_diagnostic,
     get_feature_weights,
+    FEATURE_LABELS,
     get_focus_entries,
     get_focus_diagnostics,
     get_focus_summary,
@@ -16,6 +19,7 @@ from obsidian.dashboard.data import (
     regime_badge_html,
 )
 from obsidian.engine.classifier import RegimeType
+from obsidian.engine.explainability import ExplanationSection
 from obsidian.universe.manager import CORE_TICKERS
 
 
@@ -31,69 +35,50 @@ _REGIME_CSS = {
 }
 
 
-def _render_explanation(explanation: str) -> None:
-    """Render formatted diagnostic explanation with sections and highlights."""
-    if not explanation:
-        st.caption("_No explanation available._")
-        return
+def _render_explanation(
+    sections: list[ExplanationSection] | None,
+    explanation: str,
+) -> None:
+    """Render formatted diagnostic explanation with sections and highlights.
 
-    lines = explanation.strip().split("\n")
-
-    # Parse into sections (split on blank lines, skip header)
-    sections: list[list[str]] = []
-    current: list[str] = []
-    for line in lines:
-        if line.startswith("==="):
-            continue
-        if line.strip() == "":
-            if current:
-                sections.append(current)
-                current = []
+    Sections are built by the processor alongside the text explanation,
+    so this only dispatches on section kind. Results without sections
+    (e.g. "no feature data") fall back to the plain explanation text.
+    """
+    if not sections:
+        if explanation:
+            st.caption(explanation)
         else:
-            current.append(line)
-    if current:
-        sections.append(current)
+            st.caption("_No explanation available._")
+        return
 
     for section in sections:
-        first = section[0]
-
-        if first.startswith("Regime:"):
-            # Regime section — bold header + triggering conditions as bullets
-            st.markdown(f"**{first}**")
-            for line in section[1:]:
-                st.markdown(f"- `{line.strip()}`")
-
-        elif first.startswith("Unusualness:"):
+        if section.kind == "regime":
+            # Regime section — bold header + triggering conditions as bullets,
+            # emitted as one markdown element
+            st.markdown("\n".join([
+                f"**{section.header}**\n",
+                *(f"- `{line}`" for line in section.lines),
+            ]))
+
+        elif section.kind == "score":
             # Score section — header + drivers as bullet list
-            st.markdown(f"**{first}**")
-            for line in section[1:]:
-                if line.startswith("Top drivers:"):
-                    drivers = line.replace("Top drivers: ", "").split("; ")
-                    for d in drivers:
-                        parts = d.split(" contrib=")
-                        if len(parts) == 2:
-                            name, val = parts
-                            st.markdown(
-                                f"- **{name}** — contribution: `{val}`"
-                            )
-                        else:
-                            st.markdown(f"- {d}")
-                else:
-                    st.markdown(f"  {line}")
+            st.markdown("\n".join([
+                f"**{section.header}**\n",
+                *(f"- **{name}** — contribution: `{val}`" for name, val in section.drivers),
+            ]))
 
-        elif first.startswith("Excluded:"):
-            excluded_text = first.replace("Excluded: ", "")
-            if excluded_text == "none":
+        elif section.kind == "excluded":
+            if not section.items:
                 st.success("**Excluded features:** none — full feature set active")
             else:
-                items = excluded_text.split(", ")
                 st.warning(
                     "**Excluded features:** "
-                    + " | ".join(f"`{item}`" for item in items)
+                    + " | ".join(f"`{item}`" for item in section.items)
                 )
 
-        elif first.startswith("Baseline:"):
-            state = first.replace("Baseline: ", "")
+        elif section.kind == "baseline":
+            state = section.value
             if state == "COMPLETE":
                 st.success(f"**Baseline:** {state} — all features have sufficient history")
             elif state == "PARTIAL":
@@ -102,6 +87,115 @@ def _render_explanation(explanation: str) -> None:
                 st.warning(f"**Baseline:** {state} — insufficient data for baseline computation")
 
 
+@st.cache_resource(max_entries=256)
+def _gauge_figure(value: float) -> go.Figure:
+    """Build the unusualness gauge for a percentile value.
+
+    Cached per value and never mutated afterwards, so sessions can share
+    the figures safely.
+    """
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': "Percentile"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 30], 'color': "lightgray"},
+                {'range': [30, 60], 'color': "gray"},
+                {'range': [60, 80], 'color': "lightsalmon"},
+                {'range': [80, 100], 'color': "lightcoral"},
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 80,
+            },
+        },
+    ))
+    fig.update_layout(height=300)
+    return fig
+
+
+# Focus table row classes (style.css), in bucket order:
+# this ETF's structural, other structural, stress/event
+_FOCUS_ROW_CLASSES = ("focus-row-etf", "focus-row-other", "focus-row")
+_FOCUS_TABLE_TEMPLATE = (
+    '<table class="focus-table">'
+    "<thead><tr><th>Ticker</th><th>Regime</th><th>Reason</th>"
+    "<th>Details</th><th>Idle</th></tr></thead>"
+    "<tbody>{rows}</tbody></table>"
+)
+_FOCUS_SUMMARY_TEMPLATE = (
+    "**{total}** focus tickers ({structural_count} structural, "
+    "{stress_count} stress, {event_count} event)"
+)
+_FOCUS_ROW_TEMPLATE = (
+    '<tr class="{cls}"><td>{ticker}</td><td>{badge}</td>'
+    "<td>{reason}</td><td>{details}</td><td>{idle}d</td></tr>"
+)
+
+
+def _render_focus_block(ticker: str, end_date: date) -> None:
+    """Render the Focus Decomposition section for a CORE ticker.
+
+    Args:
+        ticker: CORE ticker symbol being viewed
+        end_date: Date for focus diagnostics
+    """
+    st.markdown("### Focus Decomposition")
+
+    focus_entries = get_focus_entries()
+    summary = get_focus_summary()
+
+    if focus_entries:
+        st.markdown(_FOCUS_SUMMARY_TEMPLATE.format_map(summary))
+
+        # Build regime lookup from focus diagnostics
+        focus_diags = get_focus_diagnostics(end_date)
+        regime_lookup = {
+            fd["ticker"]: fd["regime_label"]
+            for fd in focus_diags
+        }
+
+        # Partition entries: this ETF's structural first, then other structural, then rest
+        buckets: tuple[list[dict], list[dict], list[dict]] = ([], [], [])
+        for entry in focus_entries:
+            if entry["reason"] != "structural":
+                idx = 2
+            else:
+                idx = 0 if entry["etf"] == ticker else 1
+            buckets[idx].append(entry)
+
+        # One HTML table instead of a row of columns per ticker:
+        # this ETF's structural bold, other structural dimmed, rest normal
+        _row = _FOCUS_ROW_TEMPLATE.format
+        rows = [
+            _row(
+                cls=cls,
+                ticker=escape(entry["ticker"]),
+                badge=regime_badge_html(regime_lookup.get(entry["ticker"])),
+                reason=escape(entry["reason"]),
+                details=escape(entry["details"]),
+                idle=entry["days_inactive"],
+            )
+            for cls, bucket in zip(_FOCUS_ROW_CLASSES, buckets)
+            for entry in bucket
+        ]
+        st.markdown(
+            _FOCUS_TABLE_TEMPLATE.format(rows="".join(rows)),
+            unsafe_allow_html=True,
+        )
+
+        st.caption(
+            "Focus tickers are **lenses**, not targets. "
+            "They explain CORE behavior, not predict individual moves."
+        )
+    else:
+        st.caption("No focus tickers active. Run full diagnostics to populate.")
+
+
 def render(ticker: str, end_date: date) -> None:
     """Render the Daily State page.
 
@@ -146,268 +240,140 @@ This is a **diagnostic**, not a prediction. It tells you *what is happening*, no
         unsafe_allow_html=True,
     )
 
-    # --- What Changed? (day-over-day comparison) ---
-    prev = None
-    for offset in range(1, 8):
-        prev = get_cached_diagnostic(ticker, end_date - timedelta(days=offset))
-        if prev:
-            break
-
-    if prev:
-        st.markdown("---")
-        st.markdown("### What Changed?")
-        st.caption(f"Compared to {prev.date.strftime('%Y-%m-%d')}")
-
-        wc1, wc2, wc3 = st.columns(3)
-
-        # Regime change
-        with wc1:
-            if prev.regime != diag.regime:
-                prev_badge = _REGIME_CSS.get(prev.regime, "regime-neutral")
-                st.markdown(
-                    f'<span class="{prev_badge} regime-badge" style="font-size:0.9rem; padding:0.3rem 0.8rem;">'
-                    f'{prev.regime.value}</span>'
-                    f' &rarr; '
-                    f'<span class="{badge_class} regime-badge" style="font-size:0.9rem; padding:0.3rem 0.8rem;">'
-                    f'{diag.regime.value}</span>',
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(f"Regime: **{diag.regime.value}** (unchanged)")
-
-        # Score delta
-        with wc2:
-            if diag.score_percentile is not None and prev.score_percentile is not None:
-                delta = diag.score_percentile - prev.score_percentile
-                st.metric("U percentile", f"{diag.score_percentile:.1f}", f"{delta:+.1f}")
-            else:
-                st.metric("U percentile", "N/A")
-
-        # Baseline change
-        with wc3:
-            if prev.baseline_state != diag.baseline_state:
-                st.metric("Baseline", diag.baseline_state, f"was {prev.baseline_state}")
-            else:
-                st.metric("Baseline", diag.baseline_state, "unchanged")
-
-        # Top Z-score movers
-        if diag.z_scores and prev.z_scores:
-            deltas = []
-            for feat, z_now in diag.z_scores.items():
-                z_prev = prev.z_scores.get(feat)
-                now_nan = isinstance(z_now, float) and math.isnan(z_now)
-                prev_nan = z_prev is None or (isinstance(z_prev, float) and math.isnan(z_prev))
-                if not now_nan and not prev_nan:
-                    deltas.append((feat, z_prev, z_now, z_now - z_prev))
-
-            deltas.sort(key=lambda x: abs(x[3]), reverse=True)
-            top_movers = deltas[:3]
-
-            if top_movers:
-                mv_cols = st.columns(len(top_movers))
-                for i, (feat, z_prev, z_now, dz) in enumerate(top_movers):
-                    with mv_cols[i]:
-                        st.metric(
-                            feature_label(feat),
-                            f"Z = {z_now:+.2f}",
-                            f"{dz:+.2f}",
-                        )
-
-    st.markdown("---")
-
-    # --- Unusualness Score Gauge ---
-    st.markdown("### Unusualness Score")
-
-    if diag.score_raw is not None:
-        percentile = diag.score_percentile or 0.0
-
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=percentile,
-            title={'text': "Percentile"},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 30], 'color': "lightgray"},
-                    {'range': [30, 60], 'color': "gray"},
-                    {'range': [60, 80], 'color': "lightsalmon"},
-                    {'range': [80, 100], 'color': "lightcoral"},
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 80,
-                },
-            },
-        ))
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, width="stretch")
-
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Raw Score", f"{diag.score_raw:.3f}")
-        with col2:
-            st.metric("Percentile", f"{percentile:.1f}")
-        with col3:
-            st.metric("Interpretation", diag.interpretation or "N/A")
-    else:
-        st.warning("Score unavailable (insufficient baseline data).")
+    # Sections below are separated by a CSS rule on their h3 headers
+    # (see .st-key-daily-sections in style.css) instead of "---" elements
+    with st.container(key="daily-sections"):
+        # --- What Changed? (day-over-day comparison) ---
+        prev = None
+        for offset in range(1, 8):
+            prev = get_cached_diagnostic(ticker, end_date - timedelta(days=offset))
+            if prev:
+                break
 
-    st.markdown("---")
+        if prev:
+            st.markdown("### What Changed?")
+            st.caption(f"Compared to {prev.date.strftime('%Y-%m-%d')}")
+
+            wc1, wc2, wc3 = st.columns(3)
+
+            # Regime change
+            with wc1:
+                if prev.regime != diag.regime:
+                    prev_badge = _REGIME_CSS.get(prev.regime, "regime-neutral")
+                    st.markdown(
+                        f'<span class="{prev_badge} regime-badge regime-badge-sm">{prev.regime.value}</span>'
+                        f' &rarr; '
+                        f'<span class="{badge_class} regime-badge regime-badge-sm">{diag.regime.value}</span>',
+                        unsafe_allow_html=True,
+                    )
+                else:
+                    st.markdown(f"Regime: **{diag.regime.value}** (unchanged)")
 
-    # --- Top Drivers ---
-    st.markdown("### Feature Z-Scores")
+            # Score delta
+            with wc2:
+                if diag.score_percentile is not None and prev.score_percentile is not None:
+                    delta = diag.score_percentile - prev.score_percentile
+                    st.metric("U percentile", f"{diag.score_percentile:.1f}", f"{delta:+.1f}")
+                else:
+                    st.metric("U percentile", "N/A")
 
-    weights = get_feature_weights()
+            # Baseline change
+            with wc3:
+                if prev.baseline_state != diag.baseline_state:
+                    st.metric("Baseline", diag.baseline_state, f"was {prev.baseline_state}")
+                else:
+                    st.metric("Baseline", diag.baseline_state, "unchanged")
+
+            # Top Z-score movers
+            if diag.z_scores and prev.z_scores:
+                # Deltas are NaN wherever either day lacks a z-score
+                feats = list(diag.z_scores)
+                _prev_z = prev.z_scores.get
+                z_now = np.fromiter(diag.z_scores.values(), dtype=np.float64, count=len(feats))
+                z_prev = np.fromiter(
+                    (_prev_z(f, np.nan) for f in feats), dtype=np.float64, count=len(feats)
+                )
+                dz = z_now - z_prev
+                movable = np.flatnonzero(~np.isnan(dz))
+                top_movers = movable[np.argsort(-np.abs(dz[movable]), kind="stable")][:3]
+
+                if len(top_movers):
+                    mv_cols = st.columns(len(top_movers))
+                    for col, i in zip(mv_cols, top_movers):
+                        with col:
+                            st.metric(
+                                feature_label(feats[i]),
+                                f"Z = {z_now[i]:+.2f}",
+                                f"{dz[i]:+.2f}",
+                            )
 
-    if diag.z_scores:
-        # Sort by absolute z-score descending; NaN last
-        def _sort_key(kv: tuple[str, float]) -> float:
-            v = kv[1]
-            return abs(v) if not (math.isnan(v) if isinstance(v, float) else False) else -1
+        # --- Unusualness Score Gauge ---
+        st.markdown("### Unusualness Score")
 
-        for name, z_val in sorted(diag.z_scores.items(), key=_sort_key, reverse=True):
-            weight = weights.get(name, 0.0)
-            is_nan = isinstance(z_val, float) and math.isnan(z_val)
+        if diag.score_raw is not None:
+            percentile = diag.score_percentile or 0.0
 
-            if is_nan:
-                contribution_str = "N/A"
-                z_str = "NaN"
-            else:
-                contribution = weight * abs(z_val)
-                contribution_str = f"{contribution:.3f}"
-                z_str = f"{z_val:+.2f}"
+            # Rounded to the gauge's visual resolution so figures are reusable
+            fig = _gauge_figure(round(percentile, 1))
+            st.plotly_chart(fig, width="stretch")
 
-            col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
+            col1, col2, col3 = st.columns(3)
             with col1:
-                st.text(feature_label(name))
+                st.metric("Raw Score", f"{diag.score_raw:.3f}")
             with col2:
-                st.text(f"Z = {z_str}")
+                st.metric("Percentile", f"{percentile:.1f}")
             with col3:
-                st.text(f"w = {weight:.2f}")
-            with col4:
-                st.text(f"C = {contribution_str}")
-    else:
-        st.caption("No z-scores available.")
+                st.metric("Interpretation", diag.interpretation or "N/A")
+        else:
+            st.warning("Score unavailable (insufficient baseline data).")
+
+        # --- Top Drivers ---
+        st.markdown("### Feature Z-Scores")
+
+        weights = get_feature_weights()
+
+        if diag.z_scores:
+            # Sort by absolute z-score descending; NaN last (stable for ties)
+            names = list(diag.z_scores)
+            z_vals = np.fromiter(diag.z_scores.values(), dtype=np.float64, count=len(names))
+            is_nan = np.isnan(z_vals)
+            magnitude = np.where(is_nan, -np.inf, np.abs(z_vals))
+            order = np.argsort(-magnitude, kind="stable")
+            w = np.fromiter((weights.get(n, 0.0) for n in names), dtype=np.float64, count=len(names))
+            contributions = w * np.abs(z_vals)
+
+            _label = FEATURE_LABELS.get
+            rows = [
+                {
+                    "Feature": _label(names[i], names[i]),
+                    "Z": "NaN" if is_nan[i] else f"{z_vals[i]:+.2f}",
+                    "Weight": f"{w[i]:.2f}",
+                    "Contribution": "N/A" if is_nan[i] else f"{contributions[i]:.3f}",
+                }
+                for i in order
+            ]
+
+            # One table element instead of a row of columns per feature
+            st.dataframe(pd.DataFrame(rows), width="stretch", hide_index=True)
+        else:
+            st.caption("No z-scores available.")
 
-    st.markdown("---")
+        # --- Baseline Status ---
+        st.markdown("### Baseline Status")
+        st.text(f"State: {diag.baseline_state}")
 
-    # --- Baseline Status ---
-    st.markdown("### Baseline Status")
-    st.text(f"State: {diag.baseline_state}")
+        # --- Explainability Text (structured) ---
+        st.markdown("### Diagnostic Explanation")
+        _render_explanation(diag.explanation_sections, diag.explanation)
 
-    st.markdown("---")
+        # --- AI Analysis (optional enrichment) ---
+        if diag.ai_explanation:
+            st.markdown("### AI Analysis")
+            st.markdown(diag.ai_explanation)
 
-    # --- Explainability Text (structured) ---
-    st.markdown("### Diagnostic Explanation")
-    _render_explanation(diag.explanation)
-
-    # --- AI Analysis (optional enrichment) ---
-    if diag.ai_explanation:
-        st.markdown("---")
-        st.markdown("### AI Analysis")
-        st.markdown(diag.ai_explanation)
-
-    # --- Focus Decomposition (CORE tickers only) ---
-    if ticker in CORE_TICKERS:
-        st.markdown("---")
-        st.markdown("### Focus Decomposition")
-
-        focus_entries = get_focus_entries()
-        summary = get_focus_summary()
-
-        if focus_entries:
-            st.markdown(
-                f"**{summary['total']}** focus tickers "
-                f"({summary['structural_count']} structural, "
-                f"{summary['stress_count']} stress, "
-                f"{summary['event_count']} event)"
-            )
-
-            # Build regime lookup from focus diagnostics
-            focus_diags = get_focus_diagnostics(end_date)
-            regime_lookup = {
-                fd["ticker"]: fd["regime_label"]
-                for fd in focus_diags
-            }
-
-            # Partition entries: this ETF's structural first, then other structural, then rest
-            etf_structural = []
-            other_structural = []
-            non_structural = []
-
-            for entry in focus_entries:
-                if entry["reason"] == "structural":
-                    if f"in {ticker}" in entry["details"]:
-                        etf_structural.append(entry)
-                    else:
-                        other_structural.append(entry)
-                else:
-                    non_structural.append(entry)
-
-            # Render header
-            hdr = st.columns([2, 2, 2, 3, 1])
-            for col, label in zip(hdr, ["**Ticker**", "**Regime**", "**Reason**", "**Details**", "**Idle**"]):
-                with col:
-                    st.markdown(label)
-
-            def _render_focus_row(entry: dict, style: str = "normal") -> None:
-                """Render a single focus row with regime badge."""
-                cols = st.columns([2, 2, 2, 3, 1])
-                badge = regime_badge_html(regime_lookup.get(entry["ticker"]))
-
-                if style == "bold":
-                    with cols[0]:
-                        st.markdown(f"**{entry['ticker']}**")
-                    with cols[1]:
-                        st.markdown(badge, unsafe_allow_html=True)
-                    with cols[2]:
-                        st.markdown(f"**{entry['reason']}**")
-                    with cols[3]:
-                        st.markdown(f"**{entry['details']}**")
-                    with cols[4]:
-                        st.markdown(f"**{entry['days_inactive']}d**")
-                elif style == "dimmed":
-                    dim = "color:#999"
-                    with cols[0]:
-                        st.markdown(f"<span style='{dim}'>{entry['ticker']}</span>", unsafe_allow_html=True)
-                    with cols[1]:
-                        st.markdown(badge, unsafe_allow_html=True)
-                    with cols[2]:
-                        st.markdown(f"<span style='{dim}'>{entry['reason']}</span>", unsafe_allow_html=True)
-                    with cols[3]:
-                        st.markdown(f"<span style='{dim}'>{entry['details']}</span>", unsafe_allow_html=True)
-                    with cols[4]:
-                        st.markdown(f"<span style='{dim}'>{entry['days_inactive']}d</span>", unsafe_allow_html=True)
-                else:
-                    with cols[0]:
-                        st.text(entry["ticker"])
-                    with cols[1]:
-                        st.markdown(badge, unsafe_allow_html=True)
-                    with cols[2]:
-                        st.text(entry["reason"])
-                    with cols[3]:
-                        st.text(entry["details"])
-                    with cols[4]:
-                        st.text(f"{entry['days_inactive']}d")
-
-            # This ETF's structural tickers — bold
-            for entry in etf_structural:
-                _render_focus_row(entry, style="bold")
-            # Other structural tickers — dimmed
-            for entry in other_structural:
-                _render_focus_row(entry, style="dimmed")
-            # Stress + event tickers — normal
-            for entry in non_structural:
-                _render_focus_row(entry, style="normal")
-
-            st.caption(
-                "Focus tickers are **lenses**, not targets. "
-                "They explain CORE behavior, not predict individual moves."
-            )
-        else:
-            st.caption("No focus tickers active. Run full diagnostics to populate.")
+        # --- Focus Decomposition (CORE tickers only) ---
+        if ticker in CORE_TICKERS:
+            _render_focus_block(ticker, end_date)
 
     # --- Data Quality Notice ---
     st.markdown("---")
@@ -1,22 +1,263 @@
 """Drivers & Contributors page - Feature breakdown analysis."""
 
 import math
+from collections.abc import Mapping
+from html import escape
+from typing import NamedTuple
 
 import streamlit as st
 from datetime import date, timedelta
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
+from plotly.subplots import make_subplots
 
 from obsidian.dashboard.data import (
     get_cached_diagnostic,
-    get_historical_diagnostics,
+    get_z_score_history,
     get_feature_weights,
     get_focus_diagnostics,
+    get_scored_features,
     feature_label,
 )
 from obsidian.universe.manager import CORE_TICKERS
 
 
+@st.cache_resource(max_entries=128)
+def _contribution_figure(
+    labels: tuple[str, ...],
+    contributions: tuple[float, ...],
+    z_scores: tuple[float, ...],
+) -> go.Figure:
+    """Build the feature contribution bar chart.
+
+    Cached per input and never mutated afterwards, so reruns with the
+    same diagnostic reuse the figure. Numeric series are float32 arrays,
+    which plotly ships as compact typed-array payloads.
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=np.asarray(contributions, dtype=np.float32),
+        y=list(labels),
+        orientation='h',
+        marker=dict(
+            color=np.asarray(z_scores, dtype=np.float32),
+            colorscale='RdBu',
+            cmin=-3,
+            cmax=3,
+            colorbar=dict(title="Z-Score"),
+        ),
+        text=[f"{c:.3f}" for c in contributions],
+        textposition='auto',
+        hovertemplate='%{y}<br>Contribution: %{x:.3f}<br>Z-score: %{marker.color:.2f}<extra></extra>',
+    ))
+    fig.update_layout(
+        xaxis_title="Contribution to Unusualness",
+        yaxis_title="Feature",
+        height=300,
+        showlegend=False,
+    )
+    return fig
+
+
+# Below this many rows an HTML table is cheaper than a DataFrame + Arrow round-trip
+_HTML_TABLE_MAX_ROWS = 40
+
+
+def _rows_to_html(rows: list[dict]) -> str:
+    """Render uniform row dicts as a plain HTML table (keys are the header)."""
+    if not rows:
+        return ""
+    header = "".join(f"<th>{escape(col)}</th>" for col in rows[0])
+    body = "".join(
+        "<tr>" + "".join(f"<td>{escape(str(v))}</td>" for v in row.values()) + "</tr>"
+        for row in rows
+    )
+    return f'<table class="data-table"><thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def _z_cell_style(z: float) -> str:
+    """CSS for a cross-reference z-score cell: red above 0, blue below, bold if |Z| ≥ 2."""
+    if math.isnan(z):
+        return "color: #999"
+    if z == 0:
+        return ""
+    color = "#f44336" if z > 0 else "#2196F3"
+    return f"color: {color}; font-weight: 600" if abs(z) >= 2 else f"color: {color}"
+
+
+class _Breakdown(NamedTuple):
+    """Per-diagnostic feature breakdown shown on the Drivers page."""
+
+    labels: dict[str, str]
+    valid: list[dict]         # weighted, non-NaN
+    excluded: list[dict]      # NaN z-score
+    unweighted: list[dict]    # non-NaN, weight 0
+    total_score: float
+    detail_rows: list[dict]   # preformatted Feature Details table rows
+    detail_html: str | None   # detail_rows as an HTML table (small tables only)
+    # (labels, contributions, z-scores) of valid features for the bar chart
+    chart_inputs: tuple[tuple[str, ...], tuple[float, ...], tuple[float, ...]]
+
+
+def _build_breakdown(diag, weights: Mapping[str, float]) -> _Breakdown:
+    """Compute contributions, ordering and table rows for a diagnostic."""
+    # Resolve display labels once for every feature shown on this page
+    labels = {name: feature_label(name) for name in (*diag.z_scores, *weights)}
+
+    # Contributions computed array-wide: C = w × |Z|, 0 for NaN/unweighted
+    names = list(diag.z_scores)
+    n = len(names)
+    z = np.fromiter(diag.z_scores.values(), dtype=np.float64, count=n)
+    w = np.fromiter((weights.get(name, 0.0) for name in names), dtype=np.float64, count=n)
+    nan_mask = np.isnan(z)
+    valid_mask = ~nan_mask & (w > 0)
+    contrib = np.where(valid_mask, np.abs(z) * w, 0.0)
+
+    # Sort by contribution descending (stable, so ties keep input order)
+    order = np.argsort(-contrib, kind="stable")
+    features = [
+        {
+            "name": names[i],
+            "label": labels[names[i]],
+            "z_score": 0.0 if nan_mask[i] else float(z[i]),
+            "weight": float(w[i]),
+            "contribution": float(contrib[i]),
+            "is_nan": bool(nan_mask[i]),
+        }
+        for i in order
+    ]
+
+    detail_rows = [
+        {
+            "Feature": f["label"],
+            "Z-Score": "NaN (excluded)" if f["is_nan"] else f"{f['z_score']:+.2f}",
+            "Weight": f"{f['weight']:.2f}" if f["weight"] > 0 else "-- (unweighted)",
+            "Contribution": f"{f['contribution']:.3f}" if not f["is_nan"] else "N/A",
+        }
+        for f in features
+    ]
+
+    # Separate valid, NaN and unweighted features in one pass (sorted order kept)
+    bucket_of = np.where(valid_mask, 0, np.where(nan_mask, 1, 2))[order].tolist()
+    valid, excluded, unweighted = buckets = ([], [], [])
+    for f, idx in zip(features, bucket_of):
+        buckets[idx].append(f)
+
+    return _Breakdown(
+        labels=labels,
+        valid=valid,
+        excluded=excluded,
+        unweighted=unweighted,
+        # contrib is already 0 outside valid_mask, so no masked gather needed
+        total_score=float(contrib.sum()),
+        detail_rows=detail_rows,
+        detail_html=(
+            _rows_to_html(detail_rows) if len(detail_rows) < _HTML_TABLE_MAX_ROWS else None
+        ),
+        chart_inputs=(
+            tuple(f["label"] for f in valid),
+            tuple(f["contribution"] for f in valid),
+            tuple(f["z_score"] for f in valid),
+        ),
+    )
+
+
+def _feature_breakdown(diag, weights: Mapping[str, float]) -> _Breakdown:
+    """Return the breakdown for diag, reusing the previous rerun's result.
+
+    Widget reruns on this page usually show the same diagnostic object,
+    so the last (diag, breakdown) pair is kept in session state and
+    reused while diag is unchanged. Holding diag also keeps its identity
+    from being recycled.
+    """
+    memo = st.session_state.get("_drivers_breakdown")
+    if memo is not None and memo[0] is diag:
+        return memo[1]
+    breakdown = _build_breakdown(diag, weights)
+    st.session_state["_drivers_breakdown"] = (diag, breakdown)
+    return breakdown
+
+
+@st.cache_resource(max_entries=32)
+def _trends_figure(
+    labels: tuple[str, ...],
+    dates: tuple[date, ...],
+    z_matrix: np.ndarray,
+) -> go.Figure:
+    """Build all z-score sparklines as one two-column subplot figure.
+
+    One figure means one plotly.js init in the browser instead of one per
+    feature. z_matrix is features × dates with NaN where a date lacks the
+    feature; features with fewer than two points get an empty panel.
+    """
+    n_rows = math.ceil(len(labels) / 2)
+    present = ~np.isnan(z_matrix)
+    dates_arr = np.array(dates, dtype=object)
+
+    titles = []
+    for idx, label in enumerate(labels):
+        z_vals = z_matrix[idx, present[idx]]
+        titles.append(
+            f"{label} (Z = {z_vals[-1]:+.2f})" if len(z_vals) >= 2
+            else f"{label}: insufficient data"
+        )
+
+    fig = make_subplots(
+        rows=n_rows, cols=2, subplot_titles=titles, vertical_spacing=0.3 / n_rows,
+    )
+    for idx in range(len(labels)):
+        keep = present[idx]
+        z_vals = z_matrix[idx, keep]
+        if len(z_vals) < 2:
+            continue
+        row, col = divmod(idx, 2)
+        color = "#f44336" if z_vals[-1] > 0 else "#2196F3"
+        fig.add_trace(go.Scattergl(
+            x=dates_arr[keep].tolist(),
+            y=z_vals.astype(np.float32),
+            mode="lines+markers",
+            line=dict(color=color, width=2),
+            marker=dict(size=4, color=color),
+            hovertemplate="%{x}<br>Z = %{y:.2f}<extra></extra>",
+        ), row=row + 1, col=col + 1)
+        fig.add_hline(
+            y=0, line_dash="dot", line_color="#999", opacity=0.5,
+            row=row + 1, col=col + 1,
+        )
+
+    fig.update_annotations(font_size=12)
+    fig.update_xaxes(showticklabels=False, showgrid=False)
+    fig.update_yaxes(showticklabels=True, showgrid=True, tickfont=dict(size=9))
+    fig.update_layout(
+        height=150 * n_rows,
+        margin=dict(l=10, r=10, t=30, b=10),
+        showlegend=False,
+    )
+    return fig
+
+
+def _render_trends(
+    ticker: str,
+    end_date: date,
+    labels: dict[str, str],
+) -> None:
+    """Render z-score sparklines for each scored feature over the last 30 days."""
+    scored_features = get_scored_features()
+    # z-score matrix (features × dates), NaN where a date lacks the feature
+    hist_dates, z_matrix = get_z_score_history(
+        ticker, end_date - timedelta(days=30), end_date, scored_features,
+    )
+
+    if len(hist_dates) >= 3:
+        fig = _trends_figure(
+            tuple(labels[feat] for feat in scored_features), hist_dates, z_matrix,
+        )
+        st.plotly_chart(fig, width="stretch")
+    else:
+        st.caption("Need at least 3 cached dates for trend sparklines. Run diagnostics for more dates.")
+
+
 def render(ticker: str, end_date: date) -> None:
     """Render the Drivers & Contributors page.
 
@@ -51,58 +292,16 @@ def render(ticker: str, end_date: date) -> None:
         return
 
     weights = get_feature_weights()
-
-    # Build feature list with contributions
-    features = []
-    for name, z_val in diag.z_scores.items():
-        is_nan = isinstance(z_val, float) and math.isnan(z_val)
-        weight = weights.get(name, 0.0)
-        contribution = weight * abs(z_val) if (not is_nan and weight > 0) else 0.0
-        features.append({
-            "name": name,
-            "label": feature_label(name),
-            "z_score": z_val if not is_nan else 0.0,
-            "weight": weight,
-            "contribution": contribution,
-            "is_nan": is_nan,
-        })
-
-    # Sort by contribution descending
-    features.sort(key=lambda f: f["contribution"], reverse=True)
-
-    # Separate valid and NaN features
-    valid_features = [f for f in features if not f["is_nan"] and f["weight"] > 0]
-    nan_features = [f for f in features if f["is_nan"]]
-    unweighted_features = [f for f in features if not f["is_nan"] and f["weight"] == 0]
-
-    total_score = sum(f["contribution"] for f in valid_features)
+    bd = _feature_breakdown(diag, weights)
+    labels = bd.labels
+    valid_features = bd.valid
+    total_score = bd.total_score
 
     # --- Feature Contribution Breakdown ---
     st.markdown("### Feature Contributions to Unusualness Score")
 
     if valid_features:
-        fig_contrib = go.Figure()
-        fig_contrib.add_trace(go.Bar(
-            x=[f["contribution"] for f in valid_features],
-            y=[f["label"] for f in valid_features],
-            orientation='h',
-            marker=dict(
-                color=[f["z_score"] for f in valid_features],
-                colorscale='RdBu',
-                cmin=-3,
-                cmax=3,
-                colorbar=dict(title="Z-Score"),
-            ),
-            text=[f"{f['contribution']:.3f}" for f in valid_features],
-            textposition='auto',
-            hovertemplate='%{y}<br>Contribution: %{x:.3f}<br>Z-score: %{marker.color:.2f}<extra></extra>',
-        ))
-        fig_contrib.update_layout(
-            xaxis_title="Contribution to Unusualness",
-            yaxis_title="Feature",
-            height=300,
-            showlegend=False,
-        )
+        fig_contrib = _contribution_figure(*bd.chart_inputs)
         st.plotly_chart(fig_contrib, width="stretch")
 
     # Summary metrics
@@ -123,83 +322,33 @@ def render(ticker: str, end_date: date) -> None:
     # --- Feature Details Table ---
     st.markdown("### Feature Details")
 
-    rows = []
-    for f in features:
-        if f["is_nan"]:
-            z_str = "NaN (excluded)"
-        else:
-            z_str = f"{f['z_score']:+.2f}"
-
-        rows.append({
-            "Feature": f["label"],
-            "Z-Score": z_str,
-            "Weight": f"{f['weight']:.2f}" if f["weight"] > 0 else "-- (unweighted)",
-            "Contribution": f"{f['contribution']:.3f}" if not f["is_nan"] else "N/A",
-        })
-
-    st.dataframe(pd.DataFrame(rows), width="stretch", hide_index=True)
+    if bd.detail_html is not None:
+        st.markdown(bd.detail_html, unsafe_allow_html=True)
+    else:
+        st.dataframe(pd.DataFrame(bd.detail_rows), width="stretch", hide_index=True)
 
     # --- Feature Trend Sparklines ---
     st.markdown("---")
     st.markdown("### Feature Trends (last 21 days)")
 
-    hist = get_historical_diagnostics(ticker, end_date - timedelta(days=30), end_date)
-    hist_dates = sorted(hist.keys())
-
-    if len(hist_dates) >= 3:
-        scored_features = sorted(weights.keys())
-
-        # Build z-score time series per feature
-        spark_cols = st.columns(2)
-        for idx, feat in enumerate(scored_features):
-            dates_list = []
-            z_vals = []
-            for d in hist_dates:
-                z = hist[d].z_scores.get(feat)
-                if z is not None and not (isinstance(z, float) and math.isnan(z)):
-                    dates_list.append(d)
-                    z_vals.append(z)
-
-            with spark_cols[idx % 2]:
-                if len(z_vals) >= 2:
-                    latest_z = z_vals[-1]
-                    color = "#f44336" if latest_z > 0 else "#2196F3"
-                    fig_spark = go.Figure(go.Scatter(
-                        x=dates_list,
-                        y=z_vals,
-                        mode="lines+markers",
-                        line=dict(color=color, width=2),
-                        marker=dict(size=4, color=color),
-                        hovertemplate="%{x}<br>Z = %{y:.2f}<extra></extra>",
-                    ))
-                    fig_spark.add_hline(y=0, line_dash="dot", line_color="#999", opacity=0.5)
-                    fig_spark.update_layout(
-                        title=dict(text=f"{feature_label(feat)} (Z = {latest_z:+.2f})", font=dict(size=12)),
-                        height=120,
-                        margin=dict(l=10, r=10, t=30, b=10),
-                        xaxis=dict(showticklabels=False, showgrid=False),
-                        yaxis=dict(showticklabels=True, showgrid=True, tickfont=dict(size=9)),
-                        showlegend=False,
-                    )
-                    st.plotly_chart(fig_spark, width="stretch")
-                else:
-                    st.caption(f"{feature_label(feat)}: insufficient data")
+    # Sparklines are the page's heaviest panel (a z-score history scan plus a
+    # cached subplot figure), so they are only built on request
+    if st.toggle("Show feature trends", key="drivers_show_trends"):
+        _render_trends(ticker, end_date, labels)
     else:
-        st.caption("Need at least 3 cached dates for trend sparklines. Run diagnostics for more dates.")
+        st.caption("Turn on to load per-feature z-score sparklines.")
 
     # --- Excluded / unweighted features ---
-    if nan_features:
+    if bd.excluded:
         st.markdown("---")
         st.markdown("### Excluded Features (NaN)")
-        for f in nan_features:
-            st.text(f"  {f['label']}: insufficient baseline data")
+        st.text("\n".join(f"  {f['label']}: insufficient baseline data" for f in bd.excluded))
 
-    if unweighted_features:
+    if bd.unweighted:
         st.markdown("---")
         st.markdown("### Informational Features (unweighted)")
         st.caption("These features are computed but do not contribute to the unusualness score.")
-        for f in unweighted_features:
-            st.text(f"  {f['label']}: Z = {f['z_score']:+.2f}")
+        st.text("\n".join(f"  {f['label']}: Z = {f['z_score']:+.2f}" for f in bd.unweighted))
 
     # --- FOCUS Z-Score Cross-Reference (CORE tickers only) ---
     if ticker in CORE_TICKERS:
@@ -214,54 +363,26 @@ def render(ticker: str, end_date: date) -> None:
             )
 
             # Weighted features only (the 5 scoring features)
-            scored_features = sorted(weights.keys())
+            scored_features = get_scored_features()
 
             # Build comparison table: rows = features, columns = tickers
-            header_cols = st.columns([3] + [2] * min(len(focus_with_z) + 1, 8))
-            with header_cols[0]:
-                st.markdown("**Feature**")
-            # Show the CORE ticker first
-            col_idx = 1
-            with header_cols[col_idx]:
-                st.markdown(f"**{ticker}**")
-            col_idx += 1
-
-            # Then FOCUS tickers (limit to 6 to avoid cramming)
+            # (CORE ticker first, then up to 6 FOCUS tickers)
             display_focus = focus_with_z[:6]
-            for fd in display_focus:
-                if col_idx < len(header_cols):
-                    with header_cols[col_idx]:
-                        st.markdown(f"**{fd['ticker']}**")
-                    col_idx += 1
-
-            # Rows for each scored feature
-            for feat in scored_features:
-                row_cols = st.columns([3] + [2] * min(len(focus_with_z) + 1, 8))
-                with row_cols[0]:
-                    st.text(feature_label(feat))
-
-                # CORE ticker value
-                col_idx = 1
-                core_z = diag.z_scores.get(feat)
-                if core_z is not None and not (isinstance(core_z, float) and math.isnan(core_z)):
-                    with row_cols[col_idx]:
-                        st.text(f"{core_z:+.2f}")
-                else:
-                    with row_cols[col_idx]:
-                        st.text("NaN")
-                col_idx += 1
-
-                # FOCUS ticker values
-                for fd in display_focus:
-                    if col_idx < len(row_cols):
-                        z = fd["z_scores"].get(feat) if fd["z_scores"] else None
-                        if z is not None and not (isinstance(z, float) and math.isnan(z)):
-                            with row_cols[col_idx]:
-                                st.text(f"{z:+.2f}")
-                        else:
-                            with row_cols[col_idx]:
-                                st.text("NaN")
-                        col_idx += 1
+            z_maps = [diag.z_scores, *(fd["z_scores"] for fd in display_focus)]
+            z_grid = np.full((len(scored_features), len(z_maps)), np.nan)
+            for col, z_map in enumerate(z_maps):
+                z_grid[:, col] = [z_map.get(f, np.nan) for f in scored_features]
+            ticker_cols = [ticker, *(fd["ticker"] for fd in display_focus)]
+
+            grid = pd.DataFrame(z_grid, columns=ticker_cols)
+            grid.insert(0, "Feature", [labels[f] for f in scored_features])
+            # One styled table: numbers stay numeric, sign shown by colour
+            styled = (
+                grid.style
+                .format("{:+.2f}", subset=ticker_cols, na_rep="NaN")
+                .map(_z_cell_style, subset=ticker_cols)
+            )
+            st.dataframe(styled, width="stretch", hide_index=True)
 
             if len(focus_with_z) > 6:
                 st.caption(f"Showing 6 of {len(focus_with_z)} FOCUS tickers with z-scores.")
@@ -1,13 +1,17 @@
 """Historical Regimes page - Regime timeline and transitions."""
 
+from html import escape
+
 import streamlit as st
 from datetime import date
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 
 from obsidian.dashboard.data import (
     get_available_tickers,
     get_historical_diagnostics,
+    get_historical_diagnostics_many,
     get_focus_diagnostics,
     regime_badge_html,
 )
@@ -38,78 +42,96 @@ _REGIME_COLORS = {
 
 _REGIME_LABELS = {r: r.value for r in _REGIME_ORDER}
 
+# Labels and colours in _REGIME_ORDER, indexed by regime_num
+_LABELS_LIST = tuple(_REGIME_LABELS[r] for r in _REGIME_ORDER)
+_COLORS_LIST = tuple(_REGIME_COLORS[r] for r in _REGIME_ORDER)
 
-def render(ticker: str, start_date: date, end_date: date) -> None:
-    """Render the Historical Regimes page.
-
-    Args:
-        ticker: Instrument ticker symbol
-        start_date: Start of analysis window
-        end_date: End of analysis window
-    """
-    st.markdown("## Historical Regimes")
-    st.markdown(f"**{ticker}** -- {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+# Lookup arrays indexed by regime_num
+_LABELS_ARRAY = np.asarray(_LABELS_LIST, dtype=object)
+_COLORS_ARRAY = np.asarray(_COLORS_LIST, dtype=object)
 
-    with st.expander("How to read this page"):
-        st.markdown("""
-**Historical Regimes** shows how the microstructure regime has evolved over time.
+# Coloured regime name and one row of the recent-transitions list
+_REGIME_SPANS = tuple(
+    f'<span style="color: {color}; font-weight: 600;">{label}</span>'
+    for label, color in zip(_LABELS_LIST, _COLORS_LIST)
+)
+_TRANSITION_ROW_TEMPLATE = (
+    '<div style="padding: 0.5rem; margin: 0.25rem 0; background-color: #f0f2f6; border-radius: 0.3rem;">'
+    '{from_span} -> {to_span}'
+    '<span style="float: right; color: #666;">{date}</span>'
+    '</div>'
+)
 
-- **Timeline** — each dot is one day, colored by regime. Clusters of the same color = persistent regime.
-- **Distribution** — how often each regime appeared in the selected window.
-- **Transitions** — when the regime flipped (e.g., NEU to Γ⁻). Frequent flips = unstable microstructure.
-- **Transition Matrix** — probability of moving from one regime to another. Useful for recognizing sticky vs transient patterns.
-- **FOCUS Snapshot** — (CORE tickers only) shows the current regime of structural FOCUS tickers for context.
+# Calendar days the window must span for the all-ticker heatmap, and date
+# columns above which it is binned by week
+_HEATMAP_MIN_DAYS = 2
+_HEATMAP_MAX_COLUMNS = 300
+
+# Discrete colorscale: each regime_num maps to one flat colour band. The
+# z range is padded by half a step so each integer lands mid-band rather
+# than on the boundary between two colours.
+_HEATMAP_COLORSCALE = tuple(
+    (edge / len(_REGIME_ORDER), color)
+    for i, color in enumerate(_COLORS_LIST)
+    for edge in (i, i + 1)
+)
+_HEATMAP_ZRANGE = (-0.5, len(_REGIME_ORDER) - 0.5)
 
-Regimes are classified daily using **deterministic rules** (not ML). They are mutually exclusive — exactly one regime per day.
-        """)
+_HEATMAP_LEGEND_HTML = " &nbsp; ".join(
+    f'<span style="background-color:{color}; color:white; '
+    f'padding:2px 8px; border-radius:10px; font-size:0.8rem;">'
+    f'{label}</span>'
+    for label, color in zip(_LABELS_LIST, _COLORS_LIST)
+)
 
-    history = get_historical_diagnostics(ticker, start_date, end_date)
+_SNAPSHOT_TABLE_TEMPLATE = (
+    '<table class="focus-table">'
+    "<thead><tr><th>Ticker</th><th>Reason</th><th>Regime</th>"
+    "<th>U percentile</th></tr></thead>"
+    "<tbody>{rows}</tbody></table>"
+)
+_SNAPSHOT_ROW_TEMPLATE = (
+    '<tr class="{cls}"><td>{ticker}</td><td>{reason}</td>'
+    "<td>{badge}</td><td>{score}</td></tr>"
+)
 
-    if not history:
-        st.info(
-            "No historical diagnostics cached for this range. "
-            "Run diagnostics for multiple dates to populate the timeline."
-        )
-        return
 
-    # Build dataframe from cached results
-    rows = []
-    for d, diag in sorted(history.items()):
-        rows.append({
-            "date": d,
-            "regime": diag.regime,
-            "regime_label": _REGIME_LABELS.get(diag.regime, diag.regime.value),
-            "score_raw": diag.score_raw,
-            "score_pct": diag.score_percentile,
-        })
-
-    df = pd.DataFrame(rows)
-    regime_to_num = {r: i for i, r in enumerate(_REGIME_ORDER)}
-    df["regime_num"] = df["regime"].map(regime_to_num)
+# Figure builders are cached per input and never mutated afterwards, so
+# reruns and other sessions viewing the same data reuse the figure.
+# Inputs are arrays/tuples rather than DataFrames: Streamlit hashes frames
+# by values and dtypes only, which would ignore index and column labels.
 
-    # --- Regime Timeline Chart ---
-    st.markdown("### Regime Timeline")
+@st.cache_resource(max_entries=64)
+def _timeline_figure(dates: np.ndarray, regime_nums: np.ndarray) -> go.Figure:
+    """Build the regime timeline chart.
 
+    One WebGL trace coloured per point; zero-point traces carry the
+    legend entries for the regimes present.
+    """
     fig = go.Figure()
-    for regime in _REGIME_ORDER:
-        regime_df = df[df["regime"] == regime]
-        if regime_df.empty:
-            continue
-        label = _REGIME_LABELS[regime]
+    fig.add_trace(go.Scattergl(
+        x=dates,
+        y=regime_nums,
+        mode='markers',
+        marker=dict(size=10, color=_COLORS_ARRAY[regime_nums], symbol='square'),
+        hovertext=_LABELS_ARRAY[regime_nums],
+        hovertemplate="%{hovertext}<br>%{x}<extra></extra>",
+        showlegend=False,
+    ))
+    for num in np.unique(regime_nums):
         fig.add_trace(go.Scatter(
-            x=regime_df["date"],
-            y=regime_df["regime_num"],
+            x=[None],
+            y=[None],
             mode='markers',
-            marker=dict(size=10, color=_REGIME_COLORS[regime], symbol='square'),
-            name=label,
-            hovertemplate=f"{label}<br>%{{x}}<extra></extra>",
+            marker=dict(size=10, color=_COLORS_LIST[num], symbol='square'),
+            name=_LABELS_LIST[num],
         ))
 
     fig.update_layout(
         yaxis=dict(
             tickmode='array',
             tickvals=list(range(len(_REGIME_ORDER))),
-            ticktext=[_REGIME_LABELS[r] for r in _REGIME_ORDER],
+            ticktext=_LABELS_LIST,
             title="Regime",
         ),
         xaxis=dict(title="Date"),
@@ -118,163 +140,176 @@ Regimes are classified daily using **deterministic rules** (not ML). They are mu
         showlegend=True,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
     )
-    st.plotly_chart(fig, width="stretch")
+    return fig
 
-    st.markdown("---")
 
-    # --- Unusualness Score Timeline ---
-    st.markdown("### Unusualness Score Timeline")
-
-    score_df = df[df["score_pct"].notna()].copy()
-    if not score_df.empty:
-        fig_score = go.Figure()
-
-        # Plot each regime as separate trace for colored markers
-        for regime in _REGIME_ORDER:
-            rdf = score_df[score_df["regime"] == regime]
-            if rdf.empty:
-                continue
-            fig_score.add_trace(go.Scatter(
-                x=rdf["date"],
-                y=rdf["score_pct"],
-                mode="lines+markers",
-                marker=dict(size=7, color=_REGIME_COLORS[regime]),
-                line=dict(color=_REGIME_COLORS[regime], width=1),
-                name=_REGIME_LABELS[regime],
-                hovertemplate="%{x}<br>U = %{y:.1f}<extra>" + _REGIME_LABELS[regime] + "</extra>",
-            ))
-
-        # Threshold lines
-        for thresh, color, label in [
-            (30, "#9E9E9E", "Normal"),
-            (60, "#FF9800", "Elevated"),
-            (80, "#f44336", "Extreme"),
-        ]:
-            fig_score.add_hline(
-                y=thresh, line_dash="dash", line_color=color, opacity=0.5,
-                annotation_text=label, annotation_position="top left",
-            )
+@st.cache_resource(max_entries=64)
+def _score_figure(
+    dates: np.ndarray,
+    scores: np.ndarray,
+    regime_nums: np.ndarray,
+) -> go.Figure:
+    """Build the unusualness score timeline with threshold lines."""
+    fig = go.Figure()
 
-        fig_score.update_layout(
-            yaxis=dict(title="U percentile", range=[0, 105]),
-            xaxis=dict(title="Date"),
-            height=350,
-            showlegend=False,
-            hovermode="closest",
+    # One trace in date order; markers coloured by regime
+    fig.add_trace(go.Scattergl(
+        x=dates,
+        y=scores,
+        mode="lines+markers",
+        marker=dict(size=7, color=_COLORS_ARRAY[regime_nums]),
+        line=dict(color="#BDBDBD", width=1),
+        hovertext=_LABELS_ARRAY[regime_nums],
+        hovertemplate="%{x}<br>U = %{y:.1f}<extra>%{hovertext}</extra>",
+    ))
+
+    # Threshold lines
+    for thresh, color, label in [
+        (30, "#9E9E9E", "Normal"),
+        (60, "#FF9800", "Elevated"),
+        (80, "#f44336", "Extreme"),
+    ]:
+        fig.add_hline(
+            y=thresh, line_dash="dash", line_color=color, opacity=0.5,
+            annotation_text=label, annotation_position="top left",
         )
-        st.plotly_chart(fig_score, width="stretch")
-    else:
-        st.caption("No score data available for timeline.")
-
-    st.markdown("---")
 
-    # --- Regime Distribution ---
-    st.markdown("### Regime Distribution")
+    fig.update_layout(
+        yaxis=dict(title="U percentile", range=[0, 105]),
+        xaxis=dict(title="Date"),
+        height=350,
+        showlegend=False,
+        hovermode="closest",
+    )
+    return fig
 
-    regime_counts = df["regime_label"].value_counts()
-    all_labels = [_REGIME_LABELS[r] for r in _REGIME_ORDER]
-    regime_counts = regime_counts.reindex(all_labels, fill_value=0)
 
-    fig_dist = go.Figure(data=[go.Bar(
-        x=regime_counts.index,
-        y=regime_counts.values,
-        marker=dict(color=[_REGIME_COLORS[r] for r in _REGIME_ORDER]),
+@st.cache_resource(max_entries=64)
+def _distribution_figure(counts: tuple[int, ...]) -> go.Figure:
+    """Build the regime distribution bar chart (counts in _REGIME_ORDER)."""
+    fig = go.Figure(data=[go.Bar(
+        x=_LABELS_LIST,
+        y=counts,
+        marker=dict(color=_COLORS_LIST),
     )])
-    fig_dist.update_layout(
+    fig.update_layout(
         xaxis_title="Regime", yaxis_title="Days", height=300, showlegend=False,
     )
-    st.plotly_chart(fig_dist, width="stretch")
+    return fig
+
+
+@st.cache_resource(max_entries=64)
+def _transition_figure(counts: np.ndarray) -> go.Figure:
+    """Build the transition matrix heatmap from a from × to count matrix."""
+    probs = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    fig = go.Figure(data=go.Heatmap(
+        z=probs,
+        x=_LABELS_LIST,
+        y=_LABELS_LIST,
+        colorscale='Blues',
+        text=counts,
+        texttemplate='%{text}',
+        textfont={"size": 10},
+        hovertemplate='From %{y} to %{x}<br>Count: %{text}<br>Prob: %{z:.0%}<extra></extra>',
+    ))
+    fig.update_layout(
+        xaxis_title="To Regime", yaxis_title="From Regime", height=400,
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=32)
+def _heatmap_figure(
+    tickers: tuple[str, ...],
+    dates: tuple[str, ...],
+    z: np.ndarray,
+) -> go.Figure:
+    """Build the all-ticker regime heatmap from a ticker × date regime_num grid."""
+    missing = np.isnan(z)
+    text = _LABELS_ARRAY[np.where(missing, 0, z).astype(int)]
+    text[missing] = None
+
+    fig = go.Figure(data=go.Heatmap(
+        z=z,
+        x=dates,
+        y=tickers,
+        colorscale=_HEATMAP_COLORSCALE,
+        zmin=_HEATMAP_ZRANGE[0],
+        zmax=_HEATMAP_ZRANGE[1],
+        text=text,
+        hovertemplate="%{y}<br>%{x}<br>%{text}<extra></extra>",
+        showscale=False,
+    ))
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Ticker",
+        height=max(300, len(tickers) * 30),
+    )
+    return fig
 
-    total_days = len(df)
-    cols = st.columns(len(_REGIME_ORDER))
-    for i, regime in enumerate(_REGIME_ORDER):
-        label = _REGIME_LABELS[regime]
-        count = regime_counts.get(label, 0)
-        pct = (count / total_days * 100) if total_days > 0 else 0
-        with cols[i]:
-            st.metric(label, f"{pct:.0f}%", f"{count} days")
 
-    st.markdown("---")
+def _render_dwell_time(df: pd.DataFrame) -> None:
+    """Render per-regime average and maximum run lengths.
 
-    # --- Regime Dwell Time ---
+    Args:
+        df: Daily regimes for the viewed ticker, sorted by date
+    """
     st.markdown("### Regime Dwell Time")
 
-    # Compute consecutive runs of same regime
-    runs: list[tuple[RegimeType, int]] = []
-    current_regime = None
-    current_length = 0
-    for d in sorted(history.keys()):
-        r = history[d].regime
-        if r == current_regime:
-            current_length += 1
-        else:
-            if current_regime is not None:
-                runs.append((current_regime, current_length))
-            current_regime = r
-            current_length = 1
-    if current_regime is not None:
-        runs.append((current_regime, current_length))
-
-    # Aggregate per regime
-    from collections import defaultdict
-    regime_runs: dict[RegimeType, list[int]] = defaultdict(list)
-    for regime, length in runs:
-        regime_runs[regime].append(length)
-
-    # Display only regimes that appeared
-    present_regimes = [r for r in _REGIME_ORDER if r in regime_runs]
-    if present_regimes:
-        dwell_cols = st.columns(len(present_regimes))
-        for i, regime in enumerate(present_regimes):
-            lengths = regime_runs[regime]
-            avg_len = sum(lengths) / len(lengths)
-            max_len = max(lengths)
-            with dwell_cols[i]:
+    # Run-length encode: a new run starts wherever the regime changes
+    regime_num = df["regime_num"]
+    run_id = (regime_num != regime_num.shift()).cumsum()
+    runs = regime_num.groupby(run_id, sort=False).agg(["first", "size"])
+    dwell = runs.groupby("first")["size"].agg(avg="mean", longest="max")
+
+    # Display only regimes that appeared, in _REGIME_ORDER
+    if not dwell.empty:
+        dwell_cols = st.columns(len(dwell))
+        for col, row in zip(dwell_cols, dwell.itertuples()):
+            with col:
                 st.metric(
-                    _REGIME_LABELS[regime],
-                    f"{avg_len:.1f}d avg",
-                    f"max: {max_len}d",
+                    _LABELS_LIST[row.Index],
+                    f"{row.avg:.1f}d avg",
+                    f"max: {row.longest}d",
                 )
     else:
         st.caption("No dwell time data available.")
 
-    st.markdown("---")
 
-    # --- Transition Analysis ---
+def _render_transitions(df: pd.DataFrame) -> None:
+    """Render the recent transitions list and the transition matrix.
+
+    Args:
+        df: Daily regimes for the viewed ticker, sorted by date
+    """
     st.markdown("### Regime Transitions")
 
-    transitions = []
-    sorted_dates = sorted(history.keys())
-    for i in range(len(sorted_dates) - 1):
-        d_from = sorted_dates[i]
-        d_to = sorted_dates[i + 1]
-        r_from = history[d_from].regime
-        r_to = history[d_to].regime
-        if r_from != r_to:
-            transitions.append({
-                "date": d_to,
-                "from": _REGIME_LABELS[r_from],
-                "to": _REGIME_LABELS[r_to],
-                "from_regime": r_from,
-                "to_regime": r_to,
-            })
-
-    if transitions:
+    prev = df["regime"].shift()
+    changed = prev.notna() & (df["regime"] != prev)
+    transitions = pd.DataFrame({
+        "date": df["date"][changed],
+        "from_num": prev[changed].cat.codes,
+        "to_num": df["regime_num"][changed],
+    })
+
+    if not transitions.empty:
         st.markdown(f"**{len(transitions)} transitions detected**")
-        for trans in reversed(transitions[-10:]):
-            from_color = _REGIME_COLORS[trans["from_regime"]]
-            to_color = _REGIME_COLORS[trans["to_regime"]]
-            st.markdown(
-                f'<div style="padding: 0.5rem; margin: 0.25rem 0; background-color: #f0f2f6; border-radius: 0.3rem;">'
-                f'<span style="color: {from_color}; font-weight: 600;">{trans["from"]}</span>'
-                f' -> '
-                f'<span style="color: {to_color}; font-weight: 600;">{trans["to"]}</span>'
-                f'<span style="float: right; color: #666;">{trans["date"].strftime("%Y-%m-%d")}</span>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
+        recent = transitions.tail(10).iloc[::-1]
+        # One markdown element for the whole list, not one per row
+        _row = _TRANSITION_ROW_TEMPLATE.format
+        st.markdown(
+            "".join(
+                _row(
+                    from_span=_REGIME_SPANS[from_num],
+                    to_span=_REGIME_SPANS[to_num],
+                    date=d.strftime("%Y-%m-%d"),
+                )
+                for d, from_num, to_num in recent.itertuples(index=False)
+            ),
+            unsafe_allow_html=True,
+        )
     else:
-        if len(sorted_dates) < 2:
+        if len(df) < 2:
             st.info("Need at least 2 dates of diagnostics to detect transitions.")
         else:
             st.info("No regime transitions in selected period.")
@@ -282,140 +317,248 @@ Regimes are classified daily using **deterministic rules** (not ML). They are mu
     st.markdown("---")
 
     # --- Transition Matrix ---
-    if transitions:
+    if not transitions.empty:
         st.markdown("### Transition Matrix")
         st.caption("Rows = from, Columns = to")
 
-        all_labels_list = [_REGIME_LABELS[r] for r in _REGIME_ORDER]
-        transition_matrix = pd.DataFrame(0, index=all_labels_list, columns=all_labels_list)
-        for trans in transitions:
-            transition_matrix.loc[trans["from"], trans["to"]] += 1
-
-        transition_probs = transition_matrix.div(
-            transition_matrix.sum(axis=1).replace(0, 1), axis=0
+        # Count (from, to) pairs in one pass over flattened cell indices
+        n = len(_REGIME_ORDER)
+        cells = (
+            transitions["from_num"].to_numpy(np.intp) * n
+            + transitions["to_num"].to_numpy(np.intp)
         )
+        transition_matrix = np.bincount(cells, minlength=n * n).reshape(n, n)
 
-        fig_heatmap = go.Figure(data=go.Heatmap(
-            z=transition_probs.values,
-            x=transition_probs.columns,
-            y=transition_probs.index,
-            colorscale='Blues',
-            text=transition_matrix.values,
-            texttemplate='%{text}',
-            textfont={"size": 10},
-            hovertemplate='From %{y} to %{x}<br>Count: %{text}<br>Prob: %{z:.0%}<extra></extra>',
-        ))
-        fig_heatmap.update_layout(
-            xaxis_title="To Regime", yaxis_title="From Regime", height=400,
-        )
-        st.plotly_chart(fig_heatmap, width="stretch")
+        st.plotly_chart(_transition_figure(transition_matrix), width="stretch")
+
+
+def _weekly_mode(hm_df: pd.DataFrame) -> pd.DataFrame:
+    """Collapse heatmap rows to one per ticker and week.
+
+    Each (ticker, week) keeps its most frequent regime; ties go to the
+    regime listed first in _REGIME_ORDER. The date column becomes the
+    Monday of each week.
+
+    Args:
+        hm_df: Heatmap rows with ticker, date, regime_num
+
+    Returns:
+        Heatmap rows with the same columns, unique per (ticker, date)
+    """
+    week = pd.to_datetime(hm_df["date"]).dt.to_period("W").dt.start_time.dt.date
+    counts = (
+        hm_df.assign(date=week)
+        .groupby(["ticker", "date", "regime_num"])
+        .size()
+        .reset_index(name="days")
+    )
+    return (
+        counts.sort_values("days", ascending=False, kind="stable")
+        .drop_duplicates(["ticker", "date"])
+        .drop(columns="days")
+    )
+
+
+@st.fragment
+def _render_heatmap(start_date: date, end_date: date) -> None:
+    """Render the regime heatmap across every ticker with cached diagnostics.
+
+    Args:
+        start_date: Start of analysis window
+        end_date: End of analysis window
+    """
+    st.markdown("---")
+    st.markdown("### Regime Heatmap (all tickers)")
+
+    # A single-day window is a one-column heatmap; skip the scan entirely
+    if (end_date - start_date).days + 1 < _HEATMAP_MIN_DAYS:
+        st.caption("Select a range of at least two days to compare tickers over time.")
+        return
+
+    # Scans every ticker's history, so it is only built on request; the
+    # toggle sits inside this fragment and reruns only the heatmap
+    if not st.toggle("Show all-tickers heatmap", key="history_show_heatmap"):
+        st.caption("Turn on to load every ticker's regimes for this range.")
+        return
 
-    # --- Regime Heatmap (all tickers) ---
     all_tickers = get_available_tickers()
-    heatmap_data: list[tuple[str, date, int, str]] = []  # (ticker, date, regime_num, label)
+    all_history = get_historical_diagnostics_many(all_tickers, start_date, end_date)
+
+    # Long frame straight from the bulk lookup; regime indices are
+    # mapped column-wise rather than per row
+    hm_df = pd.DataFrame(
+        [
+            (t, d, diag.regime)
+            for t, t_hist in all_history.items()
+            for d, diag in t_hist.items()
+        ],
+        columns=["ticker", "date", "regime"],
+    )
+    hm_df["regime_num"] = pd.Categorical(
+        hm_df.pop("regime"), categories=_REGIME_ORDER,
+    ).codes
+    hm_df = hm_df[hm_df["regime_num"] >= 0]
 
-    for t in all_tickers:
-        t_hist = get_historical_diagnostics(t, start_date, end_date)
-        for d, diag in t_hist.items():
-            num = regime_to_num.get(diag.regime)
-            if num is not None:
-                heatmap_data.append((t, d, num, _REGIME_LABELS.get(diag.regime, "?")))
+    if len(hm_df) < 4:
+        st.caption("Need more ticker/date combinations for heatmap. Run diagnostics for more dates.")
+        return
+
+    st.caption("Each cell shows one ticker's regime on one day.")
+    if hm_df["date"].nunique() > _HEATMAP_MAX_COLUMNS:
+        hm_df = _weekly_mode(hm_df)
+        st.caption("Long range: each cell shows the most frequent regime of the week.")
+    # Rows are unique per (ticker, date), so a plain pivot suffices
+    hm_pivot = hm_df.pivot(index="ticker", columns="date", values="regime_num")
+    st.plotly_chart(
+        _heatmap_figure(
+            tuple(hm_pivot.index),
+            tuple(d.strftime("%Y-%m-%d") for d in hm_pivot.columns),
+            hm_pivot.to_numpy(dtype=float),
+        ),
+        width="stretch",
+    )
+    st.markdown(_HEATMAP_LEGEND_HTML, unsafe_allow_html=True)
 
-    if len(heatmap_data) >= 4:
-        st.markdown("---")
-        st.markdown("### Regime Heatmap (all tickers)")
-        st.caption("Each cell shows one ticker's regime on one day.")
 
-        hm_df = pd.DataFrame(heatmap_data, columns=["ticker", "date", "regime_num", "regime_label"])
-        hm_pivot = hm_df.pivot_table(
-            index="ticker", columns="date", values="regime_num", aggfunc="first",
+def _render_focus_snapshot(ticker: str, end_date: date) -> None:
+    """Render current regimes of a CORE ticker's FOCUS entries.
+
+    Args:
+        ticker: CORE ticker symbol being viewed
+        end_date: Date for focus diagnostics
+    """
+    focus_diags = get_focus_diagnostics(end_date, etf=ticker)
+    if focus_diags:
+        st.markdown("---")
+        st.markdown("### FOCUS Regime Snapshot")
+        st.caption(
+            f"Current regimes for {ticker}'s structural FOCUS tickers "
+            f"(plus stress/event entries)."
         )
-        # Label pivot for hover
-        hm_labels = hm_df.pivot_table(
-            index="ticker", columns="date", values="regime_label", aggfunc="first",
+
+        # One HTML table instead of a row of columns per ticker;
+        # structural entries bold
+        _row = _SNAPSHOT_ROW_TEMPLATE.format
+        rows = [
+            _row(
+                cls="focus-row-etf" if fd["reason"] == "structural" else "focus-row",
+                ticker=escape(fd["ticker"]),
+                reason=escape(fd["reason"]),
+                badge=regime_badge_html(fd["regime_label"]),
+                score=(
+                    f"{fd['score_percentile']:.1f}"
+                    if fd["score_percentile"] is not None else "—"
+                ),
+            )
+            for fd in focus_diags
+        ]
+        st.markdown(
+            _SNAPSHOT_TABLE_TEMPLATE.format(rows="".join(rows)),
+            unsafe_allow_html=True,
         )
 
-        # Build discrete colorscale (0-6 → 7 regime colors)
-        n_regimes = len(_REGIME_ORDER)
-        colorscale = []
-        for i, regime in enumerate(_REGIME_ORDER):
-            lo = i / n_regimes
-            hi = (i + 1) / n_regimes
-            color = _REGIME_COLORS[regime]
-            colorscale.append([lo, color])
-            colorscale.append([hi, color])
-
-        fig_heatmap = go.Figure(data=go.Heatmap(
-            z=hm_pivot.values,
-            x=[d.strftime("%Y-%m-%d") for d in hm_pivot.columns],
-            y=hm_pivot.index.tolist(),
-            colorscale=colorscale,
-            zmin=0,
-            zmax=n_regimes,
-            text=hm_labels.reindex(index=hm_pivot.index, columns=hm_pivot.columns).values,
-            hovertemplate="%{y}<br>%{x}<br>%{text}<extra></extra>",
-            showscale=False,
-        ))
 
-        fig_heatmap.update_layout(
-            xaxis_title="Date",
-            yaxis_title="Ticker",
-            height=max(300, len(hm_pivot) * 30),
+def render(ticker: str, start_date: date, end_date: date) -> None:
+    """Render the Historical Regimes page.
+
+    Args:
+        ticker: Instrument ticker symbol
+        start_date: Start of analysis window
+        end_date: End of analysis window
+    """
+    st.markdown("## Historical Regimes")
+    st.markdown(f"**{ticker}** -- {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+
+    with st.expander("How to read this page"):
+        st.markdown("""
+**Historical Regimes** shows how the microstructure regime has evolved over time.
+
+- **Timeline** — each dot is one day, colored by regime. Clusters of the same color = persistent regime.
+- **Distribution** — how often each regime appeared in the selected window.
+- **Transitions** — when the regime flipped (e.g., NEU to Γ⁻). Frequent flips = unstable microstructure.
+- **Transition Matrix** — probability of moving from one regime to another. Useful for recognizing sticky vs transient patterns.
+- **FOCUS Snapshot** — (CORE tickers only) shows the current regime of structural FOCUS tickers for context.
+
+Regimes are classified daily using **deterministic rules** (not ML). They are mutually exclusive — exactly one regime per day.
+        """)
+
+    history = get_historical_diagnostics(ticker, start_date, end_date)
+
+    if not history:
+        st.info(
+            "No historical diagnostics cached for this range. "
+            "Run diagnostics for multiple dates to populate the timeline."
         )
-        st.plotly_chart(fig_heatmap, width="stretch")
-
-        # Legend
-        legend_items = " &nbsp; ".join(
-            f'<span style="background-color:{_REGIME_COLORS[r]}; color:white; '
-            f'padding:2px 8px; border-radius:10px; font-size:0.8rem;">'
-            f'{_REGIME_LABELS[r]}</span>'
-            for r in _REGIME_ORDER
+        return
+
+    # Build dataframe column-wise from cached results; history is already
+    # in ascending date order, which every section below relies on
+    days = list(history)
+    diags = [history[d] for d in days]
+    df = pd.DataFrame({
+        "date": days,
+        "regime": pd.Categorical(
+            [diag.regime for diag in diags], categories=_REGIME_ORDER, ordered=True,
+        ),
+        "score_pct": np.fromiter(
+            (
+                np.nan if diag.score_percentile is None else diag.score_percentile
+                for diag in diags
+            ),
+            dtype=np.float64,
+            count=len(diags),
+        ),
+    })
+    # Categorical codes are the _REGIME_ORDER index (int8, no per-row lookup)
+    df["regime_num"] = df["regime"].cat.codes
+    dates = np.asarray(df["date"], dtype="datetime64[D]")
+    regime_nums = df["regime_num"].to_numpy()
+
+    # --- Regime Timeline Chart ---
+    st.markdown("### Regime Timeline")
+    st.plotly_chart(_timeline_figure(dates, regime_nums), width="stretch")
+
+    st.markdown("---")
+
+    # --- Unusualness Score Timeline ---
+    st.markdown("### Unusualness Score Timeline")
+
+    scores = df["score_pct"].to_numpy()
+    has_score = ~np.isnan(scores)
+    if has_score.any():
+        fig_score = _score_figure(
+            dates[has_score], scores[has_score], regime_nums[has_score],
         )
-        st.markdown(legend_items, unsafe_allow_html=True)
-    elif heatmap_data:
-        st.markdown("---")
-        st.markdown("### Regime Heatmap (all tickers)")
-        st.caption("Need more ticker/date combinations for heatmap. Run diagnostics for more dates.")
+        st.plotly_chart(fig_score, width="stretch")
+    else:
+        st.caption("No score data available for timeline.")
 
-    # --- FOCUS Regime Snapshot (CORE tickers only) ---
-    if ticker in CORE_TICKERS:
-        focus_diags = get_focus_diagnostics(end_date, etf=ticker)
-        if focus_diags:
-            st.markdown("---")
-            st.markdown("### FOCUS Regime Snapshot")
-            st.caption(
-                f"Current regimes for {ticker}'s structural FOCUS tickers "
-                f"(plus stress/event entries)."
-            )
+    st.markdown("---")
+
+    # --- Regime Distribution ---
+    st.markdown("### Regime Distribution")
+
+    regime_counts = np.bincount(regime_nums, minlength=len(_REGIME_ORDER))
+    st.plotly_chart(_distribution_figure(tuple(regime_counts.tolist())), width="stretch")
+
+    total_days = len(df)
+    cols = st.columns(len(_REGIME_ORDER))
+    for col, label, count in zip(cols, _LABELS_LIST, regime_counts):
+        pct = (count / total_days * 100) if total_days > 0 else 0
+        with col:
+            st.metric(label, f"{pct:.0f}%", f"{count} days")
+
+    st.markdown("---")
 
-            # Build compact regime grid
-            col_t, col_r, col_regime, col_score = st.columns([2, 2, 3, 2])
-            with col_t:
-                st.markdown("**Ticker**")
-            with col_r:
-                st.markdown("**Reason**")
-            with col_regime:
-                st.markdown("**Regime**")
-            with col_score:
-                st.markdown("**U percentile**")
-
-            for fd in focus_diags:
-                col_t, col_r, col_regime, col_score = st.columns([2, 2, 3, 2])
-
-                badge = regime_badge_html(fd["regime_label"])
-                score_text = f"{fd['score_percentile']:.1f}" if fd["score_percentile"] is not None else "—"
-
-                with col_t:
-                    if fd["reason"] == "structural":
-                        st.markdown(f"**{fd['ticker']}**")
-                    else:
-                        st.text(fd["ticker"])
-                with col_r:
-                    st.text(fd["reason"])
-                with col_regime:
-                    st.markdown(badge, unsafe_allow_html=True)
-                with col_score:
-                    st.text(score_text)
+    _render_dwell_time(df)
+
+    st.markdown("---")
+
+    _render_transitions(df)
+    _render_heatmap(start_date, end_date)
+
+    if ticker in CORE_TICKERS:
+        _render_focus_snapshot(ticker, end_date)
 
     st.caption(
         "**Note**: Historical data is populated as you run diagnostics for different dates. "
@@ -1,16 +1,17 @@
 """Overview page - All tickers at a glance."""
 
-import math
+from html import escape
 
 import streamlit as st
 from datetime import date
 
 from obsidian.dashboard.data import (
     get_available_tickers,
-    get_cached_diagnostic,
+    get_cached_diagnostics,
+    get_dates_with_diagnostics,
     get_focus_entries,
     get_feature_weights,
-    feature_label,
+    get_top_driver,
     regime_badge_html,
 )
 from obsidian.universe.manager import CORE_TICKERS
@@ -29,21 +30,6 @@ def _score_color(pct: float | None) -> str:
     return "#4CAF50"
 
 
-def _top_driver(diag) -> str:
-    """Return the label of the feature with highest |Z|."""
-    if not diag or not diag.z_scores:
-        return "—"
-    best_feat = None
-    best_abs = -1.0
-    for feat, z in diag.z_scores.items():
-        if isinstance(z, float) and math.isnan(z):
-            continue
-        if abs(z) > best_abs:
-            best_abs = abs(z)
-            best_feat = feat
-    return feature_label(best_feat) if best_feat else "—"
-
-
 def _sort_key(item: tuple[str, object]) -> tuple[float, str]:
     """Sort by U percentile descending. None goes to bottom."""
     _, diag = item
@@ -52,61 +38,65 @@ def _sort_key(item: tuple[str, object]) -> tuple[float, str]:
     return (diag.score_percentile, item[0])
 
 
-def _render_ticker_table(tickers: list[str], diags: dict, header: str) -> None:
+# One HTML table per group instead of a row of st.columns per ticker
+_TICKER_TABLE_TEMPLATE = (
+    '<table class="data-table">'
+    "<thead><tr><th>Ticker</th><th>Regime</th><th>U percentile</th>"
+    "<th>Top Driver</th><th>Baseline</th></tr></thead>"
+    "<tbody>{rows}</tbody></table>"
+)
+_TICKER_ROW_TEMPLATE = (
+    "<tr><td><b>{ticker}</b></td><td>{badge}</td>"
+    "<td><span style='color:{color}; font-weight:600;'>{pct}</span></td>"
+    "<td>{driver}</td><td>{baseline}</td></tr>"
+)
+# No data row — dimmed
+_EMPTY_ROW_TEMPLATE = (
+    "<tr class='focus-row-other'><td>{ticker}</td><td>—</td><td>—</td>"
+    "<td>No data — run diagnostics</td><td>—</td></tr>"
+)
+
+
+def _render_ticker_table(
+    tickers: list[str], diags: dict, header: str, end_date: date,
+) -> None:
     """Render a group of tickers as a styled table."""
     if not tickers:
         return
 
     st.markdown(f"### {header}")
 
-    # Header row
-    hdr = st.columns([2, 2, 2, 3, 2])
-    for col, label in zip(hdr, ["**Ticker**", "**Regime**", "**U percentile**", "**Top Driver**", "**Baseline**"]):
-        with col:
-            st.markdown(label)
-
     # Sort: U percentile descending, None at bottom
     items = [(t, diags.get(t)) for t in tickers]
     items.sort(key=_sort_key, reverse=True)
 
+    _row, _empty = _TICKER_ROW_TEMPLATE.format, _EMPTY_ROW_TEMPLATE.format
+    rows = []
     for ticker, diag in items:
-        cols = st.columns([2, 2, 2, 3, 2])
-
         if diag is None:
-            # No data row — dimmed
-            dim = "color:#999"
-            with cols[0]:
-                st.markdown(f"<span style='{dim}'>{ticker}</span>", unsafe_allow_html=True)
-            with cols[1]:
-                st.markdown("<span style='color:#999'>—</span>", unsafe_allow_html=True)
-            with cols[2]:
-                st.markdown("<span style='color:#999'>—</span>", unsafe_allow_html=True)
-            with cols[3]:
-                st.markdown("<span style='color:#999'>No data — run diagnostics</span>", unsafe_allow_html=True)
-            with cols[4]:
-                st.markdown("<span style='color:#999'>—</span>", unsafe_allow_html=True)
+            rows.append(_empty(ticker=escape(ticker)))
             continue
 
-        badge = regime_badge_html(diag.regime_label)
         pct = diag.score_percentile
-        color = _score_color(pct)
-        pct_str = f"{pct:.1f}" if pct is not None else "N/A"
-        driver = _top_driver(diag)
-        baseline = diag.baseline_state or "—"
-
-        with cols[0]:
-            st.markdown(f"**{ticker}**")
-        with cols[1]:
-            st.markdown(badge, unsafe_allow_html=True)
-        with cols[2]:
-            st.markdown(
-                f"<span style='color:{color}; font-weight:600;'>{pct_str}</span>",
-                unsafe_allow_html=True,
-            )
-        with cols[3]:
-            st.text(driver)
-        with cols[4]:
-            st.text(baseline)
+        rows.append(_row(
+            ticker=escape(ticker),
+            badge=regime_badge_html(diag.regime_label),
+            color=_score_color(pct),
+            pct=f"{pct:.1f}" if pct is not None else "N/A",
+            driver=escape(get_top_driver(ticker, end_date)),
+            baseline=escape(diag.baseline_state or "—"),
+        ))
+
+    st.markdown(_TICKER_TABLE_TEMPLATE.format(rows="".join(rows)), unsafe_allow_html=True)
+
+
+def _render_notice() -> None:
+    """Render the closing Data Quality Notice shown on every overview."""
+    st.markdown("---")
+    st.caption(
+        "**Note**: This is a **diagnostic overview**, not a watchlist. "
+        "OBSIDIAN MM classifies microstructure state but makes no claims about future price direction."
+    )
 
 
 def render(end_date: date) -> None:
@@ -132,59 +122,49 @@ Tickers are sorted by U percentile descending — the "hottest" ticker is always
 Tickers without cached data appear dimmed at the bottom.
         """)
 
-    # Gather all diagnostics
-    all_tickers = get_available_tickers()
-    diags = {}
-    for t in all_tickers:
-        diags[t] = get_cached_diagnostic(t, end_date)
-
-    has_any = any(d is not None for d in diags.values())
-
-    if not has_any:
+    # Nothing stored for this date: skip the per-ticker lookups and the
+    # all-dimmed tables
+    if end_date not in get_dates_with_diagnostics():
         st.info(
             "No diagnostic data loaded for any ticker. "
             "Use **Fetch + Run**, **Run (cached)**, or **Full Pipeline** in the sidebar."
         )
+        _render_notice()
+        return
+
+    # Gather all diagnostics
+    all_tickers = get_available_tickers()
+    diags = get_cached_diagnostics(all_tickers, end_date)
 
     # --- CORE Tickers ---
     core = [t for t in all_tickers if t in CORE_TICKERS]
-    _render_ticker_table(core, diags, "CORE Tickers")
+    _render_ticker_table(core, diags, "CORE Tickers", end_date)
 
     # --- FOCUS Tickers grouped by ETF structural ---
     focus_entries = get_focus_entries()
 
-    # Group structural by ETF
-    etf_structural: dict[str, list[str]] = {}
-    stress_event: list[str] = []
+    # Group structural by ETF (dicts as insertion-ordered sets for dedup)
+    etf_structural: dict[str, dict[str, None]] = {}
+    stress_event: dict[str, None] = {}
 
     for entry in focus_entries:
         ticker = entry["ticker"]
         if ticker in CORE_TICKERS:
             continue  # Already shown in CORE section
         if entry["reason"] == "structural":
-            # Extract ETF from details like "Top 10 holding in SPY (5.2%)"
-            for etf in CORE_TICKERS:
-                if f"in {etf}" in entry["details"]:
-                    etf_structural.setdefault(etf, [])
-                    if ticker not in etf_structural[etf]:
-                        etf_structural[etf].append(ticker)
-                    break
+            etf = entry["etf"]
+            if etf in CORE_TICKERS:
+                etf_structural.setdefault(etf, {})[ticker] = None
         else:
-            if ticker not in stress_event:
-                stress_event.append(ticker)
+            stress_event[ticker] = None
 
     # Render each ETF's structural group
     for etf in sorted(etf_structural.keys()):
-        tickers = etf_structural[etf]
-        _render_ticker_table(tickers, diags, f"FOCUS — {etf} Structural")
+        tickers = list(etf_structural[etf])
+        _render_ticker_table(tickers, diags, f"FOCUS — {etf} Structural", end_date)
 
     # Render stress + event group
     if stress_event:
-        _render_ticker_table(stress_event, diags, "FOCUS — Stress & Event")
+        _render_ticker_table(list(stress_event), diags, "FOCUS — Stress & Event", end_date)
 
-    # --- Data Quality Notice ---
-    st.markdown("---")
-    st.caption(
-        "**Note**: This is a **diagnostic overview**, not a watchlist. "
-        "OBSIDIAN MM classifies microstructure state but makes no claims about future price direction."
-    )
+    _render_notice()
@@ -22,11 +22,13 @@ from obsidian.engine.classifier import (
     Classifier,
     RegimeType,
     RegimeResult,
+    REGIMES_BY_CODE,
 )
 from obsidian.engine.explainability import (
     Explainer,
     DiagnosticOutput,
     ExcludedFeature,
+    ExplanationSection,
 )
 
 __all__ = [
@@ -40,7 +42,9 @@ __all__ = [
     "Classifier",
     "RegimeType",
     "RegimeResult",
+    "REGIMES_BY_CODE",
     "Explainer",
     "DiagnosticOutput",
     "ExcludedFeature",
+    "ExplanationSection",
 ]
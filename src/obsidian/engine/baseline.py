@@ -9,12 +9,14 @@ Implements the baseline framework from spec Section 3:
 - Instrument isolation (B_i ≠ B_j)
 """
 
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
 import numpy as np
 import pandas as pd
+from pandas.api.typing import Rolling
 
 
 class BaselineState(Enum):
@@ -25,7 +27,7 @@ class BaselineState(Enum):
     COMPLETE = "COMPLETE"  # ∀X: n_X ≥ 21 → Full confidence
 
 
-@dataclass
+@dataclass(slots=True)
 class BaselineStats:
     """Rolling baseline statistics for a single feature.
     
@@ -45,8 +47,8 @@ class BaselineStats:
     
     def __post_init__(self) -> None:
         """Validate that NaN stats have is_valid=False."""
-        if pd.isna(self.mean) or pd.isna(self.std):
-            object.__setattr__(self, 'is_valid', False)
+        if math.isnan(self.mean) or math.isnan(self.std):
+            self.is_valid = False
 
 
 class Baseline:
@@ -94,6 +96,57 @@ class Baseline:
         self.min_periods = min_periods
         self.drift_threshold = drift_threshold
     
+    def _rolling(self, data: pd.Series | pd.DataFrame) -> Rolling:
+        """Rolling window over data honouring window and min_periods.
+
+        Within the first `window` points the expanding window and a
+        partially filled rolling window cover the same rows, so a single
+        rolling pass serves both the cold-start and steady-state modes.
+        Rolling aggregations skip NaN and count only non-NaN values toward
+        min_periods.
+        """
+        return data.rolling(self.window, min_periods=self.min_periods)
+
+    def _rolling_mean_std(
+        self,
+        data: pd.Series | pd.DataFrame,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Rolling mean and sample std as float64 arrays shaped like data.
+
+        NaN where fewer than min_periods observations are available.
+        DataFrame columns are rolled independently in one call.
+        """
+        roll = self._rolling(data)
+        return (
+            roll.mean().to_numpy(dtype=np.float64),
+            roll.std(ddof=1).to_numpy(dtype=np.float64),
+        )
+
+    def _z_scores(self, data: pd.Series | pd.DataFrame) -> np.ndarray:
+        """Z-score array shaped like data (see compute_z_scores)."""
+        means, stds = self._rolling_mean_std(data)
+        values = data.to_numpy(dtype=np.float64)
+
+        # NaN wherever std is NaN (too few observations) or zero (constant)
+        return np.divide(
+            values - means,
+            stds,
+            out=np.full_like(means, np.nan),
+            where=stds > 0,
+        )
+
+    def _rolling_count(self, data: pd.Series) -> np.ndarray:
+        """Non-NaN observations in each window, as int64.
+
+        Difference of a running count `window` points apart: one cumsum
+        instead of a rolling aggregation over a boolean series.
+        """
+        window = self.window
+        counts = np.cumsum(data.notna().to_numpy(), dtype=np.int64)
+        n_valid = counts.copy()
+        n_valid[window:] -= counts[:-window]
+        return n_valid
+
     def compute_statistics(
         self,
         data: pd.Series,
@@ -119,43 +172,28 @@ class Baseline:
             >>> stats.iloc[25].is_valid  # Valid if n_valid >= 21
             True
         """
-        n = len(data)
-        stats_list = []
-        
-        for i in range(n):
-            if use_expanding and i < self.window:
-                # Expanding window: use all data from start to current point
-                window_data = data.iloc[:i+1]
-            else:
-                # Rolling window: use last `window` points
-                start_idx = max(0, i - self.window + 1)
-                window_data = data.iloc[start_idx:i+1]
-            
-            # Count non-NaN observations
-            n_valid = window_data.notna().sum()
-            
-            # Compute statistics (NaN-safe)
-            if n_valid >= self.min_periods:
-                mean = window_data.mean()
-                std = window_data.std(ddof=1)  # Sample std
-                median = window_data.median()
-                is_valid = True
-            else:
-                mean = np.nan
-                std = np.nan
-                median = np.nan
-                is_valid = False
-            
-            stats_list.append(
-                BaselineStats(
-                    mean=mean,
-                    std=std,
-                    median=median,
-                    n_valid=int(n_valid),
-                    is_valid=is_valid,
-                )
+        roll = self._rolling(data)
+        means, stds = self._rolling_mean_std(data)  # Sample std
+        medians = roll.median().tolist()
+        counts = self._rolling_count(data)
+        # Validity decided array-wide, so __post_init__'s NaN check never flips it
+        is_valid = (
+            (counts >= self.min_periods) & ~np.isnan(means) & ~np.isnan(stds)
+        ).tolist()
+
+        stats_list = [
+            BaselineStats(
+                mean=mean,
+                std=std,
+                median=median,
+                n_valid=count,
+                is_valid=valid,
             )
-        
+            for mean, std, median, count, valid in zip(
+                means.tolist(), stds.tolist(), medians, counts.tolist(), is_valid,
+            )
+        ]
+
         return pd.Series(stats_list, index=data.index)
     
     def compute_z_scores(
@@ -188,20 +226,31 @@ class Baseline:
             >>> z_scores.iloc[25]  # First valid z-score at t >= min_periods
             0.85
         """
-        stats = self.compute_statistics(data, use_expanding=use_expanding)
-        
-        # Extract mean and std from stats
-        means = pd.Series([s.mean for s in stats], index=data.index)
-        stds = pd.Series([s.std for s in stats], index=data.index)
-        
-        # Compute z-scores
-        with np.errstate(divide='ignore', invalid='ignore'):
-            z_scores = (data - means) / stds
-        
-        # Replace inf with NaN (from division by zero)
-        z_scores = z_scores.replace([np.inf, -np.inf], np.nan)
-        
-        return z_scores
+        return pd.Series(self._z_scores(data), index=data.index)
+
+    def compute_z_scores_frame(
+        self,
+        data: pd.DataFrame,
+        use_expanding: bool = True,
+    ) -> pd.DataFrame:
+        """Compute z-scores for several features sharing one time index.
+
+        Equivalent to compute_z_scores() on each column, but the rolling
+        statistics for all columns run in a single pass. Windows count
+        rows, so only combine features observed on the same dates;
+        aligning differently indexed series would insert NaN rows and
+        shrink each feature's effective window.
+
+        Args:
+            data: One column per feature, indexed by date
+            use_expanding: If True, use expanding window for t ≤ window
+
+        Returns:
+            DataFrame of z-scores with the same index and columns
+        """
+        return pd.DataFrame(
+            self._z_scores(data), index=data.index, columns=data.columns,
+        )
     
     def get_state(
         self,
@@ -264,7 +313,7 @@ class Baseline:
             False
         """
         # Handle NaN or zero previous mean
-        if pd.isna(current_mean) or pd.isna(previous_mean):
+        if math.isnan(current_mean) or math.isnan(previous_mean):
             return False
         if previous_mean == 0:
             # If previous was 0, any non-zero current is drift
@@ -272,6 +321,27 @@ class Baseline:
         
         relative_change = abs((current_mean - previous_mean) / previous_mean)
         return relative_change > self.drift_threshold
+
+    def detect_drift_series(self, means: np.ndarray) -> np.ndarray:
+        """Vectorized detect_drift() over consecutive means of a history.
+
+        Args:
+            means: Baseline means in time order
+
+        Returns:
+            Boolean array of length len(means) - 1; element i is
+            detect_drift(means[i + 1], means[i])
+        """
+        means = np.asarray(means, dtype=np.float64)
+        previous, current = means[:-1], means[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_change = np.abs((current - previous) / previous)
+        # Zero previous mean: any non-zero current is drift
+        drift = np.where(
+            previous == 0, current != 0, relative_change > self.drift_threshold,
+        )
+        drift &= ~(np.isnan(previous) | np.isnan(current))
+        return drift
     
     def get_excluded_features(
         self,
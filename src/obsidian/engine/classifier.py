@@ -24,6 +24,7 @@ from enum import Enum
 from typing import Optional
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 
 class RegimeType(Enum):
@@ -39,53 +40,67 @@ class RegimeType(Enum):
 
     def get_description(self) -> str:
         """Get human-readable description of the regime."""
-        descriptions = {
-            RegimeType.GAMMA_POSITIVE: "Gamma-Positive Control",
-            RegimeType.GAMMA_NEGATIVE: "Gamma-Negative Liquidity Vacuum",
-            RegimeType.DARK_DOMINANT: "Dark-Dominant Accumulation",
-            RegimeType.ABSORPTION: "Absorption-Like",
-            RegimeType.DISTRIBUTION: "Distribution-Like",
-            RegimeType.NEUTRAL: "Neutral / Mixed",
-            RegimeType.UNDETERMINED: "Undetermined",
-        }
-        return descriptions[self]
+        return _DESCRIPTIONS[self]
 
     def get_interpretation(self) -> str:
         """Get microstructure interpretation of the regime."""
-        interpretations = {
-            RegimeType.GAMMA_POSITIVE: (
-                "Dealers are significantly long gamma. Their hedging activity "
-                "compresses the intraday range, resulting in below-normal price "
-                "efficiency. Volatility suppression regime."
-            ),
-            RegimeType.GAMMA_NEGATIVE: (
-                "Dealers are significantly short gamma. Their hedging amplifies "
-                "directional moves. Above-normal price impact per unit volume "
-                "signals a liquidity vacuum."
-            ),
-            RegimeType.DARK_DOMINANT: (
-                "More than 70% of volume is executing off-exchange, with "
-                "block-print intensity elevated above +1σ. Consistent with "
-                "institutional positioning via dark liquidity."
-            ),
-            RegimeType.ABSORPTION: (
-                "Net delta exposure is significantly negative (sell pressure), "
-                "but the daily close-to-close move is no worse than −0.5%, and "
-                "dark pool participation exceeds 50%. Passive buying is absorbing "
-                "the sell flow."
-            ),
-            RegimeType.DISTRIBUTION: (
-                "Net delta exposure is significantly positive (buy pressure), "
-                "but the daily move is no better than +0.5%. Supply is being "
-                "distributed into strength without upside follow-through."
-            ),
-            RegimeType.NEUTRAL: (
-                "No single microstructure pattern dominates. The instrument is "
-                "in a balanced or ambiguous state."
-            ),
-            RegimeType.UNDETERMINED: "System cannot classify. Diagnosis withheld.",
-        }
-        return interpretations[self]
+        return _INTERPRETATIONS[self]
+
+
+# Lookup tables for RegimeType.get_description() / get_interpretation(),
+# built once at import
+_DESCRIPTIONS: dict[RegimeType, str] = {
+    RegimeType.GAMMA_POSITIVE: "Gamma-Positive Control",
+    RegimeType.GAMMA_NEGATIVE: "Gamma-Negative Liquidity Vacuum",
+    RegimeType.DARK_DOMINANT: "Dark-Dominant Accumulation",
+    RegimeType.ABSORPTION: "Absorption-Like",
+    RegimeType.DISTRIBUTION: "Distribution-Like",
+    RegimeType.NEUTRAL: "Neutral / Mixed",
+    RegimeType.UNDETERMINED: "Undetermined",
+}
+
+_INTERPRETATIONS: dict[RegimeType, str] = {
+    RegimeType.GAMMA_POSITIVE: (
+        "Dealers are significantly long gamma. Their hedging activity "
+        "compresses the intraday range, resulting in below-normal price "
+        "efficiency. Volatility suppression regime."
+    ),
+    RegimeType.GAMMA_NEGATIVE: (
+        "Dealers are significantly short gamma. Their hedging amplifies "
+        "directional moves. Above-normal price impact per unit volume "
+        "signals a liquidity vacuum."
+    ),
+    RegimeType.DARK_DOMINANT: (
+        "More than 70% of volume is executing off-exchange, with "
+        "block-print intensity elevated above +1σ. Consistent with "
+        "institutional positioning via dark liquidity."
+    ),
+    RegimeType.ABSORPTION: (
+        "Net delta exposure is significantly negative (sell pressure), "
+        "but the daily close-to-close move is no worse than −0.5%, and "
+        "dark pool participation exceeds 50%. Passive buying is absorbing "
+        "the sell flow."
+    ),
+    RegimeType.DISTRIBUTION: (
+        "Net delta exposure is significantly positive (buy pressure), "
+        "but the daily move is no better than +0.5%. Supply is being "
+        "distributed into strength without upside follow-through."
+    ),
+    RegimeType.NEUTRAL: (
+        "No single microstructure pattern dominates. The instrument is "
+        "in a balanced or ambiguous state."
+    ),
+    RegimeType.UNDETERMINED: "System cannot classify. Diagnosis withheld.",
+}
+
+
+# Integer regime codes used by Classifier.classify_batch(): code i is
+# REGIMES_BY_CODE[i] (priority order, UND last)
+REGIMES_BY_CODE: tuple[RegimeType, ...] = tuple(RegimeType)
+_CODE = {regime: np.int8(code) for code, regime in enumerate(REGIMES_BY_CODE)}
+
+# Default for missing classify() inputs
+_NAN = float("nan")
 
 
 @dataclass
@@ -191,94 +206,89 @@ class Classifier:
                 baseline_sufficient=False,
             )
 
-        # Extract z-scores (use NaN if missing)
-        z_gex = z_scores.get("gex", np.nan)
-        z_dex = z_scores.get("dex", np.nan)
-        z_block = z_scores.get("block_intensity", np.nan)
+        # Extract inputs (NaN if missing). Every comparison involving NaN is
+        # False, so a rule with a missing input cannot match and no
+        # separate isnan guard is needed.
+        z_gex = z_scores.get("gex", _NAN)
+        z_dex = z_scores.get("dex", _NAN)
+        z_block = z_scores.get("block_intensity", _NAN)
 
-        # Extract raw features (use NaN if missing)
-        dark_share = raw_features.get("dark_share", np.nan)
-        efficiency = raw_features.get("efficiency", np.nan)
-        impact = raw_features.get("impact", np.nan)
+        dark_share = raw_features.get("dark_share", _NAN)
+        efficiency = raw_features.get("efficiency", _NAN)
+        impact = raw_features.get("impact", _NAN)
 
-        # Extract baseline medians (use NaN if missing)
-        efficiency_median = baseline_medians.get("efficiency", np.nan)
-        impact_median = baseline_medians.get("impact", np.nan)
+        efficiency_median = baseline_medians.get("efficiency", _NAN)
+        impact_median = baseline_medians.get("impact", _NAN)
 
         # Priority 1: Γ⁺ (Gamma-Positive Control)
         # Z_GEX > +1.5 AND Efficiency < median
-        if not np.isnan(z_gex) and not np.isnan(efficiency) and not np.isnan(efficiency_median):
-            if z_gex > self.Z_GEX_THRESHOLD and efficiency < efficiency_median:
-                return RegimeResult(
-                    regime=RegimeType.GAMMA_POSITIVE,
-                    triggering_conditions={
-                        "Z_GEX": (z_gex, self.Z_GEX_THRESHOLD, True),
-                        "Efficiency_vs_median": (efficiency, efficiency_median, True),
-                    },
-                    interpretation=RegimeType.GAMMA_POSITIVE.get_interpretation(),
-                    baseline_sufficient=True,
-                )
+        if z_gex > self.Z_GEX_THRESHOLD and efficiency < efficiency_median:
+            return RegimeResult(
+                regime=RegimeType.GAMMA_POSITIVE,
+                triggering_conditions={
+                    "Z_GEX": (z_gex, self.Z_GEX_THRESHOLD, True),
+                    "Efficiency_vs_median": (efficiency, efficiency_median, True),
+                },
+                interpretation=RegimeType.GAMMA_POSITIVE.get_interpretation(),
+                baseline_sufficient=True,
+            )
 
         # Priority 2: Γ⁻ (Gamma-Negative Liquidity Vacuum)
         # Z_GEX < −1.5 AND Impact > median
-        if not np.isnan(z_gex) and not np.isnan(impact) and not np.isnan(impact_median):
-            if z_gex < -self.Z_GEX_THRESHOLD and impact > impact_median:
-                return RegimeResult(
-                    regime=RegimeType.GAMMA_NEGATIVE,
-                    triggering_conditions={
-                        "Z_GEX": (z_gex, -self.Z_GEX_THRESHOLD, True),
-                        "Impact_vs_median": (impact, impact_median, True),
-                    },
-                    interpretation=RegimeType.GAMMA_NEGATIVE.get_interpretation(),
-                    baseline_sufficient=True,
-                )
+        if z_gex < -self.Z_GEX_THRESHOLD and impact > impact_median:
+            return RegimeResult(
+                regime=RegimeType.GAMMA_NEGATIVE,
+                triggering_conditions={
+                    "Z_GEX": (z_gex, -self.Z_GEX_THRESHOLD, True),
+                    "Impact_vs_median": (impact, impact_median, True),
+                },
+                interpretation=RegimeType.GAMMA_NEGATIVE.get_interpretation(),
+                baseline_sufficient=True,
+            )
 
         # Priority 3: DD (Dark-Dominant Accumulation)
         # DarkShare > 0.70 AND Z_block > +1.0
-        if not np.isnan(dark_share) and not np.isnan(z_block):
-            if dark_share > self.DARK_SHARE_DD_THRESHOLD and z_block > self.Z_BLOCK_THRESHOLD:
-                return RegimeResult(
-                    regime=RegimeType.DARK_DOMINANT,
-                    triggering_conditions={
-                        "DarkShare": (dark_share, self.DARK_SHARE_DD_THRESHOLD, True),
-                        "Z_block": (z_block, self.Z_BLOCK_THRESHOLD, True),
-                    },
-                    interpretation=RegimeType.DARK_DOMINANT.get_interpretation(),
-                    baseline_sufficient=True,
-                )
+        if dark_share > self.DARK_SHARE_DD_THRESHOLD and z_block > self.Z_BLOCK_THRESHOLD:
+            return RegimeResult(
+                regime=RegimeType.DARK_DOMINANT,
+                triggering_conditions={
+                    "DarkShare": (dark_share, self.DARK_SHARE_DD_THRESHOLD, True),
+                    "Z_block": (z_block, self.Z_BLOCK_THRESHOLD, True),
+                },
+                interpretation=RegimeType.DARK_DOMINANT.get_interpretation(),
+                baseline_sufficient=True,
+            )
 
         # Priority 4: ABS (Absorption-Like)
         # Z_DEX < −1.0 AND return ≥ −0.005 AND DarkShare > 0.50
-        if not np.isnan(z_dex) and not np.isnan(daily_return) and not np.isnan(dark_share):
-            if (
-                z_dex < -self.Z_DEX_THRESHOLD
-                and daily_return >= self.PRICE_MOVE_ABS_CAP
-                and dark_share > self.DARK_SHARE_ABS_THRESHOLD
-            ):
-                return RegimeResult(
-                    regime=RegimeType.ABSORPTION,
-                    triggering_conditions={
-                        "Z_DEX": (z_dex, -self.Z_DEX_THRESHOLD, True),
-                        "Daily_return": (daily_return, self.PRICE_MOVE_ABS_CAP, True),
-                        "DarkShare": (dark_share, self.DARK_SHARE_ABS_THRESHOLD, True),
-                    },
-                    interpretation=RegimeType.ABSORPTION.get_interpretation(),
-                    baseline_sufficient=True,
-                )
+        if (
+            z_dex < -self.Z_DEX_THRESHOLD
+            and daily_return >= self.PRICE_MOVE_ABS_CAP
+            and dark_share > self.DARK_SHARE_ABS_THRESHOLD
+        ):
+            return RegimeResult(
+                regime=RegimeType.ABSORPTION,
+                triggering_conditions={
+                    "Z_DEX": (z_dex, -self.Z_DEX_THRESHOLD, True),
+                    "Daily_return": (daily_return, self.PRICE_MOVE_ABS_CAP, True),
+                    "DarkShare": (dark_share, self.DARK_SHARE_ABS_THRESHOLD, True),
+                },
+                interpretation=RegimeType.ABSORPTION.get_interpretation(),
+                baseline_sufficient=True,
+            )
 
         # Priority 5: DIST (Distribution-Like)
         # Z_DEX > +1.0 AND return ≤ +0.005
-        if not np.isnan(z_dex) and not np.isnan(daily_return):
-            if z_dex > self.Z_DEX_THRESHOLD and daily_return <= self.PRICE_MOVE_DIST_CAP:
-                return RegimeResult(
-                    regime=RegimeType.DISTRIBUTION,
-                    triggering_conditions={
-                        "Z_DEX": (z_dex, self.Z_DEX_THRESHOLD, True),
-                        "Daily_return": (daily_return, self.PRICE_MOVE_DIST_CAP, True),
-                    },
-                    interpretation=RegimeType.DISTRIBUTION.get_interpretation(),
-                    baseline_sufficient=True,
-                )
+        if z_dex > self.Z_DEX_THRESHOLD and daily_return <= self.PRICE_MOVE_DIST_CAP:
+            return RegimeResult(
+                regime=RegimeType.DISTRIBUTION,
+                triggering_conditions={
+                    "Z_DEX": (z_dex, self.Z_DEX_THRESHOLD, True),
+                    "Daily_return": (daily_return, self.PRICE_MOVE_DIST_CAP, True),
+                },
+                interpretation=RegimeType.DISTRIBUTION.get_interpretation(),
+                baseline_sufficient=True,
+            )
 
         # Priority 6: NEU (Neutral / Mixed)
         # No prior rule matched
@@ -288,3 +298,66 @@ class Classifier:
             interpretation=RegimeType.NEUTRAL.get_interpretation(),
             baseline_sufficient=True,
         )
+
+    def classify_batch(
+        self,
+        z_gex: ArrayLike,
+        z_dex: ArrayLike,
+        z_block: ArrayLike,
+        dark_share: ArrayLike,
+        efficiency: ArrayLike,
+        impact: ArrayLike,
+        efficiency_median: ArrayLike,
+        impact_median: ArrayLike,
+        daily_return: ArrayLike,
+        baseline_sufficient: ArrayLike = True,
+    ) -> np.ndarray:
+        """Classify many (ticker, day) rows at once.
+
+        Applies the same priority-ordered rules as classify() to aligned
+        arrays (scalars broadcast) and returns regime codes only, without
+        triggering conditions. Comparisons involving NaN are False, so a
+        rule with a missing input never matches, as in classify().
+
+        Args:
+            z_gex, z_dex, z_block: Z-scores per row
+            dark_share, efficiency, impact: Raw feature values per row
+            efficiency_median, impact_median: Baseline medians per row
+            daily_return: Close-to-close return per row
+            baseline_sufficient: False rows are UND
+
+        Returns:
+            int8 array of regime codes; decode with REGIMES_BY_CODE
+        """
+        def _arr(values: ArrayLike) -> np.ndarray:
+            return np.asarray(values, dtype=np.float64)
+
+        z_gex, z_dex, z_block = _arr(z_gex), _arr(z_dex), _arr(z_block)
+        dark_share, efficiency, impact = _arr(dark_share), _arr(efficiency), _arr(impact)
+        efficiency_median, impact_median = _arr(efficiency_median), _arr(impact_median)
+        daily_return = _arr(daily_return)
+        baseline_sufficient = np.asarray(baseline_sufficient, dtype=bool)
+
+        with np.errstate(invalid="ignore"):
+            conditions = [
+                ~baseline_sufficient,
+                (z_gex > self.Z_GEX_THRESHOLD) & (efficiency < efficiency_median),
+                (z_gex < -self.Z_GEX_THRESHOLD) & (impact > impact_median),
+                (dark_share > self.DARK_SHARE_DD_THRESHOLD) & (z_block > self.Z_BLOCK_THRESHOLD),
+                (z_dex < -self.Z_DEX_THRESHOLD)
+                & (daily_return >= self.PRICE_MOVE_ABS_CAP)
+                & (dark_share > self.DARK_SHARE_ABS_THRESHOLD),
+                (z_dex > self.Z_DEX_THRESHOLD) & (daily_return <= self.PRICE_MOVE_DIST_CAP),
+            ]
+        choices = [
+            _CODE[RegimeType.UNDETERMINED],
+            _CODE[RegimeType.GAMMA_POSITIVE],
+            _CODE[RegimeType.GAMMA_NEGATIVE],
+            _CODE[RegimeType.DARK_DOMINANT],
+            _CODE[RegimeType.ABSORPTION],
+            _CODE[RegimeType.DISTRIBUTION],
+        ]
+        # np.select broadcasts conditions; first true condition wins
+        return np.select(
+            np.broadcast_arrays(*conditions), choices, default=_CODE[RegimeType.NEUTRAL],
+        ).astype(np.int8, copy=False)
@@ -20,7 +20,7 @@ Per spec Section 7: "Every output tuple (U_t, R_t) must be accompanied by:
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Literal, Optional
 
 from obsidian.engine.baseline import BaselineState
 from obsidian.engine.classifier import RegimeResult
@@ -44,6 +44,30 @@ class ExcludedFeature:
         return f"{self.feature_name} ({self.reason})"
 
 
+@dataclass(frozen=True, slots=True)
+class ExplanationSection:
+    """One renderable section of a diagnostic explanation.
+
+    Built once alongside the text explanation so display code can render
+    it without re-parsing the formatted string.
+
+    Attributes:
+        kind: Which explainability component this section carries
+        header: Headline text (e.g. "Regime: Γ⁻ (...)", "Unusualness: 78 (Unusual)")
+        lines: Detail lines (triggering conditions or interpretation)
+        drivers: (FEATURE, contribution) pairs for the score section
+        items: Excluded features, formatted as "name (reason)"
+        value: Baseline state for the baseline section
+    """
+
+    kind: Literal["regime", "score", "excluded", "baseline"]
+    header: str
+    lines: tuple[str, ...] = ()
+    drivers: tuple[tuple[str, str], ...] = ()
+    items: tuple[str, ...] = ()
+    value: str = ""
+
+
 @dataclass
 class DiagnosticOutput:
     """Complete diagnostic output for a single day.
@@ -115,20 +139,28 @@ class DiagnosticOutput:
         )
 
         # Top 2-3 contributors (sorted by contribution descending)
-        if self.scoring_result.feature_contributions:
-            sorted_contribs = sorted(
-                self.scoring_result.feature_contributions.items(),
-                key=lambda x: x[1],
-                reverse=True,
-            )[:3]
-            driver_parts = []
-            for feature, contribution in sorted_contribs:
-                # Format as: FEATURE contrib=X.XX
-                driver_parts.append(f"{feature.upper()} contrib={contribution:.2f}")
+        drivers = self._top_drivers()
+        if drivers:
+            # Format as: FEATURE contrib=X.XX
+            driver_parts = [f"{feature} contrib={value}" for feature, value in drivers]
             lines.append(f"Top drivers: {'; '.join(driver_parts)}")
 
         return "\n".join(lines)
 
+    def _top_drivers(self) -> tuple[tuple[str, str], ...]:
+        """Return the top 3 (FEATURE, "X.XX") contributions, largest first."""
+        if self.scoring_result is None or not self.scoring_result.feature_contributions:
+            return ()
+        sorted_contribs = sorted(
+            self.scoring_result.feature_contributions.items(),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:3]
+        return tuple(
+            (feature.upper(), f"{contribution:.2f}")
+            for feature, contribution in sorted_contribs
+        )
+
     def format_excluded_features(self) -> str:
         """Format excluded features section.
 
@@ -183,6 +215,40 @@ class DiagnosticOutput:
 
         return "\n".join(lines)
 
+    def sections(self) -> list[ExplanationSection]:
+        """Return the explanation as structured sections.
+
+        Carries the same content as format_full(), minus the title line,
+        in display order: regime, score, excluded features, baseline.
+
+        Returns:
+            List of ExplanationSection
+        """
+        regime_lines = self.format_regime().split("\n")
+        score_lines = self.format_score().split("\n")
+        return [
+            ExplanationSection(
+                kind="regime",
+                header=regime_lines[0],
+                lines=tuple(line.strip() for line in regime_lines[1:]),
+            ),
+            ExplanationSection(
+                kind="score",
+                header=score_lines[0],
+                drivers=self._top_drivers(),
+            ),
+            ExplanationSection(
+                kind="excluded",
+                header="Excluded",
+                items=tuple(str(ef) for ef in self.excluded_features),
+            ),
+            ExplanationSection(
+                kind="baseline",
+                header="Baseline",
+                value=self.baseline_state.value,
+            ),
+        ]
+
     def to_dict(self) -> dict:
         """Convert diagnostic output to structured dictionary.
 
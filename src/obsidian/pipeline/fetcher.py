@@ -14,9 +14,13 @@ import pandas as pd
 from obsidian.config import settings
 from obsidian.clients import UnusualWhalesClient, PolygonClient, FMPClient
 from obsidian.cache import ParquetStore
+from obsidian.clients.unusual_whales import TickerCallback
 
 logger = logging.getLogger(__name__)
 
+# Prefetched UW responses for one ticker: source → response or exception
+_UWSeries = dict[str, dict[str, Any] | Exception]
+
 
 class Fetcher:
     """Fetches raw data from APIs and stores in Parquet cache.
@@ -46,36 +50,68 @@ class Fetcher:
         """
         self.cache = ParquetStore(base_path=cache_dir or settings.cache_dir)
         # Limit concurrent UW fetches to avoid 429 rate-limit errors.
-        # Each ticker makes 3 sequential UW calls, so uw_concurrency=3
-        # means max 3 concurrent UW request streams.
+        # Each ticker's dark pool stream and each batched greeks/IV request
+        # holds one slot, so uw_concurrency=3 means max 3 concurrent UW
+        # requests in flight.
         self._uw_semaphore = asyncio.Semaphore(settings.uw_concurrency)
 
     async def fetch_ticker(
         self,
         ticker: str,
         target_date: date,
-        lookback_days: int = 100
+        lookback_days: int = 100,
+        uw_prefetched: asyncio.Future[_UWSeries] | None = None,
     ) -> dict[str, bool]:
         """Fetch all data sources for a single ticker.
 
         Fetches dark pool prints, Greek exposures, price bars, and quotes.
-        Each source is stored independently in the Parquet cache.
+        Unusual Whales, Polygon, and FMP are queried concurrently; each
+        source is stored independently in the Parquet cache.
 
         Args:
             ticker: Symbol to fetch
             target_date: Date to fetch data for
             lookback_days: How many days of history to fetch (default: 100)
+            uw_prefetched: Future resolving to this ticker's UW responses
+                prefetched by fetch_all(), keyed by source ("greeks",
+                "iv_rank"). Sources present there are not requested again.
 
         Returns:
             Dictionary mapping source → success status
         """
         ticker = ticker.upper()
-        results: dict[str, bool] = {}
         start_date = target_date - timedelta(days=lookback_days)
 
+        # Providers are independent and I/O bound — fan out so wall time is
+        # the slowest provider rather than the sum of all three.
+        uw_results, bars_results, quote_results = await asyncio.gather(
+            self._fetch_uw_sources(ticker, start_date, target_date, uw_prefetched),
+            self._fetch_bars(ticker, start_date, target_date),
+            self._fetch_quote(ticker, target_date),
+        )
+        return {**uw_results, **bars_results, **quote_results}
+
+    async def _fetch_uw_sources(
+        self,
+        ticker: str,
+        start_date: date,
+        target_date: date,
+        uw_prefetched: asyncio.Future[_UWSeries] | None,
+    ) -> dict[str, bool]:
+        """Fetch dark pool, Greeks, and IV rank from Unusual Whales.
+
+        Each UW request holds one slot of the shared semaphore, so
+        uw_concurrency keeps bounding concurrent UW requests. The
+        prefetched Greeks/IV rank are awaited with no slot held, since
+        the prefetch needs slots itself.
+
+        Returns:
+            Dictionary mapping source → success status
+        """
+        results: dict[str, bool] = {}
+
         # --- Unusual Whales: Dark Pool + Greeks + IV ---
-        # Semaphore limits concurrent UW fetches across all tickers
-        async with self._uw_semaphore, UnusualWhalesClient(
+        async with UnusualWhalesClient(
             api_key=settings.uw_api_key,
             rate_limit=settings.uw_rate_limit
         ) as uw:
@@ -84,12 +120,13 @@ class Fetcher:
             # regardless of date_from/date_to. Historical dark pool data
             # accumulates over daily runs (21+ days for valid baseline).
             try:
-                resp = await uw.get_dark_pool_recent(
-                    ticker=ticker,
-                    limit=200,
-                    date_from=start_date,
-                    date_to=target_date
-                )
+                async with self._uw_semaphore:
+                    resp = await uw.get_dark_pool_recent(
+                        ticker=ticker,
+                        limit=200,
+                        date_from=start_date,
+                        date_to=target_date
+                    )
                 data = resp.get("data", [])
                 if data:
                     df = pd.DataFrame(data)
@@ -119,13 +156,20 @@ class Fetcher:
                 logger.warning(f"{ticker}: dark_pool FAILED — {e}")
                 results["dark_pool"] = False
 
+            prefetched = await uw_prefetched if uw_prefetched is not None else {}
+
             # Greek exposure (GEX, DEX, Vanna, Charm)
             try:
-                resp = await uw.get_greek_exposure(
-                    ticker=ticker,
-                    date_from=start_date,
-                    date_to=target_date
-                )
+                resp = prefetched.get("greeks")
+                if resp is None:
+                    async with self._uw_semaphore:
+                        resp = await uw.get_greek_exposure(
+                            ticker=ticker,
+                            date_from=start_date,
+                            date_to=target_date
+                        )
+                elif isinstance(resp, Exception):
+                    raise resp
                 data = resp.get("data", [])
                 if data:
                     df = pd.DataFrame(data)
@@ -144,11 +188,16 @@ class Fetcher:
 
             # IV Rank
             try:
-                resp = await uw.get_iv_rank(
-                    ticker=ticker,
-                    date_from=start_date,
-                    date_to=target_date
-                )
+                resp = prefetched.get("iv_rank")
+                if resp is None:
+                    async with self._uw_semaphore:
+                        resp = await uw.get_iv_rank(
+                            ticker=ticker,
+                            date_from=start_date,
+                            date_to=target_date
+                        )
+                elif isinstance(resp, Exception):
+                    raise resp
                 data = resp.get("data", [])
                 if data:
                     df = pd.DataFrame(data)
@@ -165,26 +214,40 @@ class Fetcher:
                 logger.warning(f"{ticker}: iv_rank FAILED — {e}")
                 results["iv_rank"] = False
 
+        return results
+
+    async def _fetch_bars(
+        self,
+        ticker: str,
+        start_date: date,
+        target_date: date,
+    ) -> dict[str, bool]:
+        """Fetch daily price bars from Polygon.
+
+        Returns:
+            Dictionary mapping source → success status
+        """
+        results: dict[str, bool] = {}
+
         # --- Polygon: Price Bars ---
         async with PolygonClient(
             api_key=settings.polygon_api_key,
             rate_limit=settings.polygon_rate_limit
         ) as polygon:
             try:
-                resp = await polygon.get_daily_bars(
+                # Land bars column-wise so the cache write skips pandas
+                bars = await polygon.get_daily_bars_arrow(
                     ticker=ticker,
                     date_from=start_date,
                     date_to=target_date
                 )
-                bars = resp.get("results", [])
-                if bars:
-                    df = pd.DataFrame(bars)
+                if bars.num_rows:
                     await self.cache.write(
                         ticker=ticker, source="bars",
-                        dt=target_date, data=df, overwrite=True
+                        dt=target_date, data=bars, overwrite=True
                     )
                     results["bars"] = True
-                    logger.info(f"{ticker}: bars — {len(bars)} records")
+                    logger.info(f"{ticker}: bars — {bars.num_rows} records")
                 else:
                     results["bars"] = False
                     logger.warning(f"{ticker}: bars — no data returned")
@@ -192,6 +255,16 @@ class Fetcher:
                 logger.warning(f"{ticker}: bars FAILED — {e}")
                 results["bars"] = False
 
+        return results
+
+    async def _fetch_quote(self, ticker: str, target_date: date) -> dict[str, bool]:
+        """Fetch the latest quote from FMP.
+
+        Returns:
+            Dictionary mapping source → success status
+        """
+        results: dict[str, bool] = {}
+
         # --- FMP: Quote ---
         async with FMPClient(
             api_key=settings.fmp_api_key,
@@ -217,6 +290,62 @@ class Fetcher:
 
         return results
 
+    async def _prefetch_uw_series(
+        self,
+        tickers: list[str],
+        start_date: date,
+        end_date: date,
+        futures: dict[str, asyncio.Future[_UWSeries]],
+    ) -> None:
+        """Prefetch the per-ticker UW time series over one pooled client.
+
+        Greek exposure and IV rank for every ticker go through the batch
+        methods of a single UnusualWhalesClient (one connection pool, one
+        rate limiter); UW has no multi-ticker endpoint, so this is still
+        one request per ticker and source, each bounded by the shared UW
+        semaphore. Each ticker's future is resolved as soon as its own two
+        responses are in, so fetch_ticker() never waits for the whole batch.
+
+        Args:
+            tickers: Ticker symbols (uppercase)
+            start_date: First date of the lookback window
+            end_date: Last date of the lookback window
+            futures: Ticker → future to resolve with {source: response or
+                exception}. A source missing from the mapping (batch
+                failure or cancellation) is requested by fetch_ticker().
+        """
+        series: dict[str, _UWSeries] = {t: {} for t in tickers}
+
+        def _collect(source: str) -> TickerCallback:
+            def _on_result(ticker: str, resp: dict[str, Any] | Exception) -> None:
+                series[ticker][source] = resp
+                if len(series[ticker]) == 2 and not futures[ticker].done():
+                    futures[ticker].set_result(series[ticker])
+            return _on_result
+
+        try:
+            async with UnusualWhalesClient(
+                api_key=settings.uw_api_key,
+                rate_limit=settings.uw_rate_limit
+            ) as uw:
+                await asyncio.gather(
+                    uw.get_greek_exposure_many(
+                        tickers, start_date, end_date,
+                        semaphore=self._uw_semaphore, on_result=_collect("greeks"),
+                    ),
+                    uw.get_iv_rank_many(
+                        tickers, start_date, end_date,
+                        semaphore=self._uw_semaphore, on_result=_collect("iv_rank"),
+                    ),
+                )
+        except Exception as e:
+            logger.warning("UW batch prefetch FAILED — %s", e)
+        finally:
+            # Unresolved tickers keep what arrived; the rest is re-requested
+            for ticker, future in futures.items():
+                if not future.done():
+                    future.set_result(series.get(ticker, {}))
+
     async def fetch_all(
         self,
         tickers: set[str],
@@ -225,9 +354,12 @@ class Fetcher:
     ) -> dict[str, dict[str, bool]]:
         """Fetch data for multiple tickers concurrently.
 
-        Each ticker creates its own ephemeral API clients. UW requests
-        are throttled by a shared semaphore (uw_concurrency) to avoid
-        429 rate-limit errors. Polygon/FMP calls run freely in parallel.
+        Greek exposure and IV rank for all tickers are prefetched over one
+        UW client in a background task while the per-ticker fetches start
+        immediately; each ticker waits only for its own prefetched series.
+        The remaining sources use per-ticker ephemeral clients. UW requests
+        are throttled by a shared semaphore (uw_concurrency) to avoid 429
+        rate-limit errors. Polygon/FMP calls run freely in parallel.
 
         Args:
             tickers: Set of ticker symbols
@@ -242,13 +374,33 @@ class Fetcher:
             "bars": False, "iv_rank": False, "quote": False
         }
 
+        if not tickers:
+            return {}
+
+        start_date = target_date - timedelta(days=lookback_days)
+        loop = asyncio.get_running_loop()
+        symbols = sorted({t.upper() for t in tickers})
+        futures: dict[str, asyncio.Future[_UWSeries]] = {
+            t: loop.create_future() for t in symbols
+        }
+        # Runs alongside the per-ticker fetches; Polygon/FMP start at once
+        prefetch = asyncio.create_task(
+            self._prefetch_uw_series(symbols, start_date, target_date, futures)
+        )
+
         async def _fetch_one(ticker: str) -> tuple[str, dict[str, bool]]:
             try:
-                return ticker, await self.fetch_ticker(ticker, target_date, lookback_days)
+                return ticker, await self.fetch_ticker(
+                    ticker, target_date, lookback_days,
+                    uw_prefetched=futures[ticker.upper()],
+                )
             except Exception as e:
                 logger.error("Failed to fetch %s: %s", ticker, e)
                 return ticker, dict(_fail)
 
-        tasks = [_fetch_one(t) for t in sorted(tickers)]
-        completed = await asyncio.gather(*tasks)
+        try:
+            completed = await asyncio.gather(*(_fetch_one(t) for t in sorted(tickers)))
+        finally:
+            # Normally already finished: every ticker awaited its future
+            await prefetch
         return dict(completed)
@@ -44,15 +44,24 @@ class Orchestrator:
             print(f"{ticker}: {diagnostic.regime_label} ({score_str})")
     """
 
-    def __init__(self, cache_dir: str = "data/") -> None:
+    def __init__(
+        self,
+        cache_dir: str = "data/",
+        fetcher: Fetcher | None = None,
+        processor: Processor | None = None,
+    ) -> None:
         """Initialize orchestrator with all components.
 
         Args:
             cache_dir: Directory for Parquet cache
+            fetcher: Existing Fetcher to reuse (default: new one on cache_dir)
+            processor: Existing Processor to reuse (default: new one on cache_dir)
         """
+        # The universe is the only mutable state; fetcher and processor
+        # hold none between runs and may be shared across orchestrators.
         self.universe = UniverseManager()
-        self.fetcher = Fetcher(cache_dir=cache_dir)
-        self.processor = Processor(cache_dir=cache_dir)
+        self.fetcher = fetcher or Fetcher(cache_dir=cache_dir)
+        self.processor = processor or Processor(cache_dir=cache_dir)
 
     async def run_diagnostics(
         self,
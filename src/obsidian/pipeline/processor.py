@@ -7,6 +7,7 @@ import asyncio
 import logging
 from datetime import date, timedelta
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 import pandas as pd
 import numpy as np
 
@@ -29,12 +30,33 @@ from obsidian.engine import (
     ScoringResult,
     RegimeType,
     ExcludedFeature,
+    ExplanationSection,
 )
-from obsidian.ai import Narrator
+
+if TYPE_CHECKING:
+    from obsidian.ai import Narrator
 
 logger = logging.getLogger(__name__)
 
 
+def _group_by_index(
+    features: dict[str, pd.Series],
+) -> list[dict[str, pd.Series]]:
+    """Partition feature series into groups with identical indexes.
+
+    Preserves first-seen order of groups and of features within a group.
+    """
+    groups: list[tuple[pd.Index, dict[str, pd.Series]]] = []
+    for name, series in features.items():
+        for index, members in groups:
+            if series.index.equals(index):
+                members[name] = series
+                break
+        else:
+            groups.append((series.index, {name: series}))
+    return [members for _, members in groups]
+
+
 @dataclass
 class DiagnosticResult:
     """Complete diagnostic output for one ticker on one date."""
@@ -46,12 +68,15 @@ class DiagnosticResult:
     score_raw: float | None
     score_percentile: float | None
     interpretation: str | None
+    # Plain floats; NaN marks a feature without a usable z-score
     z_scores: dict[str, float]
     raw_features: dict[str, float]
     baseline_state: str
     explanation: str
     ai_explanation: str | None = None
     observation_counts: dict[str, int] | None = None
+    # Pre-built display sections for `explanation` (None when not available)
+    explanation_sections: list[ExplanationSection] | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -113,7 +138,7 @@ class Processor:
         self.explainer = Explainer()
 
         # AI Narrator (optional — graceful degradation)
-        self.narrator: Narrator | None = None
+        self.narrator: "Narrator | None" = None
         try:
             from obsidian.config import settings
             if settings.ai_provider:
@@ -125,6 +150,10 @@ class Processor:
                 # ollama needs no key
 
                 if settings.ai_provider == "ollama" or api_key:
+                    # Imported only when a provider is configured, so the
+                    # default (AI off) path never loads the narrator module.
+                    from obsidian.ai import Narrator
+
                     self.narrator = Narrator(
                         provider=settings.ai_provider,
                         api_key=api_key,
@@ -149,6 +178,21 @@ class Processor:
             return float("nan")
         return series.iloc[-1]
 
+    @staticmethod
+    def _trailing_median(series: pd.Series | None, window: int = 63) -> float:
+        """Median of the last `window` values, or NaN.
+
+        Same value as series.rolling(window).median().iloc[-1] (a full
+        window with no NaN is required) without computing the median at
+        every earlier point.
+        """
+        if series is None or len(series) < window:
+            return float("nan")
+        tail = series.to_numpy(dtype=np.float64)[-window:]
+        if np.isnan(tail).any():
+            return float("nan")
+        return float(np.median(tail))
+
     @staticmethod
     def _normalize_dark_pool(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
         """Aggregate raw UW dark pool prints into daily summaries.
@@ -386,22 +430,35 @@ class Processor:
             )
 
         # Step 2: Compute z-scores for latest day
-        z_scores_latest = {}
+        # Values are plain floats with NaN as the one "no z-score" sentinel,
+        # so consumers can test math.isnan() without type guards.
+        z_scores_latest: dict[str, float] = {}
         feature_counts = {}
 
+        # Features from the same source share a date index, so each
+        # group's z-scores are computed in one frame-level rolling pass
+        z_by_feature: dict[str, pd.Series] = {}
+        for group in _group_by_index(feature_data):
+            index = next(iter(group.values())).index
+            frame = pd.DataFrame(
+                {name: series.to_numpy() for name, series in group.items()},
+                index=index,
+            )
+            z_frame = self.baseline.compute_z_scores_frame(frame, use_expanding=True)
+            z_by_feature.update(z_frame.items())
+
         for feature_name, series in feature_data.items():
-            # Compute z-scores for entire series
-            z_series = self.baseline.compute_z_scores(series, use_expanding=True)
+            z_series = z_by_feature[feature_name]
 
             # Get latest z-score: try exact target_date first, fall back to last value
             # (target_date may be a weekend/holiday with no trading data)
             if len(z_series) == 0:
                 z_scores_latest[feature_name] = np.nan
             elif target_date in z_series.index:
-                z_scores_latest[feature_name] = z_series.loc[target_date]
+                z_scores_latest[feature_name] = float(z_series.loc[target_date])
             else:
                 # Use most recent available z-score
-                z_scores_latest[feature_name] = z_series.iloc[-1]
+                z_scores_latest[feature_name] = float(z_series.iloc[-1])
 
             # Count valid observations
             feature_counts[feature_name] = series.notna().sum()
@@ -450,8 +507,8 @@ class Processor:
         }
 
         baseline_medians = {
-            'efficiency': self._safe_last(feature_data['efficiency'].rolling(63).median()) if 'efficiency' in feature_data and len(feature_data['efficiency']) > 0 else _nan,
-            'impact': self._safe_last(feature_data['impact'].rolling(63).median()) if 'impact' in feature_data and len(feature_data['impact']) > 0 else _nan,
+            'efficiency': self._trailing_median(feature_data.get('efficiency')),
+            'impact': self._trailing_median(feature_data.get('impact')),
         }
 
         daily_return = 0.0  # Would compute from bars_data if available
@@ -498,6 +555,7 @@ class Processor:
             baseline_state=baseline_state.value,
             explanation=explanation_output.format_full(),
             observation_counts=feature_counts,
+            explanation_sections=explanation_output.sections(),
         )
 
         # AI Narrator enrichment (optional — never blocks pipeline)
@@ -12,6 +12,7 @@ The manager maintains FOCUS membership based on:
 
 from dataclasses import dataclass, field
 from datetime import date
+from types import MappingProxyType
 from typing import Literal
 
 
@@ -28,6 +29,7 @@ class FocusEntry:
     reason: Literal["structural", "stress", "event"]
     details: str
     days_inactive: int = 0  # Consecutive days without entry condition
+    etf: str | None = None  # Owning CORE index for structural entries
 
 
 @dataclass
@@ -75,6 +77,8 @@ class UniverseManager:
     def __init__(self) -> None:
         """Initialize with CORE tickers only."""
         self.state = UniverseState()
+        # Bumped on every FOCUS change so views can memoize derived data
+        self.focus_revision = 0
     
     def get_active_tickers(self) -> set[str]:
         """Return all currently active tickers (CORE + FOCUS).
@@ -100,6 +104,17 @@ class UniverseManager:
         """
         return self.state.focus.copy()
     
+    @property
+    def focus_view(self) -> MappingProxyType[str, FocusEntry]:
+        """Read-only live view of FOCUS tickers (no copy).
+        
+        Reflects later FOCUS changes; use get_focus_tickers() for a snapshot.
+        
+        Returns:
+            Read-only mapping of ticker → FocusEntry
+        """
+        return MappingProxyType(self.state.focus)
+    
     def promote_structural(
         self,
         ticker: str,
@@ -129,6 +144,7 @@ class UniverseManager:
         if ticker in self.state.focus:
             # Reset inactivity counter
             self.state.focus[ticker].days_inactive = 0
+            self.focus_revision += 1
             return False
         
         # Check rank threshold
@@ -142,8 +158,10 @@ class UniverseManager:
             entry_date=entry_date,
             reason="structural",
             details=f"Rank {rank} in {index}",
-            days_inactive=0
+            days_inactive=0,
+            etf=index,
         )
+        self.focus_revision += 1
         return True
     
     def promote_if_stressed(
@@ -198,6 +216,7 @@ class UniverseManager:
         if ticker in self.state.focus:
             # Reset inactivity counter
             self.state.focus[ticker].days_inactive = 0
+            self.focus_revision += 1
             return False
 
         # Promote
@@ -208,6 +227,7 @@ class UniverseManager:
             details=", ".join(reasons),
             days_inactive=0
         )
+        self.focus_revision += 1
         return True
     
     def promote_event(
@@ -234,6 +254,7 @@ class UniverseManager:
         if ticker in self.state.focus:
             # Reset inactivity counter
             self.state.focus[ticker].days_inactive = 0
+            self.focus_revision += 1
             return False
         
         # Promote
@@ -244,6 +265,7 @@ class UniverseManager:
             details=f"{event_type} on {event_date.strftime('%Y-%m-%d')}",
             days_inactive=0
         )
+        self.focus_revision += 1
         return True
     
     def mark_active(self, ticker: str) -> None:
@@ -255,6 +277,7 @@ class UniverseManager:
         ticker = ticker.upper()
         if ticker in self.state.focus:
             self.state.focus[ticker].days_inactive = 0
+            self.focus_revision += 1
     
     def increment_inactive(self, ticker: str) -> None:
         """Increment inactivity counter for ticker.
@@ -265,6 +288,7 @@ class UniverseManager:
         ticker = ticker.upper()
         if ticker in self.state.focus:
             self.state.focus[ticker].days_inactive += 1
+            self.focus_revision += 1
     
     def expire_inactive(self, threshold: int = 3) -> set[str]:
         """Remove FOCUS tickers that have been inactive for threshold days.
@@ -283,6 +307,8 @@ class UniverseManager:
         
         for ticker in to_remove:
             del self.state.focus[ticker]
+        if to_remove:
+            self.focus_revision += 1
         
         return to_remove
     
@@ -344,6 +370,8 @@ class UniverseManager:
 
         for ticker in to_remove:
             del self.state.focus[ticker]
+        if to_remove:
+            self.focus_revision += 1
 
         return to_remove
 
@@ -353,3 +381,4 @@ class UniverseManager:
         Useful for testing or manual reset.
         """
         self.state.focus.clear()
+        self.focus_revision += 1
@@ -5,6 +5,7 @@ from datetime import date, timedelta
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from obsidian.cache import ParquetStore
@@ -53,6 +54,17 @@ class TestParquetStoreBasics:
         assert result is not None
         pd.testing.assert_frame_equal(result, sample_data)
 
+    @pytest.mark.asyncio
+    async def test_write_arrow_table(self, temp_cache: ParquetStore) -> None:
+        """Arrow tables are written directly and read back as DataFrames."""
+        dt = date(2024, 1, 15)
+        table = pa.table({"t": [1705276800000], "c": [151.25]})
+        await temp_cache.write("AAPL", "bars", dt, table)
+
+        result = await temp_cache.read("AAPL", "bars", dt)
+        assert result is not None
+        assert result["c"].tolist() == [151.25]
+
     @pytest.mark.asyncio
     async def test_ticker_uppercased(
         self, temp_cache: ParquetStore, sample_data: pd.DataFrame
@@ -283,6 +295,36 @@ class TestListingAndMetadata:
         assert polygon_dates == [dt]
         assert uw_dates == [dt]
 
+    @pytest.mark.asyncio
+    async def test_count_dates_and_date_range(
+        self, temp_cache: ParquetStore, sample_data: pd.DataFrame
+    ) -> None:
+        """count_dates/date_range agree with list_dates, ignoring other sources."""
+        for dt in [date(2024, 1, 20), date(2024, 1, 15), date(2024, 1, 18)]:
+            await temp_cache.write("AAPL", "dark", dt, sample_data)
+        await temp_cache.write("AAPL", "dark_pool", date(2024, 2, 1), sample_data)
+
+        assert await temp_cache.count_dates("AAPL", "dark") == 3
+        assert await temp_cache.date_range("AAPL", "dark") == (
+            date(2024, 1, 15), date(2024, 1, 20),
+        )
+        assert await temp_cache.count_dates("MSFT", "dark") == 0
+        assert await temp_cache.date_range("MSFT", "dark") == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_sync_variants_match_async(
+        self, temp_cache: ParquetStore, sample_data: pd.DataFrame
+    ) -> None:
+        """Blocking accessors return the same results as the async ones."""
+        for dt in [date(2024, 1, 20), date(2024, 1, 15)]:
+            await temp_cache.write("AAPL", "bars", dt, sample_data)
+
+        assert temp_cache.list_dates_sync("AAPL", "bars") == await temp_cache.list_dates("AAPL", "bars")
+        assert temp_cache.count_dates_sync("AAPL", "bars") == 2
+        assert temp_cache.date_range_sync("AAPL", "bars") == (
+            date(2024, 1, 15), date(2024, 1, 20),
+        )
+
     @pytest.mark.asyncio
     async def test_list_sources_empty(self, temp_cache: ParquetStore) -> None:
         """list_sources returns empty list for non-existent ticker."""
@@ -441,6 +483,23 @@ class TestEdgeCases:
         sources = await temp_cache.list_sources("AAPL")
         assert "polygon" in sources
 
+    @pytest.mark.asyncio
+    async def test_non_canonical_dates_ignored_by_count(
+        self, temp_cache: ParquetStore, sample_data: pd.DataFrame
+    ) -> None:
+        """count_dates/date_range skip the same non-YYYY-MM-DD names as list_dates."""
+        dt = date(2024, 1, 15)
+        await temp_cache.write("AAPL", "polygon", dt, sample_data)
+
+        # Accepted by date.fromisoformat() on 3.11+, but not canonical
+        raw_dir = temp_cache.base_path / "AAPL" / "raw"
+        (raw_dir / "polygon_20240116.parquet").touch()
+        (raw_dir / "polygon_2024-W03-3.parquet").touch()
+
+        assert await temp_cache.list_dates("AAPL", "polygon") == [dt]
+        assert await temp_cache.count_dates("AAPL", "polygon") == 1
+        assert await temp_cache.date_range("AAPL", "polygon") == (dt, dt)
+
 
 class TestCorruptedFiles:
     """Test resilience to corrupted parquet files."""
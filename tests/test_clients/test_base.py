@@ -1,11 +1,21 @@
 """Tests for base async client."""
 
 import asyncio
+import math
+from datetime import date
 
 import httpx
 import pytest
 
-from obsidian.clients.base import APIProviderError, BaseAsyncClient, RateLimiter
+from obsidian.clients.base import (
+    APIProviderError,
+    BaseAsyncClient,
+    RateLimiter,
+    SingleFlight,
+    iso_date,
+    today_iso,
+    upper_ticker,
+)
 
 
 class TestRateLimiter:
@@ -109,6 +119,22 @@ class TestBaseAsyncClient:
             with pytest.raises(APIProviderError, match="Invalid JSON"):
                 await client.get("/invalid")
 
+    @pytest.mark.asyncio
+    async def test_accepts_nan_and_infinity_tokens(self, respx_mock):
+        """Non-standard NaN/Infinity tokens parse as floats, as with json.loads."""
+        respx_mock.get("https://api.example.com/greeks").mock(
+            return_value=httpx.Response(
+                200, content=b'{"gamma": NaN, "vanna": Infinity, "charm": 1.5}',
+            )
+        )
+
+        async with BaseAsyncClient(base_url="https://api.example.com") as client:
+            result = await client.get("/greeks")
+
+        assert math.isnan(result["gamma"])
+        assert result["vanna"] == math.inf
+        assert result["charm"] == 1.5
+
     @pytest.mark.asyncio
     async def test_respects_rate_limit(self, respx_mock):
         """Client should respect rate limiting."""
@@ -235,3 +261,103 @@ class TestRetryBehavior:
         async with BaseAsyncClient(base_url="https://api.example.com") as client:
             result = await client.get("/slow")
             assert result == {"slow_but_ok": True}
+
+
+class TestSingleFlight:
+    """Tests for the async call coalescer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_task(self):
+        """Overlapping calls with the same key run the factory once."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def _fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"market": "open"}
+
+        results = await asyncio.gather(
+            *(flight.do("status", _fetch) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_key_released_after_completion(self):
+        """Sequential calls are not cached; errors propagate to all joiners."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def _fail():
+            nonlocal calls
+            calls += 1
+            raise APIProviderError("boom")
+
+        for _ in range(2):
+            with pytest.raises(APIProviderError):
+                await flight.do("status", _fail)
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_get_coalesced_accepts_list_params(self, respx_mock):
+        """List-valued params coalesce instead of failing to hash."""
+        route = respx_mock.get("https://api.example.com/snapshot").mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+
+        async with BaseAsyncClient(base_url="https://api.example.com") as client:
+            results = await asyncio.gather(*(
+                client.get_coalesced("/snapshot", params={"ticker": ["SPY", "QQQ"]})
+                for _ in range(3)
+            ))
+
+        assert route.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_get_coalesced_not_shared_across_clients(self, respx_mock):
+        """Clients with different credentials each send their own request."""
+        route = respx_mock.get("https://api.example.com/status").mock(
+            return_value=httpx.Response(200, json={"market": "open"})
+        )
+
+        async with BaseAsyncClient(
+            base_url="https://api.example.com", headers={"Authorization": "key_a"},
+        ) as client_a, BaseAsyncClient(
+            base_url="https://api.example.com", headers={"Authorization": "key_b"},
+        ) as client_b:
+            await asyncio.gather(
+                client_a.get_coalesced("/status"),
+                client_b.get_coalesced("/status"),
+            )
+
+        auth = sorted(call.request.headers["Authorization"] for call in route.calls)
+        assert auth == ["key_a", "key_b"]
+
+
+class TestClientHelpers:
+    """Tests for shared ticker/date helpers."""
+
+    def test_upper_ticker_is_interned(self):
+        """Same input returns the identical cached uppercase string."""
+        first = upper_ticker("aapl")
+        second = upper_ticker("aapl")
+
+        assert first == "AAPL"
+        assert first is second
+
+    def test_today_iso_matches_today(self):
+        """today_iso() returns today's date in YYYY-MM-DD form."""
+        assert today_iso() == date.today().isoformat()
+
+    def test_iso_date_is_cached(self):
+        """iso_date() formats YYYY-MM-DD and reuses the cached string."""
+        first = iso_date(date(2024, 1, 15))
+        second = iso_date(date(2024, 1, 15))
+
+        assert first == "2024-01-15"
+        assert first is second
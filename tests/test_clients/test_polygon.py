@@ -1,11 +1,12 @@
 """Tests for Polygon.io API client."""
 
+import asyncio
 from datetime import date
 
 import httpx
 import pytest
 
-from obsidian.clients.polygon import PolygonClient
+from obsidian.clients.polygon import BAR_SCHEMA, PolygonClient
 
 
 class TestPolygonClient:
@@ -48,6 +49,34 @@ class TestPolygonClient:
             assert bar["c"] == 151.25
             assert bar["v"] == 50000000
 
+    @pytest.mark.asyncio
+    async def test_get_daily_bars_arrow(self, respx_mock):
+        """Should land bars in typed columns, nulling missing fields."""
+        mock_response = {
+            "results": [
+                {"t": 1705276800000, "o": 150.0, "h": 152.5, "l": 149.5,
+                 "c": 151.25, "v": 50000000, "vw": 151.0, "n": 100000},
+                {"t": 1705363200000, "o": 151.0, "h": 153.0, "l": 150.0,
+                 "c": 152.0, "v": 42000000},
+            ],
+        }
+        respx_mock.get(
+            "https://api.polygon.io/v2/aggs/ticker/AAPL/range/1/day/2024-01-01/2024-01-31"
+        ).mock(return_value=httpx.Response(200, json=mock_response))
+
+        async with PolygonClient(api_key="test_key_123") as client:
+            table = await client.get_daily_bars_arrow(
+                ticker="AAPL",
+                date_from="2024-01-01",
+                date_to="2024-01-31",
+            )
+
+        assert table.schema == BAR_SCHEMA
+        assert table.num_rows == 2
+        assert table.column("c").to_pylist() == [151.25, 152.0]
+        assert table.column("v").to_pylist() == [50000000.0, 42000000.0]
+        assert table.column("vw").to_pylist() == [151.0, None]
+
     @pytest.mark.asyncio
     async def test_daily_bars_with_date_objects(self, respx_mock):
         """Should accept date objects and convert to ISO format."""
@@ -184,6 +213,21 @@ class TestPolygonClient:
             assert result["market"] == "open"
             assert result["exchanges"]["nyse"] == "open"
 
+    @pytest.mark.asyncio
+    async def test_market_status_coalesced(self, respx_mock):
+        """Concurrent market status calls share one request."""
+        route = respx_mock.get("https://api.polygon.io/v1/marketstatus/now").mock(
+            return_value=httpx.Response(200, json={"market": "open"})
+        )
+
+        async with PolygonClient(api_key="test_key_123") as client:
+            results = await asyncio.gather(
+                *(client.get_market_status() for _ in range(10))
+            )
+
+        assert route.call_count == 1
+        assert all(r["market"] == "open" for r in results)
+
     @pytest.mark.asyncio
     async def test_api_key_in_query_params(self, respx_mock):
         """API key should be sent as query parameter, not header."""
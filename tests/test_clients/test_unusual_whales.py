@@ -1,10 +1,12 @@
 """Tests for Unusual Whales API client."""
 
+import asyncio
 from datetime import date
 
 import httpx
 import pytest
 
+from obsidian.clients.base import APIProviderError
 from obsidian.clients.unusual_whales import UnusualWhalesClient
 
 
@@ -121,6 +123,63 @@ class TestUnusualWhalesClient:
             assert "data" in result
             assert result["data"][0]["iv_rank_1y"] == 0.67
 
+    @pytest.mark.asyncio
+    async def test_get_greek_exposure_many(self, respx_mock):
+        """Should return one response per uppercased, de-duplicated ticker."""
+        aapl = respx_mock.get(
+            "https://api.unusualwhales.com/api/stock/AAPL/greek-exposure"
+        ).mock(return_value=httpx.Response(200, json={"data": [{"date": "2024-01-15"}]}))
+        msft = respx_mock.get(
+            "https://api.unusualwhales.com/api/stock/MSFT/greek-exposure"
+        ).mock(return_value=httpx.Response(200, json={"data": []}))
+
+        async with UnusualWhalesClient(api_key="test_key_123") as client:
+            result = await client.get_greek_exposure_many(["aapl", "MSFT", "AAPL"])
+
+        assert set(result) == {"AAPL", "MSFT"}
+        assert result["AAPL"]["data"][0]["date"] == "2024-01-15"
+        assert aapl.call_count == 1
+        assert msft.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_iv_rank_many_isolates_failures(self, respx_mock):
+        """A failing ticker yields its exception without aborting the batch."""
+        respx_mock.get(
+            "https://api.unusualwhales.com/api/stock/AAPL/iv-rank"
+        ).mock(return_value=httpx.Response(200, json={"data": []}))
+        respx_mock.get(
+            "https://api.unusualwhales.com/api/stock/FAIL/iv-rank"
+        ).mock(return_value=httpx.Response(404, text="not found"))
+
+        async with UnusualWhalesClient(api_key="test_key_123") as client:
+            result = await client.get_iv_rank_many(["AAPL", "FAIL"])
+
+        assert result["AAPL"] == {"data": []}
+        assert isinstance(result["FAIL"], APIProviderError)
+        assert result["FAIL"].status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_many_omits_cancelled_tickers(self, respx_mock):
+        """A cancelled request is left out rather than returned as a response."""
+        async def cancelled(request):
+            raise asyncio.CancelledError()
+
+        respx_mock.get(
+            "https://api.unusualwhales.com/api/stock/AAPL/greek-exposure"
+        ).mock(return_value=httpx.Response(200, json={"data": []}))
+        respx_mock.get(
+            "https://api.unusualwhales.com/api/stock/MSFT/greek-exposure"
+        ).mock(side_effect=cancelled)
+        seen = []
+
+        async with UnusualWhalesClient(api_key="test_key_123") as client:
+            result = await client.get_greek_exposure_many(
+                ["AAPL", "MSFT"], on_result=lambda t, resp: seen.append(t),
+            )
+
+        assert result == {"AAPL": {"data": []}}
+        assert seen == ["AAPL"]
+
     @pytest.mark.asyncio
     async def test_get_option_contracts(self, respx_mock):
         """Should fetch option contracts."""
@@ -1,5 +1,6 @@
 """Tests for dashboard data layer — focus helpers."""
 
+import asyncio
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -105,3 +106,286 @@ class TestGetFocusEntries:
         assert "details" in entry
         assert "days_inactive" in entry
         assert "entry_date" in entry
+        assert entry["etf"] == "SPY"
+
+
+class TestFocusMemo:
+    """Test session memoization of the FOCUS views."""
+
+    @patch("obsidian.dashboard.data.st")
+    def test_reused_until_focus_changes(self, mock_st):
+        """Same list is returned until the universe revision changes."""
+        orch = MagicMock()
+        mgr = UniverseManager()
+        mgr.promote_structural("AAPL", "SPY", 1, date(2024, 1, 15))
+        orch.universe = mgr
+        mock_st.session_state = {"orchestrator": orch}
+
+        from obsidian.dashboard.data import get_focus_entries
+        first = get_focus_entries()
+        assert get_focus_entries() is first
+
+        mgr.promote_event("TSLA", "earnings", date(2024, 1, 25), date(2024, 1, 15))
+        second = get_focus_entries()
+        assert second is not first
+        assert [e["ticker"] for e in second] == ["AAPL", "TSLA"]
+
+    @patch("obsidian.dashboard.data.st")
+    def test_diagnostics_refresh_after_store(self, mock_st):
+        """Storing a new diagnostic invalidates get_focus_diagnostics()."""
+        orch = MagicMock()
+        mgr = UniverseManager()
+        mgr.promote_structural("AAPL", "SPY", 1, date(2024, 1, 15))
+        orch.universe = mgr
+        mock_st.session_state = {"orchestrator": orch}
+
+        from obsidian.dashboard.data import _store_diagnostic, get_focus_diagnostics
+        assert get_focus_diagnostics(date(2024, 1, 15))[0]["regime_label"] is None
+
+        diag = MagicMock(regime_label="DD", regime="DD", score_percentile=80.0, z_scores={})
+        _store_diagnostic("AAPL", date(2024, 1, 15), diag)
+
+        assert get_focus_diagnostics(date(2024, 1, 15))[0]["regime_label"] == "DD"
+
+
+class TestSessionOrchestrator:
+    """Test per-session Orchestrator isolation."""
+
+    @patch("obsidian.dashboard.data.st")
+    def test_focus_does_not_leak_between_sessions(self, mock_st):
+        """Sessions share fetcher/processor but each owns its FOCUS universe."""
+        from obsidian.dashboard import data
+
+        shared = (MagicMock(), MagicMock())
+        with patch.object(data, "_shared_pipeline", return_value=shared):
+            session_a: dict = {}
+            session_b: dict = {}
+
+            mock_st.session_state = session_a
+            orch_a = data._get_orchestrator()
+            orch_a.universe.promote_structural("AAPL", "SPY", 1, date(2024, 1, 15))
+            assert [e["ticker"] for e in data.get_focus_entries()] == ["AAPL"]
+
+            mock_st.session_state = session_b
+            orch_b = data._get_orchestrator()
+            assert data.get_focus_entries() == []
+
+        assert orch_a is not orch_b
+        assert orch_a.universe is not orch_b.universe
+        assert orch_a.fetcher is orch_b.fetcher is shared[0]
+        assert orch_a.processor is orch_b.processor is shared[1]
+
+        mock_st.session_state = session_a
+        assert data._get_orchestrator() is orch_a
+
+
+class TestGetFocusDiagnostics:
+    """Test get_focus_diagnostics()."""
+
+    @patch("obsidian.dashboard.data.st")
+    def test_etf_filter_keeps_non_structural(self, mock_st):
+        """Structural entries from other ETFs are dropped; others kept."""
+        orch = MagicMock()
+        mgr = UniverseManager()
+        mgr.promote_structural("AAPL", "SPY", 1, date(2024, 1, 15))
+        mgr.promote_structural("NVDA", "QQQ", 1, date(2024, 1, 15))
+        mgr.promote_event("TSLA", "earnings", date(2024, 1, 25), date(2024, 1, 15))
+        orch.universe = mgr
+        mock_st.session_state = {"orchestrator": orch}
+
+        from obsidian.dashboard.data import get_focus_diagnostics
+        rows = get_focus_diagnostics(date(2024, 1, 15), etf="SPY")
+
+        assert [r["ticker"] for r in rows] == ["AAPL", "TSLA"]
+
+
+class TestDiagStore:
+    """Test the bounded per-session diagnostics store."""
+
+    @patch("obsidian.dashboard.data.st")
+    def test_evicts_least_recently_used(self, mock_st):
+        """Reads refresh an entry; inserts past the cap drop the oldest."""
+        mock_st.session_state = {}
+
+        from obsidian.dashboard import data
+        with patch.object(data, "_MAX_DIAGS", 2):
+            data._store_diagnostic("SPY", date(2024, 1, 15), "spy")
+            data._store_diagnostic("QQQ", date(2024, 1, 15), "qqq")
+            assert data.get_cached_diagnostic("SPY", date(2024, 1, 15)) == "spy"
+
+            data._store_diagnostic("IWM", date(2024, 1, 15), "iwm")
+
+        assert data.get_cached_diagnostic("QQQ", date(2024, 1, 15)) is None
+        assert data.get_cached_diagnostic("SPY", date(2024, 1, 15)) == "spy"
+        assert data.get_cached_diagnostic("IWM", date(2024, 1, 15)) == "iwm"
+
+    @patch("obsidian.dashboard.data.st")
+    def test_bulk_lookup_matches_single(self, mock_st):
+        """get_cached_diagnostics() returns every ticker in order, None if missing."""
+        mock_st.session_state = {}
+
+        from obsidian.dashboard import data
+        data._store_diagnostic("SPY", date(2024, 1, 15), "spy")
+        data._store_diagnostic("QQQ", date(2024, 1, 15), "qqq")
+        data._store_diagnostic("IWM", date(2024, 1, 12), "old")
+
+        diags = data.get_cached_diagnostics(["IWM", "SPY", "QQQ"], date(2024, 1, 15))
+
+        assert diags == {"IWM": None, "SPY": "spy", "QQQ": "qqq"}
+        assert list(diags) == ["IWM", "SPY", "QQQ"]
+        # Hits are refreshed like single lookups
+        assert list(data._diag_store())[-1] == ("QQQ", date(2024, 1, 15))
+
+
+class TestGetHistoricalDiagnostics:
+    """Test get_historical_diagnostics()."""
+
+    @patch("obsidian.dashboard.data.st")
+    def test_collects_stored_dates_in_range(self, mock_st):
+        """Only stored dates inside the inclusive range are returned, ascending."""
+        mock_st.session_state = {"diags": {
+            ("SPY", date(2024, 1, 16)): "tue",
+            ("SPY", date(2024, 1, 12)): "fri",
+            ("SPY", date(2024, 1, 13)): "sat",
+            ("SPY", date(2024, 1, 20)): "out of range",
+            ("QQQ", date(2024, 1, 12)): "other ticker",
+        }}
+
+        from obsidian.dashboard.data import get_historical_diagnostics
+        hist = get_historical_diagnostics("SPY", date(2024, 1, 12), date(2024, 1, 16))
+
+        assert hist == {
+            date(2024, 1, 12): "fri",
+            date(2024, 1, 13): "sat",
+            date(2024, 1, 16): "tue",
+        }
+        assert list(hist) == sorted(hist)
+
+    @patch("obsidian.dashboard.data.st")
+    def test_memoized_until_revision_changes(self, mock_st):
+        """Reruns reuse the mapping; storing a diagnostic invalidates it."""
+        store = {("SPY", date(2024, 1, 12)): "fri"}
+        mock_st.session_state = {"diags": store}
+
+        from obsidian.dashboard.data import get_historical_diagnostics
+        first = get_historical_diagnostics("SPY", date(2024, 1, 12), date(2024, 1, 16))
+        assert get_historical_diagnostics("SPY", date(2024, 1, 12), date(2024, 1, 16)) is first
+
+        store[("SPY", date(2024, 1, 16))] = "tue"
+        mock_st.session_state["_diag_revision"] = 1
+        hist = get_historical_diagnostics("SPY", date(2024, 1, 12), date(2024, 1, 16))
+        assert hist == {date(2024, 1, 12): "fri", date(2024, 1, 16): "tue"}
+
+    @patch("obsidian.dashboard.data.st")
+    def test_many_groups_by_ticker_in_date_order(self, mock_st):
+        """One scan returns per-ticker histories, skipping absent tickers."""
+        mock_st.session_state = {"diags": {
+            ("SPY", date(2024, 1, 16)): "spy tue",
+            ("QQQ", date(2024, 1, 12)): "qqq fri",
+            ("SPY", date(2024, 1, 12)): "spy fri",
+            ("IWM", date(2024, 1, 20)): "out of range",
+        }}
+
+        from obsidian.dashboard.data import get_historical_diagnostics_many
+        hist = get_historical_diagnostics_many(
+            ["SPY", "QQQ", "IWM"], date(2024, 1, 12), date(2024, 1, 16),
+        )
+
+        assert hist == {
+            "SPY": {date(2024, 1, 12): "spy fri", date(2024, 1, 16): "spy tue"},
+            "QQQ": {date(2024, 1, 12): "qqq fri"},
+        }
+        assert list(hist["SPY"]) == [date(2024, 1, 12), date(2024, 1, 16)]
+
+    @patch("obsidian.dashboard.data.st")
+    def test_z_score_history_matrix(self, mock_st):
+        """z-scores become a read-only features × dates matrix, NaN where missing."""
+        mock_st.session_state = {"diags": {
+            ("SPY", date(2024, 1, 16)): MagicMock(z_scores={"gex": 2.0}),
+            ("SPY", date(2024, 1, 12)): MagicMock(z_scores={"gex": 1.0, "dex": -1.0}),
+        }}
+
+        from obsidian.dashboard.data import get_z_score_history
+        dates, z = get_z_score_history(
+            "SPY", date(2024, 1, 12), date(2024, 1, 16), ("dex", "gex"),
+        )
+
+        assert dates == (date(2024, 1, 12), date(2024, 1, 16))
+        assert z.shape == (2, 2)
+        assert z[0, 0] == -1.0 and z[0, 1] != z[0, 1]  # dex missing on the 16th
+        assert z[1].tolist() == [1.0, 2.0]
+        assert not z.flags.writeable
+
+        _, empty = get_z_score_history("QQQ", date(2024, 1, 12), date(2024, 1, 16), ("gex",))
+        assert empty.shape == (1, 0)
+
+    @patch("obsidian.dashboard.data.st")
+    def test_dates_with_diagnostics_refresh_on_store(self, mock_st):
+        """Stored dates are collected once and refreshed after a new store."""
+        mock_st.session_state = {}
+
+        from obsidian.dashboard import data
+        data._store_diagnostic("SPY", date(2024, 1, 12), "spy")
+        data._store_diagnostic("QQQ", date(2024, 1, 12), "qqq")
+        assert data.get_dates_with_diagnostics() == {date(2024, 1, 12)}
+
+        data._store_diagnostic("SPY", date(2024, 1, 16), "spy tue")
+        assert data.get_dates_with_diagnostics() == {date(2024, 1, 12), date(2024, 1, 16)}
+
+
+class TestGetTopDriver:
+    """Test get_top_driver()."""
+
+    @patch("obsidian.dashboard.data.st")
+    def test_labels_largest_valid_z_score(self, mock_st):
+        """The highest |Z| feature wins; NaN-only or missing diagnostics get "—"."""
+        nan = float("nan")
+        mock_st.session_state = {"diags": {
+            ("SPY", date(2024, 1, 12)): MagicMock(
+                z_scores={"gex": 1.5, "dark_share": -2.5, "iv_rank": nan},
+            ),
+            ("QQQ", date(2024, 1, 12)): MagicMock(z_scores={"gex": nan}),
+        }}
+
+        from obsidian.dashboard.data import get_top_driver
+
+        assert get_top_driver("SPY", date(2024, 1, 12)) == "Dark Pool Share"
+        assert get_top_driver("QQQ", date(2024, 1, 12)) == "—"
+        assert get_top_driver("IWM", date(2024, 1, 12)) == "—"
+
+
+class TestRunAsync:
+    """Test the sync → async bridge."""
+
+    def test_calls_share_one_loop(self):
+        """Every call runs on the same persistent background loop."""
+        from obsidian.dashboard.data import _run_async
+
+        async def _current_loop():
+            return asyncio.get_running_loop()
+
+        first = _run_async(_current_loop())
+        second = _run_async(_current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+
+class TestRegimeBadgeHtml:
+    """Test regime_badge_html()."""
+
+    def test_known_code_uses_regime_color(self):
+        """Short code is extracted from the full label and coloured."""
+        from obsidian.dashboard.data import regime_badge_html
+
+        html = regime_badge_html("DD — Dealer Defense")
+
+        assert "background-color:#9C27B0" in html
+        assert html.endswith(">DD</span>")
+
+    def test_unknown_and_missing_labels(self):
+        """Unknown codes fall back to grey; None renders a dash."""
+        from obsidian.dashboard.data import regime_badge_html
+
+        assert "background-color:#666" in regime_badge_html("XYZ")
+        assert regime_badge_html(None) == '<span style="color:#999">—</span>'
@@ -210,6 +210,42 @@ class TestZScoreComputation:
         
         assert all(pd.isna(z_scores))
 
+    def test_z_scores_match_statistics(self) -> None:
+        """Fused z-scores agree with the per-point BaselineStats."""
+        baseline = Baseline(window=10, min_periods=4)
+        rng = np.random.default_rng(7)
+        data = pd.Series(rng.normal(size=40))
+        data.iloc[[3, 11, 12, 30]] = np.nan
+
+        z_scores = baseline.compute_z_scores(data)
+        stats = baseline.compute_statistics(data)
+        expected = pd.Series(
+            [(x - s.mean) / s.std for x, s in zip(data, stats)], index=data.index,
+        )
+
+        pd.testing.assert_series_equal(z_scores, expected, check_exact=False)
+
+    def test_frame_z_scores_match_per_column(self) -> None:
+        """compute_z_scores_frame equals compute_z_scores on each column."""
+        baseline = Baseline(window=10, min_periods=4)
+        rng = np.random.default_rng(11)
+        frame = pd.DataFrame(
+            rng.normal(size=(40, 3)), columns=["gex", "dex", "iv_rank"],
+        )
+        frame.iloc[[2, 9, 25], 1] = np.nan
+        frame["iv_rank"] = 5.0  # constant column → all NaN
+
+        z_frame = baseline.compute_z_scores_frame(frame)
+
+        assert list(z_frame.columns) == list(frame.columns)
+        for name in frame.columns:
+            pd.testing.assert_series_equal(
+                z_frame[name],
+                baseline.compute_z_scores(frame[name]),
+                check_names=False,
+            )
+        assert z_frame["iv_rank"].isna().all()
+
 
 class TestBaselineStates:
     """Test baseline state determination."""
@@ -302,6 +338,19 @@ class TestDriftDetection:
         assert baseline.detect_drift(1.0, 0.0) is True
         assert baseline.detect_drift(-1.0, 0.0) is True
 
+    def test_series_matches_scalar(self) -> None:
+        """detect_drift_series agrees with detect_drift on each step."""
+        baseline = Baseline(drift_threshold=0.10)
+        means = np.array([1.0, 1.05, 1.2, np.nan, 1.0, 0.0, 0.0, 1.0, 0.8])
+
+        drift = baseline.detect_drift_series(means)
+
+        expected = [
+            baseline.detect_drift(cur, prev) for prev, cur in zip(means[:-1], means[1:])
+        ]
+        assert drift.tolist() == expected
+        assert baseline.detect_drift_series(np.array([1.0])).size == 0
+
 
 class TestExcludedFeatures:
     """Test excluded feature tracking."""
@@ -12,7 +12,12 @@ Test Coverage:
 import numpy as np
 import pytest
 
-from obsidian.engine.classifier import Classifier, RegimeType, RegimeResult
+from obsidian.engine.classifier import (
+    REGIMES_BY_CODE,
+    Classifier,
+    RegimeResult,
+    RegimeType,
+)
 
 
 class TestClassifierInitialization:
@@ -468,3 +473,51 @@ class TestRealWorldScenarios:
             baseline_sufficient=True,
         )
         assert result.regime == RegimeType.DARK_DOMINANT
+
+
+class TestClassifyBatch:
+    """Test vectorized classify_batch() against scalar classify()."""
+
+    def test_matches_scalar_classify(self):
+        """Every row gets the regime classify() assigns, NaNs included."""
+        classifier = Classifier()
+        rng = np.random.default_rng(0)
+        n = 2000
+        cols = {
+            "z_gex": rng.normal(scale=2, size=n),
+            "z_dex": rng.normal(scale=1.5, size=n),
+            "z_block": rng.normal(scale=1.5, size=n),
+            "dark_share": rng.uniform(0.3, 0.9, size=n),
+            "efficiency": rng.uniform(0, 0.01, size=n),
+            "impact": rng.uniform(0, 0.01, size=n),
+            "efficiency_median": np.full(n, 0.005),
+            "impact_median": np.full(n, 0.005),
+            "daily_return": rng.normal(scale=0.01, size=n),
+        }
+        for values in cols.values():
+            values[rng.random(n) < 0.1] = np.nan
+        sufficient = rng.random(n) > 0.05
+
+        codes = classifier.classify_batch(**cols, baseline_sufficient=sufficient)
+
+        assert codes.dtype == np.int8
+        for i in range(n):
+            expected = classifier.classify(
+                z_scores={
+                    "gex": cols["z_gex"][i],
+                    "dex": cols["z_dex"][i],
+                    "block_intensity": cols["z_block"][i],
+                },
+                raw_features={
+                    "dark_share": cols["dark_share"][i],
+                    "efficiency": cols["efficiency"][i],
+                    "impact": cols["impact"][i],
+                },
+                baseline_medians={
+                    "efficiency": cols["efficiency_median"][i],
+                    "impact": cols["impact_median"][i],
+                },
+                daily_return=cols["daily_return"][i],
+                baseline_sufficient=bool(sufficient[i]),
+            ).regime
+            assert REGIMES_BY_CODE[codes[i]] == expected
@@ -338,6 +338,64 @@ class TestDiagnosticOutputFormatFull:
         assert "Baseline: EMPTY" in full
 
 
+class TestDiagnosticOutputSections:
+    """Test DiagnosticOutput.sections()."""
+
+    def test_sections_mirror_formatted_text(self):
+        """Sections carry the same content as format_full() in order."""
+        output = DiagnosticOutput(
+            regime_result=RegimeResult(
+                regime=RegimeType.GAMMA_NEGATIVE,
+                triggering_conditions={"Z_GEX": (-2.31, -1.5, True)},
+                interpretation="Test interpretation",
+                baseline_sufficient=True,
+            ),
+            scoring_result=ScoringResult(
+                raw_score=1.15,
+                percentile_score=78.0,
+                interpretation=InterpretationBand.UNUSUAL,
+                feature_contributions={"gex": 0.5775, "dark_share": 0.46},
+                excluded_features=[],
+            ),
+            excluded_features=[ExcludedFeature("charm", "n = 9 < 21")],
+            baseline_state=BaselineState.PARTIAL,
+            ticker="SPY",
+            date="2024-01-15",
+        )
+
+        regime, score, excluded, baseline = output.sections()
+
+        assert regime.kind == "regime"
+        assert regime.header.startswith("Regime: Γ⁻")
+        assert regime.lines[0].startswith("Z_GEX = -2.3100")
+        assert score.header == "Unusualness: 78 (Unusual)"
+        assert score.drivers == (("GEX", "0.58"), ("DARK_SHARE", "0.46"))
+        assert excluded.items == ("charm (n = 9 < 21)",)
+        assert baseline.value == "PARTIAL"
+
+    def test_sections_without_score(self):
+        """Missing score yields N/A header and no drivers."""
+        output = DiagnosticOutput(
+            regime_result=RegimeResult(
+                regime=RegimeType.UNDETERMINED,
+                triggering_conditions={},
+                interpretation="Insufficient data",
+                baseline_sufficient=False,
+            ),
+            scoring_result=None,
+            excluded_features=[],
+            baseline_state=BaselineState.EMPTY,
+            ticker="SPY",
+            date="2024-01-15",
+        )
+
+        _, score, excluded, _ = output.sections()
+
+        assert score.header == "Unusualness: N/A (insufficient data)"
+        assert score.drivers == ()
+        assert excluded.items == ()
+
+
 class TestDiagnosticOutputToDict:
     """Test DiagnosticOutput.to_dict()."""
 
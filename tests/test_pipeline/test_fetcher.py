@@ -466,3 +466,139 @@ class TestUWConcurrency:
         # With concurrency=1, peak should be exactly 1
         assert peak_concurrent == 1
         assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_providers_fetched_concurrently(self, tmp_path, respx_mock):
+        """UW, Polygon, and FMP requests for one ticker overlap in time."""
+        target = date(2024, 1, 15)
+        peak_concurrent = 0
+        current_concurrent = 0
+        lock = asyncio.Lock()
+
+        def make_side_effect(payload):
+            async def side_effect(request):
+                nonlocal peak_concurrent, current_concurrent
+                async with lock:
+                    current_concurrent += 1
+                    peak_concurrent = max(peak_concurrent, current_concurrent)
+                await asyncio.sleep(0.02)
+                async with lock:
+                    current_concurrent -= 1
+                return httpx.Response(200, json=payload)
+            return side_effect
+
+        respx_mock.get(url__startswith=f"{UW_BASE}/").mock(
+            side_effect=make_side_effect({"data": []})
+        )
+        respx_mock.get(url__startswith=f"{POLYGON_BASE}/").mock(
+            side_effect=make_side_effect({"results": [], "resultsCount": 0})
+        )
+        respx_mock.get(url__startswith=f"{FMP_BASE}/").mock(
+            side_effect=make_side_effect([])
+        )
+
+        with patch("obsidian.pipeline.fetcher.settings") as mock_settings:
+            mock_settings.uw_api_key = "test_uw"
+            mock_settings.uw_rate_limit = 100
+            mock_settings.polygon_api_key = "test_polygon"
+            mock_settings.polygon_rate_limit = 100
+            mock_settings.fmp_api_key = "test_fmp"
+            mock_settings.fmp_rate_limit = 100
+            mock_settings.uw_concurrency = 1
+            mock_settings.cache_dir = str(tmp_path)
+
+            fetcher = Fetcher(cache_dir=str(tmp_path))
+            results = await fetcher.fetch_ticker("SPY", target)
+
+        assert peak_concurrent >= 2
+        assert set(results) == {"dark_pool", "greeks", "iv_rank", "bars", "quote"}
+
+    @pytest.mark.asyncio
+    async def test_bars_not_blocked_by_uw_prefetch(self, tmp_path, respx_mock):
+        """Polygon/FMP fetches start while the UW prefetch is still running."""
+        target = date(2024, 1, 15)
+        bars_started = asyncio.Event()
+
+        async def uw_series_side_effect(request):
+            # Only completes once a Polygon request has been issued
+            await asyncio.wait_for(bars_started.wait(), timeout=5)
+            return httpx.Response(200, json={"data": []})
+
+        async def bars_side_effect(request):
+            bars_started.set()
+            return httpx.Response(200, json={"results": [], "resultsCount": 0})
+
+        respx_mock.get(f"{UW_BASE}/darkpool/recent").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+        respx_mock.get(url__startswith=f"{UW_BASE}/stock/").mock(
+            side_effect=uw_series_side_effect
+        )
+        respx_mock.get(url__startswith=f"{POLYGON_BASE}/").mock(
+            side_effect=bars_side_effect
+        )
+        respx_mock.get(url__startswith=f"{FMP_BASE}/").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        with patch("obsidian.pipeline.fetcher.settings") as mock_settings:
+            mock_settings.uw_api_key = "test_uw"
+            mock_settings.uw_rate_limit = 100
+            mock_settings.polygon_api_key = "test_polygon"
+            mock_settings.polygon_rate_limit = 100
+            mock_settings.fmp_api_key = "test_fmp"
+            mock_settings.fmp_rate_limit = 100
+            mock_settings.uw_concurrency = 10
+            mock_settings.cache_dir = str(tmp_path)
+
+            fetcher = Fetcher(cache_dir=str(tmp_path))
+            results = await fetcher.fetch_all({"SPY", "QQQ"}, target)
+
+        assert bars_started.is_set()
+        assert set(results) == {"SPY", "QQQ"}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_prefetch_falls_back(self, tmp_path, respx_mock):
+        """A cancelled prefetch request is re-requested, not treated as data."""
+        target = date(2024, 1, 15)
+        greeks_calls = 0
+
+        async def greeks_side_effect(request):
+            nonlocal greeks_calls
+            greeks_calls += 1
+            if greeks_calls == 1:
+                raise asyncio.CancelledError()
+            return httpx.Response(200, json=MOCK_GREEKS)
+
+        respx_mock.get(f"{UW_BASE}/darkpool/recent").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+        respx_mock.get(url__startswith=f"{UW_BASE}/stock/SPY/greek-exposure").mock(
+            side_effect=greeks_side_effect
+        )
+        respx_mock.get(url__startswith=f"{UW_BASE}/stock/SPY/iv-rank").mock(
+            return_value=httpx.Response(200, json=MOCK_IV_RANK)
+        )
+        respx_mock.get(url__startswith=f"{POLYGON_BASE}/").mock(
+            return_value=httpx.Response(200, json={"results": [], "resultsCount": 0})
+        )
+        respx_mock.get(url__startswith=f"{FMP_BASE}/").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        with patch("obsidian.pipeline.fetcher.settings") as mock_settings:
+            mock_settings.uw_api_key = "test_uw"
+            mock_settings.uw_rate_limit = 100
+            mock_settings.polygon_api_key = "test_polygon"
+            mock_settings.polygon_rate_limit = 100
+            mock_settings.fmp_api_key = "test_fmp"
+            mock_settings.fmp_rate_limit = 100
+            mock_settings.uw_concurrency = 10
+            mock_settings.cache_dir = str(tmp_path)
+
+            fetcher = Fetcher(cache_dir=str(tmp_path))
+            results = await fetcher.fetch_all({"SPY"}, target)
+
+        assert greeks_calls == 2
+        assert results["SPY"]["greeks"] is True
+        assert results["SPY"]["iv_rank"] is True
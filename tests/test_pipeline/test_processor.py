@@ -335,12 +335,12 @@ class TestProcessTicker:
 
     @pytest.mark.asyncio
     async def test_z_scores_are_numeric(self, loaded_processor) -> None:
-        """Z-scores should be float values (possibly NaN)."""
+        """Z-scores should be plain Python floats (possibly NaN)."""
         processor, target = loaded_processor
         result = await processor.process_ticker("SPY", target)
 
         for name, z in result.z_scores.items():
-            assert isinstance(z, (float, np.floating)), f"{name} z-score is not float: {type(z)}"
+            assert type(z) is float, f"{name} z-score is not float: {type(z)}"
 
     @pytest.mark.asyncio
     async def test_score_is_bounded(self, loaded_processor) -> None:
@@ -579,3 +579,22 @@ class TestSafeLast:
         """Returns the only value from a single-element Series."""
         series = pd.Series([42.0])
         assert Processor._safe_last(series) == 42.0
+
+
+class TestTrailingMedian:
+    """Test Processor._trailing_median static method."""
+
+    def test_matches_rolling_median(self) -> None:
+        """Equals the last point of a full rolling median."""
+        rng = np.random.default_rng(5)
+        series = pd.Series(rng.normal(size=100))
+        expected = series.rolling(63).median().iloc[-1]
+        assert Processor._trailing_median(series) == pytest.approx(expected)
+
+    def test_short_or_gappy_window_is_nan(self) -> None:
+        """NaN when fewer than 63 points or a NaN inside the window."""
+        assert np.isnan(Processor._trailing_median(pd.Series(np.ones(62))))
+        assert np.isnan(Processor._trailing_median(None))
+        series = pd.Series(np.ones(80))
+        series.iloc[-10] = np.nan
+        assert np.isnan(Processor._trailing_median(series))
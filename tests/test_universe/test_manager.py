@@ -342,6 +342,33 @@ class TestResetFocus:
         assert mgr.get_active_tickers() == set(CORE_TICKERS)
 
 
+class TestFocusRevision:
+    """Tests for the focus_revision change counter."""
+
+    def test_bumped_on_changes_only(self) -> None:
+        """Mutations bump the revision; rejected promotions do not."""
+        mgr = UniverseManager()
+        assert mgr.focus_revision == 0
+
+        mgr.promote_structural("AAPL", "SPY", rank=20, entry_date=date(2024, 1, 15))
+        assert mgr.focus_revision == 0
+
+        mgr.promote_structural("AAPL", "SPY", rank=5, entry_date=date(2024, 1, 15))
+        mgr.increment_inactive("AAPL")
+        mgr.reset_focus()
+        assert mgr.focus_revision == 3
+
+    def test_focus_view_is_live_and_read_only(self) -> None:
+        """focus_view reflects later changes and rejects writes."""
+        mgr = UniverseManager()
+        view = mgr.focus_view
+        mgr.promote_structural("AAPL", "SPY", rank=1, entry_date=date(2024, 1, 15))
+
+        assert "AAPL" in view
+        with pytest.raises(TypeError):
+            view["NVDA"] = view["AAPL"]  # type: ignore[index]
+
+
 class TestCaseSensitivity:
     """Test that ticker inputs are uppercased."""
 